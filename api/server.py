@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 Script to run the FastAPI server for the Smart Document Analyzer.
+
+Set ``DEV=1`` to run a single auto-reloading worker for development.
+Otherwise the server starts one worker per CPU (override with ``WEB_CONCURRENCY``).
+On POSIX systems the C-based uvloop event loop and httptools HTTP parser are used.
 """
 
 import uvicorn
@@ -10,11 +14,39 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-if __name__ == "__main__":
+# uvloop is POSIX-only; fall back to uvicorn's defaults elsewhere
+SERVER_IMPLEMENTATION = (
+    {"loop": "uvloop", "http": "httptools"} if sys.platform != "win32" else {}
+)
+
+
+def run_dev():
+    """Run a single worker with auto-reload for development."""
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
-    ) 
\ No newline at end of file
+        log_level="info",
+        **SERVER_IMPLEMENTATION
+    )
+
+
+def run_prod():
+    """Run multiple workers so requests are served on every core."""
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="warning",
+        access_log=False,
+        **SERVER_IMPLEMENTATION
+    )
+
+
+if __name__ == "__main__":
+    if os.getenv("DEV"):
+        run_dev()
+    else:
+        run_prod()
@@ -2,35 +2,190 @@
 FastAPI application for document analysis.
 """
 
+import asyncio
+import hashlib
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import date, datetime, timedelta
-import uuid
+import secrets
+import time
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Path as FastAPIPath
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Response, Path as FastAPIPath
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 import logging
+import orjson
 
 from model.analyzer import DocumentAnalyzer
 from model.utils import DocumentStore
 from model.types import DocumentType, Action
+from model.config.settings import get_settings
+from model.extractor.pdf_extractor import shutdown_page_pools
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Size of the chunks an uploaded file is copied to disk in
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response serialized with orjson instead of the stdlib json encoder.
+    
+    Endpoints return it directly rather than a plain dict so FastAPI skips its
+    pure-Python jsonable_encoder pass; orjson handles dates and datetimes natively.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Initialize the document analyzer and document store
+analyzer = DocumentAnalyzer()
+document_store = DocumentStore()
+
+# Dedicated pool for document analyses, so long-running uploads cannot starve the
+# shared threadpool that serves the sync endpoints
+analysis_executor = ThreadPoolExecutor(
+    max_workers=get_settings().get("api.analysis_workers") or os.cpu_count(),
+    thread_name_prefix="analysis"
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Shut the analysis and page extraction pools down cleanly when the server stops."""
+    yield
+    analysis_executor.shutdown(wait=True)
+    shutdown_page_pools()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Smart Document Analyzer API",
     description="API for analyzing and extracting metadata from documents",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan
 )
 
-# Initialize the document analyzer and document store
-analyzer = DocumentAnalyzer()
-document_store = DocumentStore()
+# Supported document types are fixed for the lifetime of the process
+SUPPORTED_DOCUMENT_TYPES = analyzer.get_supported_document_types()
+
+# Cache-Control max-age (seconds) of the read-only endpoints
+SUPPORTED_TYPES_MAX_AGE = 3600
+ANALYSIS_MAX_AGE = 5
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the parts identifying a response version.
+    
+    Args:
+        *parts: Values that change whenever the response content changes
+        
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode("utf-8"), digest_size=8)
+    return f'"{digest.hexdigest()}"'
+
+
+def cached_response(request: Request, etag: str, max_age: int, content: Any = None,
+                    body: Optional[bytes] = None) -> Response:
+    """
+    Build a cacheable JSON response, or a 304 when the client already has this version.
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        etag: ETag of the current response version
+        max_age: Cache-Control max-age in seconds
+        content: Response content, only serialized when it has to be sent
+        body: Pre-serialized JSON body used instead of content
+        
+    Returns:
+        304 Not Modified or a JSON response carrying ETag and Cache-Control headers
+    """
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match == "*" or etag in if_none_match):
+        return Response(status_code=304, headers=headers)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
+    return OrjsonResponse(content=content, headers=headers)
+
+
+_SUPPORTED_TYPES_BODY = orjson.dumps({
+    "supported_document_types": SUPPORTED_DOCUMENT_TYPES,
+    "count": len(SUPPORTED_DOCUMENT_TYPES)
+})
+_SUPPORTED_TYPES_ETAG = make_etag(*SUPPORTED_DOCUMENT_TYPES)
+
+# Seconds a storage statistics snapshot is served before the store is scanned again
+STORAGE_STATS_TTL = 1.0
+_storage_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def get_cached_storage_stats() -> Dict[str, Any]:
+    """
+    Get document store statistics, rescanning the store at most once per TTL.
+    
+    Returns:
+        Storage statistics dictionary
+    """
+    global _storage_stats_cache
+    now = time.monotonic()
+    if _storage_stats_cache is None or _storage_stats_cache[0] <= now:
+        _storage_stats_cache = (now + STORAGE_STATS_TTL, document_store.get_storage_stats())
+    return _storage_stats_cache[1]
+
+
+def invalidate_storage_stats() -> None:
+    """Drop the cached storage statistics after the store changed."""
+    global _storage_stats_cache
+    _storage_stats_cache = None
+
+
+# Map stored classification types to DocumentType enum values
+# The analyzer stores types in lowercase, but our enum uses proper case
+_TYPE_MAPPING: Dict[str, str] = {
+    doc_type.value.lower(): doc_type.value for doc_type in DocumentType
+}
+
+# (title, description, priority, days until deadline) of the mock actions per document type
+_ACTION_TEMPLATES: Dict[str, Tuple[Tuple[str, str, str, int], ...]] = {
+    DocumentType.CONTRACT.value: (
+        ("Review Contract Terms", "Review all terms and conditions in the contract for compliance", "high", 7),
+        ("Legal Approval", "Obtain legal department approval for contract terms", "high", 14),
+        ("Stakeholder Review", "Share contract with relevant stakeholders for review", "medium", 10),
+        ("Contract Signing", "Schedule and complete contract signing process", "high", 21),
+    ),
+    DocumentType.INVOICE.value: (
+        ("Verify Invoice Details", "Cross-check invoice amounts, dates, and line items", "high", 3),
+        ("Approve for Payment", "Obtain approval from authorized personnel for payment", "high", 5),
+        ("Process Payment", "Initiate payment processing through accounting system", "medium", 7),
+        ("File for Records", "Archive invoice in document management system", "low", 10),
+    ),
+    DocumentType.EARNINGS_REPORT.value: (
+        ("Financial Review", "Review financial metrics and performance indicators", "high", 5),
+        ("Stakeholder Communication", "Prepare and distribute summary to key stakeholders", "high", 7),
+        ("Board Presentation", "Prepare presentation materials for board meeting", "medium", 14),
+        ("Regulatory Filing", "Ensure compliance with regulatory reporting requirements", "high", 10),
+        ("Market Analysis", "Compare performance against industry benchmarks", "medium", 12),
+    ),
+}
+
+# Actions for unknown document types
+_DEFAULT_ACTION_TEMPLATES: Tuple[Tuple[str, str, str, int], ...] = (
+    ("Document Review", "Review document content and determine appropriate actions", "medium", 7),
+    ("Classification Review", "Verify document classification and update if necessary", "low", 5),
+)
 
 
 def generate_mock_actions(document_type: str, document_id: str) -> List[Action]:
@@ -45,142 +200,18 @@ def generate_mock_actions(document_type: str, document_id: str) -> List[Action]:
         List of mock actions
     """
     base_date = date.today()
-    
-    if document_type == DocumentType.CONTRACT.value:
-        return [
-            Action(
-                id=str(uuid.uuid4()),
-                title="Review Contract Terms",
-                description="Review all terms and conditions in the contract for compliance",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=7)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Legal Approval",
-                description="Obtain legal department approval for contract terms",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=14)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Stakeholder Review",
-                description="Share contract with relevant stakeholders for review",
-                status="pending",
-                priority="medium",
-                deadline=base_date + timedelta(days=10)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Contract Signing",
-                description="Schedule and complete contract signing process",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=21)
-            )
-        ]
-    
-    elif document_type == DocumentType.INVOICE.value:
-        return [
-            Action(
-                id=str(uuid.uuid4()),
-                title="Verify Invoice Details",
-                description="Cross-check invoice amounts, dates, and line items",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=3)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Approve for Payment",
-                description="Obtain approval from authorized personnel for payment",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=5)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Process Payment",
-                description="Initiate payment processing through accounting system",
-                status="pending",
-                priority="medium",
-                deadline=base_date + timedelta(days=7)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="File for Records",
-                description="Archive invoice in document management system",
-                status="pending",
-                priority="low",
-                deadline=base_date + timedelta(days=10)
-            )
-        ]
-    
-    elif document_type == DocumentType.EARNINGS_REPORT.value:
-        return [
-            Action(
-                id=str(uuid.uuid4()),
-                title="Financial Review",
-                description="Review financial metrics and performance indicators",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=5)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Stakeholder Communication",
-                description="Prepare and distribute summary to key stakeholders",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=7)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Board Presentation",
-                description="Prepare presentation materials for board meeting",
-                status="pending",
-                priority="medium",
-                deadline=base_date + timedelta(days=14)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Regulatory Filing",
-                description="Ensure compliance with regulatory reporting requirements",
-                status="pending",
-                priority="high",
-                deadline=base_date + timedelta(days=10)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Market Analysis",
-                description="Compare performance against industry benchmarks",
-                status="pending",
-                priority="medium",
-                deadline=base_date + timedelta(days=12)
-            )
-        ]
-    
-    else:  # Unknown document type
-        return [
-            Action(
-                id=str(uuid.uuid4()),
-                title="Document Review",
-                description="Review document content and determine appropriate actions",
-                status="pending",
-                priority="medium",
-                deadline=base_date + timedelta(days=7)
-            ),
-            Action(
-                id=str(uuid.uuid4()),
-                title="Classification Review",
-                description="Verify document classification and update if necessary",
-                status="pending",
-                priority="low",
-                deadline=base_date + timedelta(days=5)
-            )
-        ]
+    templates = _ACTION_TEMPLATES.get(document_type, _DEFAULT_ACTION_TEMPLATES)
+    return [
+        Action(
+            id=secrets.token_hex(16),
+            title=title,
+            description=description,
+            status="pending",
+            priority=priority,
+            deadline=base_date + timedelta(days=days)
+        )
+        for title, description, priority, days in templates
+    ]
 
 
 @app.get("/")
@@ -215,8 +246,9 @@ async def analyze_document(file: UploadFile = File(...)) -> Dict[str, Any]:
     Raises:
         HTTPException: If file is not a PDF or analysis fails
     """
-    # Validate file type
-    if not file.filename.lower().endswith('.pdf'):
+    # Validate file type, lowercasing only the extension rather than the whole name
+    filename = file.filename or ""
+    if filename[-4:].lower() != '.pdf':
         raise HTTPException(
             status_code=400,
             detail="Only PDF files are supported. Please upload a PDF file."
@@ -231,26 +263,29 @@ async def analyze_document(file: UploadFile = File(...)) -> Dict[str, Any]:
     
     try:
         # Create a temporary file to store the uploaded PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            # Write the uploaded file content to the temporary file
-            content = await file.read()
-            temp_file.write(content)
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', buffering=UPLOAD_CHUNK_SIZE) as temp_file:
             temp_file_path = temp_file.name
+            # Stream the upload in chunks so the whole file is never held in memory
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                temp_file.write(chunk)
         
         try:
             # Analyze the document
             logger.info(f"Analyzing document: {file.filename}")
-            result = analyzer.analyze(temp_file_path)
+            # Run the blocking analysis in the analysis pool to keep the event loop free
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(analysis_executor, analyzer.analyze, temp_file_path)
             
             # Add the original filename to the result
             result["original_filename"] = file.filename
             
             # Store the analysis result
-            document_id = document_store.store_analysis(result)
+            document_id = await run_in_threadpool(document_store.store_analysis, result)
+            invalidate_storage_stats()
             result["document_id"] = document_id
             
             logger.info(f"Analysis completed and stored successfully for: {file.filename} (ID: {document_id})")
-            return JSONResponse(content=result, status_code=200)
+            return OrjsonResponse(content=result, status_code=200)
             
         finally:
             # Clean up the temporary file
@@ -267,12 +302,41 @@ async def analyze_document(file: UploadFile = File(...)) -> Dict[str, Any]:
         )
 
 
+@app.get("/documents/supported-types")
+async def get_supported_document_types(request: Request):
+    """
+    Get list of supported document types.
+    
+    The body and ETag are built once at startup. The route is declared before
+    ``/documents/{document_id}`` so the static path is not captured as a
+    document ID.
+    
+    Args:
+        request: Incoming request
+    
+    Returns:
+        JSON response with supported document types
+    """
+    try:
+        return cached_response(request, _SUPPORTED_TYPES_ETAG, SUPPORTED_TYPES_MAX_AGE, body=_SUPPORTED_TYPES_BODY)
+    except Exception as e:
+        logger.error(f"Error getting supported document types: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving supported document types: {str(e)}"
+        )
+
+
 @app.get("/documents/{document_id}")
-async def get_analysis(document_id: str = FastAPIPath(..., description="The document ID to retrieve")):
+def get_analysis(request: Request, document_id: str = FastAPIPath(..., description="The document ID to retrieve")):
     """
     Retrieve a stored document analysis result.
     
+    The ETag is derived from the document ID and its storage timestamp, so a
+    revalidation hit is answered with a 304 without serializing the result.
+    
     Args:
+        request: Incoming request
         document_id: The document ID to retrieve
         
     Returns:
@@ -290,7 +354,8 @@ async def get_analysis(document_id: str = FastAPIPath(..., description="The docu
                 detail=f"Document analysis not found for ID: {document_id}"
             )
         
-        return JSONResponse(content=result, status_code=200)
+        etag = make_etag(document_id, result.get("stored_at"))
+        return cached_response(request, etag, ANALYSIS_MAX_AGE, content=result)
         
     except HTTPException:
         raise
@@ -303,7 +368,7 @@ async def get_analysis(document_id: str = FastAPIPath(..., description="The docu
 
 
 @app.get("/documents")
-async def list_documents() -> Dict[str, Any]:
+def list_documents() -> Dict[str, Any]:
     """
     List all stored document analyses with basic metadata.
     
@@ -312,13 +377,13 @@ async def list_documents() -> Dict[str, Any]:
     """
     try:
         documents = document_store.list_documents()
-        stats = document_store.get_storage_stats()
+        stats = get_cached_storage_stats()
         
-        return {
+        return OrjsonResponse(content={
             "documents": documents,
             "total_count": len(documents),
             "storage_stats": stats
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error listing documents: {str(e)}")
@@ -329,7 +394,7 @@ async def list_documents() -> Dict[str, Any]:
 
 
 @app.delete("/documents/{document_id}")
-async def delete_analysis(document_id: str = FastAPIPath(..., description="The document ID to delete")):
+def delete_analysis(document_id: str = FastAPIPath(..., description="The document ID to delete")):
     """
     Delete a stored document analysis result.
     
@@ -351,10 +416,12 @@ async def delete_analysis(document_id: str = FastAPIPath(..., description="The d
                 detail=f"Document analysis not found for ID: {document_id}"
             )
         
-        return {
+        invalidate_storage_stats()
+        
+        return OrjsonResponse(content={
             "message": f"Document analysis deleted successfully",
             "document_id": document_id
-        }
+        })
         
     except HTTPException:
         raise
@@ -367,7 +434,7 @@ async def delete_analysis(document_id: str = FastAPIPath(..., description="The d
 
 
 @app.get("/documents/storage/stats")
-async def get_storage_stats() -> Dict[str, Any]:
+def get_storage_stats() -> Dict[str, Any]:
     """
     Get storage statistics for the document store.
     
@@ -375,8 +442,7 @@ async def get_storage_stats() -> Dict[str, Any]:
         JSON response with storage statistics
     """
     try:
-        stats = document_store.get_storage_stats()
-        return stats
+        return OrjsonResponse(content=get_cached_storage_stats())
         
     except Exception as e:
         logger.error(f"Error getting storage stats: {str(e)}")
@@ -386,30 +452,8 @@ async def get_storage_stats() -> Dict[str, Any]:
         )
 
 
-@app.get("/documents/supported-types")
-async def get_supported_document_types():
-    """
-    Get list of supported document types.
-    
-    Returns:
-        JSON response with supported document types
-    """
-    try:
-        supported_types = analyzer.get_supported_document_types()
-        return {
-            "supported_document_types": supported_types,
-            "count": len(supported_types)
-        }
-    except Exception as e:
-        logger.error(f"Error getting supported document types: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving supported document types: {str(e)}"
-        )
-
-
 @app.get("/documents/{document_id}/actions")
-async def get_document_actions(document_id: str = FastAPIPath(..., description="The document ID to get actions for")):
+def get_document_actions(document_id: str = FastAPIPath(..., description="The document ID to get actions for")):
     """
     Get actions for a specific document.
     
@@ -435,31 +479,34 @@ async def get_document_actions(document_id: str = FastAPIPath(..., description="
         # Extract document type from the analysis result
         # The document type is nested under classification.type
         classification = result.get("classification", {})
-        document_type = classification.get("type", DocumentType.UNKNOWN.value)
-        
-        # Map the stored type to DocumentType enum values
-        # The analyzer stores types in lowercase, but our enum uses proper case
-        type_mapping = {
-            "financial": DocumentType.EARNINGS_REPORT.value,
-            "contract": DocumentType.CONTRACT.value,
-            "invoice": DocumentType.INVOICE.value,
-            "unknown": DocumentType.UNKNOWN.value
-        }
+        stored_type = classification.get("type") or "unknown"
         
-        # Get the proper document type, defaulting to UNKNOWN if not found
-        document_type = type_mapping.get(document_type.lower(), DocumentType.UNKNOWN.value)
+        # Get the proper document type, only lowercasing types not stored by the analyzer
+        document_type = _TYPE_MAPPING.get(stored_type)
+        if document_type is None:
+            document_type = _TYPE_MAPPING.get(stored_type.lower(), DocumentType.UNKNOWN.value)
         
         # Generate mock actions based on document type
         actions = generate_mock_actions(document_type, document_id)
         
-        return {
+        # Serialize and count statuses in a single pass over the actions
+        serialized_actions = []
+        pending_actions = completed_actions = 0
+        for action in actions:
+            serialized_actions.append(action.model_dump())
+            if action.status == "pending":
+                pending_actions += 1
+            elif action.status == "completed":
+                completed_actions += 1
+        
+        return OrjsonResponse(content={
             "document_id": document_id,
             "document_type": document_type,
-            "actions": [action.dict() for action in actions],
+            "actions": serialized_actions,
             "total_actions": len(actions),
-            "pending_actions": len([a for a in actions if a.status == "pending"]),
-            "completed_actions": len([a for a in actions if a.status == "completed"])
-        }
+            "pending_actions": pending_actions,
+            "completed_actions": completed_actions
+        })
         
     except HTTPException:
         raise
@@ -6,13 +6,21 @@ Supports both LLM-based and classical ML approaches.
 """
 
 # Import only what actually exists
-from .types import DocumentType, ClassificationResult, ExtractedMetadata
-from .analyzer import DocumentAnalyzer
+from .types import DocumentType, ClassificationResult, ExtractedMetadata, DocumentContext
 
 __version__ = "0.1.0"
 __all__ = [
     "DocumentType",
     "ClassificationResult", 
     "ExtractedMetadata",
+    "DocumentContext",
     "DocumentAnalyzer"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the analyzer, and with it the classifiers and extractors, on first access."""
+    if name == "DocumentAnalyzer":
+        from .analyzer import DocumentAnalyzer
+        return DocumentAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
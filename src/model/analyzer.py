@@ -3,19 +3,51 @@ Unified document analyzer that combines classification and extraction.
 """
 
 import uuid
-import json
+import asyncio
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+
+import orjson
 
 from .classifier.llm_classifier import LLMClassifier
+from .classifier.ml_classifier import MLClassifier
+from .extractor.entity_extractor import BaseEntityExtractor
 from .extractor.extractor_factory import ExtractorFactory
-from .types import DocumentType, ClassificationResult
+from .types import DocumentType, ClassificationResult, DocumentContext
 from .config.settings import get_settings
+from .utils.cache import DiskCache
+from .utils.openai_client import create_async_openai_client
+from .utils.prompts import PROMPT_DIR
+from .utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# LLM requests issued by one analysis (classification and extraction)
+REQUESTS_PER_ANALYSIS = 2
+
+# orjson options for saved results; values orjson cannot encode fall back to str()
+_RESULTS_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+_RESULTS_JSONL_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+@lru_cache(maxsize=1)
+def _prompts_fingerprint() -> str:
+    """Hash of every prompt file, so editing a prompt invalidates cached analyses."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for prompt_path in sorted(PROMPT_DIR.glob("*.txt")):
+        hasher.update(prompt_path.name.encode("utf-8"))
+        hasher.update(prompt_path.read_bytes())
+    return hasher.hexdigest()
+
 
 class DocumentAnalyzer:
     """
@@ -47,11 +79,113 @@ class DocumentAnalyzer:
         # Initialize classifier
         self.classifier = LLMClassifier(model_name=model_name, api_key=api_key)
         
-        # Initialize extractor factory
+        # Optional ML classifier answering confident cases without calling the LLM
+        self.fast_classifier = self._initialize_fast_classifier()
+        self.fast_path_threshold = self.settings.get("classifier.fast_path.threshold", 0.9)
+        
+        # Initialize extractor factory; extractors are built once per document type
+        # so their prompts, compiled patterns and OpenAI client are reused
         self.extractor_factory = ExtractorFactory()
+        self._extractors: Dict[DocumentType, BaseEntityExtractor] = {}
+        self._extractors_lock = threading.Lock()
+        
+        # Concurrency and request rate used by analyze_batch
+        self.num_workers = self.settings.get("llm.num_workers", 16)
+        max_requests_per_minute = self.settings.get("llm.max_requests_per_minute")
+        self.rate_limiter = RateLimiter(max_requests_per_minute) if max_requests_per_minute else None
+        
+        # Cache of analysis results keyed by document content, model and prompts
+        self.result_cache = self._initialize_result_cache()
         
         logger.info("DocumentAnalyzer initialized successfully")
     
+    def _initialize_fast_classifier(self) -> Optional[MLClassifier]:
+        """Load the fast-path ML classifier if a trained model is configured."""
+        model_path = self.settings.get("classifier.fast_path.model_path")
+        if not model_path:
+            return None
+        if not Path(model_path).is_file():
+            logger.warning(f"Fast-path classifier model not found: {model_path}")
+            return None
+        return MLClassifier(model_path=model_path)
+    
+    def _initialize_result_cache(self) -> Optional[DiskCache]:
+        """Initialize the on-disk analysis result cache if enabled and results are deterministic."""
+        if not self.settings.get("cache.enabled", False):
+            return None
+        # Sampled completions differ between calls, so caching would freeze one of them
+        if (self.settings.get("openai.temperature") or 0) > 0:
+            return None
+        return DiskCache(
+            self.settings.get_path("cache.dir", ".cache") / "analysis_results",
+            ttl=self.settings.get("cache.analysis_ttl", 86400)
+        )
+    
+    def _result_cache_key(self, document_path: Path) -> str:
+        """
+        Build the result cache key of a document.
+        
+        Args:
+            document_path: Path to the document
+            
+        Returns:
+            Key covering the file content, the model, the prompts, the fast-path
+            model and the settings that change the analysis result
+        """
+        # hashlib.file_digest needs Python 3.11, so hash in 1 MiB blocks
+        content_hash = hashlib.sha256()
+        with open(document_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                content_hash.update(block)
+        return DiskCache.make_key(
+            content_hash.hexdigest(),
+            self.classifier.model_name,
+            _prompts_fingerprint(),
+            self._fast_classifier_fingerprint(),
+            self.fast_path_threshold,
+            self.classifier.head_tokens,
+            self.classifier.tail_tokens,
+            self.classifier.top_logprobs,
+            self.settings.get("extractor.pdf_backend", "pdfplumber")
+        )
+    
+    def _fast_classifier_fingerprint(self) -> Optional[Tuple[str, int, int]]:
+        """Path, mtime and size of the fast-path model, so retraining it in place invalidates cached analyses."""
+        if self.fast_classifier is None:
+            return None
+        model_path = self.settings.get("classifier.fast_path.model_path")
+        try:
+            stat = Path(model_path).stat()
+        except OSError:
+            return (model_path, 0, 0)
+        return (model_path, stat.st_mtime_ns, stat.st_size)
+    
+    def _classify(self, context: DocumentContext) -> ClassificationResult:
+        """
+        Classify a document, trying the fast-path ML classifier before the LLM.
+        
+        Args:
+            context: Pre-extracted document context
+            
+        Returns:
+            ClassificationResult from the ML classifier when its top probability
+            reaches the fast-path threshold, otherwise from the LLM
+        """
+        result = self._classify_fast(context)
+        if result is not None:
+            return result
+        return self.classifier.predict(context)
+    
+    def _classify_fast(self, context: DocumentContext) -> Optional[ClassificationResult]:
+        """Return the fast-path ML classification if it is confident enough, else None."""
+        if self.fast_classifier is None:
+            return None
+        result = self.fast_classifier.predict(context)
+        if result.confidence_score[result.document_type.value] >= self.fast_path_threshold:
+            logger.info(f"Fast-path classification: {result.document_type.value}")
+            return result
+        return None
+    
     def analyze(self, document_path: str) -> Dict[str, Any]:
         """
         Analyze a document by classifying it and extracting metadata.
@@ -63,26 +197,140 @@ class DocumentAnalyzer:
             Dictionary with analysis results in the specified format
         """
         document_path = Path(document_path)
+        document_id, cache_key, cached = self._start_analysis(document_path)
+        if cached is not None:
+            return cached
+        
+        # Parse the PDF once and share the text between classification and extraction
+        context = self._load_context(document_path)
+        
+        # Step 1: Classify the document
+        logger.info(f"Classifying document: {document_path.name}")
+        classification_result = self._classify(context)
+        
+        return self._extract_and_format(document_id, context, classification_result, cache_key)
+    
+    async def aanalyze(self, document_path: str, client: Optional["AsyncOpenAI"] = None) -> Dict[str, Any]:
+        """
+        Analyze a document without blocking the event loop.
+        
+        The classification request goes through the async OpenAI client, while
+        PDF parsing and extraction run in the default executor.
+        
+        Args:
+            document_path: Path to the document to analyze
+            client: Async OpenAI client to reuse (a new one is created when omitted)
+            
+        Returns:
+            Dictionary with analysis results in the specified format
+        """
+        loop = asyncio.get_running_loop()
+        document_path = Path(document_path)
+        document_id, cache_key, cached = await loop.run_in_executor(None, self._start_analysis, document_path)
+        if cached is not None:
+            return cached
+        
+        context = await loop.run_in_executor(None, self._load_context, document_path)
+        
+        logger.info(f"Classifying document: {document_path.name}")
+        classification_result = self._classify_fast(context)
+        if classification_result is None:
+            classification_result = await self.classifier.apredict(context, client)
+        
+        return await loop.run_in_executor(
+            None, self._extract_and_format, document_id, context, classification_result, cache_key
+        )
+    
+    def _get_extractor(self, document_type: DocumentType) -> BaseEntityExtractor:
+        """
+        Get the entity extractor for a document type, creating it on first use.
         
-        if not document_path.exists():
-            raise FileNotFoundError(f"Document not found: {document_path}")
+        Args:
+            document_type: Classified document type
+            
+        Returns:
+            Shared entity extractor for the document type
+        """
+        extractor = self._extractors.get(document_type)
+        if extractor is None:
+            with self._extractors_lock:
+                extractor = self._extractors.get(document_type)
+                if extractor is None:
+                    extractor = self.extractor_factory.create_extractor(
+                        document_type,
+                        llm_model=self.classifier.model_name,
+                        api_key=self.classifier.api_key
+                    )
+                    self._extractors[document_type] = extractor
+        return extractor
+    
+    def _start_analysis(self, document_path: Path) -> Tuple[str, Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Check the document and look up a cached analysis.
         
+        Args:
+            document_path: Path to the document to analyze
+            
+        Returns:
+            Tuple of the new document ID, the result cache key (None when caching
+            is disabled) and the cached result, if any
+        """
         # Generate unique document ID
         document_id = str(uuid.uuid4())
         
-        # Step 1: Classify the document
-        logger.info(f"Classifying document: {document_path.name}")
-        classification_result = self.classifier.predict(str(document_path))
+        # Re-analyzing an unchanged document returns the cached result without any LLM call
+        if self.result_cache is None:
+            return document_id, None, None
+        try:
+            cache_key = self._result_cache_key(document_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Document not found: {document_path}") from None
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Analysis cache hit for {document_path.name}")
+            cached.update(document_id=document_id, filename=document_path.name)
+        return document_id, cache_key, cached
+    
+    def _load_context(self, document_path: Path) -> DocumentContext:
+        """
+        Parse a document into a DocumentContext.
+        
+        Missing files are reported by the PDF reader opening them rather than
+        by a separate stat call up front.
+        
+        Args:
+            document_path: Path to the document to analyze
+            
+        Returns:
+            DocumentContext for the document
+        """
+        try:
+            return DocumentContext.from_pdf(document_path, self.classifier.pdf_extractor)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Document not found: {document_path}") from None
+    
+    def _extract_and_format(self, document_id: str, context: DocumentContext,
+                            classification_result: ClassificationResult,
+                            cache_key: Optional[str]) -> Dict[str, Any]:
+        """
+        Extract metadata for a classified document and build the analysis result.
+        
+        Args:
+            document_id: ID of the analysis
+            context: Pre-extracted document context
+            classification_result: Classification of the document
+            cache_key: Result cache key, or None when caching is disabled
+            
+        Returns:
+            Dictionary with analysis results in the specified format
+        """
+        document_path = context.path
         
         # Step 2: Extract metadata based on document type
         logger.info(f"Extracting metadata for document type: {classification_result.document_type}")
-        extractor = self.extractor_factory.create_extractor(
-            classification_result.document_type,
-            llm_model=self.classifier.model_name,
-            api_key=self.classifier.api_key
-        )
+        extractor = self._get_extractor(classification_result.document_type)
         
-        extraction_result = extractor.extract(document_path)
+        extraction_result = extractor.extract(context)
         
         # Step 3: Format the results
         result = {
@@ -121,6 +369,9 @@ class DocumentAnalyzer:
             "errors": extraction_result.errors
         }
         
+        if cache_key is not None and not extraction_result.errors:
+            self.result_cache.set(cache_key, result)
+        
         logger.info(f"Analysis completed for {document_path.name}")
         return result
     
@@ -128,38 +379,87 @@ class DocumentAnalyzer:
         """
         Analyze multiple documents.
         
+        Analyses are I/O-bound on LLM calls, so up to ``llm.num_workers`` run
+        concurrently on a thread pool sharing the classifier's OpenAI client.
+        When ``llm.max_requests_per_minute`` is set, analyses are started no
+        faster than that request rate allows.
+        
+        Args:
+            document_paths: List of document paths to analyze
+            
+        Returns:
+            List of analysis results, in input order
+        """
+        if not document_paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(document_paths), self.num_workers)) as executor:
+            return list(executor.map(self._analyze_or_error, document_paths))
+    
+    async def aanalyze_batch(self, document_paths: list) -> list:
+        """
+        Analyze multiple documents concurrently on the event loop.
+        
+        All classification requests share one async OpenAI client, and at most
+        ``llm.num_workers`` analyses are in flight at a time.
+        
         Args:
             document_paths: List of document paths to analyze
             
         Returns:
-            List of analysis results
-        """
-        results = []
-        
-        for document_path in document_paths:
-            try:
-                result = self.analyze(document_path)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error analyzing {document_path}: {e}")
-                # Add error result
-                results.append({
-                    "document_id": str(uuid.uuid4()),
-                    "filename": Path(document_path).name,
-                    "error": str(e),
-                    "classification": None,
-                    "metadata": {}
-                })
-        
-        return results
+            List of analysis results, in input order
+        """
+        if not document_paths:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.num_workers)
+        
+        async def analyze_one(client: "AsyncOpenAI", document_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if self.rate_limiter is not None:
+                        await loop.run_in_executor(None, self.rate_limiter.acquire, REQUESTS_PER_ANALYSIS)
+                    return await self.aanalyze(document_path, client)
+                except Exception as e:
+                    return self._error_result(document_path, e)
+        
+        async with create_async_openai_client(
+            self.classifier.api_key, self.settings.get("openai.base_url")
+        ) as client:
+            return await asyncio.gather(*[analyze_one(client, path) for path in document_paths])
+    
+    def _analyze_or_error(self, document_path: str) -> Dict[str, Any]:
+        """Analyze a document, returning an error result instead of raising."""
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(REQUESTS_PER_ANALYSIS)
+            return self.analyze(document_path)
+        except Exception as e:
+            return self._error_result(document_path, e)
+    
+    @staticmethod
+    def _error_result(document_path: str, error: Exception) -> Dict[str, Any]:
+        """Build the result reported for a document whose analysis failed."""
+        logger.error(f"Error analyzing {document_path}: {error}")
+        return {
+            "document_id": str(uuid.uuid4()),
+            "filename": Path(document_path).name,
+            "error": str(error),
+            "classification": None,
+            "metadata": {}
+        }
     
     def save_results(self, results: list, output_path: str) -> None:
         """
         Save analysis results to a JSON file.
         
+        A ``.jsonl`` output path writes one result per line, which streaming
+        consumers can read without loading the whole batch.
+        
         Args:
             results: List of analysis results
-            output_path: Path where to save the JSON file
+            output_path: Path where to save the JSON or JSONL file
         """
         output_path = Path(output_path)
         
@@ -167,8 +467,12 @@ class DocumentAnalyzer:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Save results
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        if output_path.suffix.lower() == '.jsonl':
+            with open(output_path, 'wb') as f:
+                for result in results:
+                    f.write(orjson.dumps(result, option=_RESULTS_JSONL_OPTIONS, default=str))
+        else:
+            output_path.write_bytes(orjson.dumps(results, option=_RESULTS_JSON_OPTIONS, default=str))
         
         logger.info(f"Results saved to: {output_path}")
     
@@ -3,8 +3,10 @@ Base classifier interface for document classification.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, List
 from pathlib import Path
+import os
 
 from ..types import DocumentType, ClassificationResult
 
@@ -44,25 +46,31 @@ class BaseClassifier(ABC):
         Classify a single document.
         
         Args:
-            document_path: Path to the document to classify
+            document_path: Path to the document to classify, or its pre-extracted DocumentContext
             
         Returns:
             ClassificationResult with predicted type and confidence
         """
         pass
     
-    @abstractmethod
     def predict_batch(self, document_paths: List[Union[str, Path]]) -> List[ClassificationResult]:
         """
         Classify multiple documents.
         
+        Documents are classified concurrently on a thread pool, since PDF parsing
+        spends most of its time in I/O and C code that releases the GIL. Subclasses
+        whose ``predict`` is not thread-safe should override this method.
+        
         Args:
             document_paths: List of document paths to classify
             
         Returns:
-            List of ClassificationResult objects
+            List of ClassificationResult objects, in input order
         """
-        pass
+        if not document_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(document_paths), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.predict, document_paths))
     
     def save_model(self, path: Union[str, Path]) -> None:
         """
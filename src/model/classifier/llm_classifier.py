@@ -3,20 +3,157 @@ LLM-based document classifier using OpenAI API.
 """
 
 import os
-import json
+import asyncio
 import logging
 import math
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
-from openai import OpenAI
+
+import orjson
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
 
 from .base import BaseClassifier
-from ..types import ClassificationResult, DocumentType
+from ..types import ClassificationResult, DocumentType, DocumentContext
 from ..config.settings import get_settings
-from ..extractor.pdf_extractor import PDFExtractor
+from ..extractor.base_pdf_extractor import BasePDFExtractor
+from ..extractor.pdf_extractor import create_pdf_extractor
+from ..utils.cache import DiskCache
+from ..utils.openai_batch import BATCH_POLL_INTERVAL, BATCH_MAX_POLL_INTERVAL, run_batch_job
+from ..utils.openai_client import get_openai_client, create_async_openai_client
+from ..utils.prompts import load_prompt
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Approximate characters per token, used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Tokens kept from the start and the end of a document sent to the LLM
+DEFAULT_HEAD_TOKENS = 1000
+DEFAULT_TAIL_TOKENS = 500
+
+# Marker inserted where the middle of a long document was dropped
+TRUNCATION_MARKER = "\n...\n"
+
+# Alternatives returned per token; every document type label must fit in this many
+DEFAULT_TOP_LOGPROBS = 20
+
+# Completion tokens allowed per document of a grouped prompt, plus a fixed margin
+# for the array brackets and formatting (one entry is roughly 25 tokens)
+GROUP_TOKENS_PER_DOCUMENT = 48
+GROUP_RESPONSE_MARGIN_TOKENS = 32
+
+# Maps labels returned by the LLM to document types
+_TYPE_MAP = {doc_type.value: doc_type for doc_type in DocumentType}
+
+# Zero confidence for every document type, copied as the starting point of each result
+_EMPTY_CONFIDENCES = {doc_type.value: 0.0 for doc_type in DocumentType}
+
+
+def _extract_pdf_text(pdf_path: Path, pdf_extractor: Optional[BasePDFExtractor] = None) -> str:
+    """
+    Extract the full text of a PDF sent to the LLM.
+    
+    The whole document is read, so ``_truncate_text`` keeps its real tail and a
+    path yields the same prompt as its pre-extracted DocumentContext. The text
+    is served from the extractor's disk cache when enabled. Module-level so it
+    can run in worker processes, where a fresh PDF extractor is created when
+    none is given.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        pdf_extractor: PDF extractor to use (optional)
+        
+    Returns:
+        Extracted text content
+    """
+    text = (pdf_extractor or create_pdf_extractor()).extract_text(pdf_path)
+    if not text:
+        raise ValueError(f"No text content extracted from PDF: {pdf_path}")
+    return text
+
+
+# Prompts are static, so they are read once at import rather than per instance
+SYSTEM_PROMPT = load_prompt("classification_system_prompt.txt").strip()
+USER_PROMPT_TEMPLATE = load_prompt("classification_user_prompt.txt").strip()
+BATCH_SYSTEM_PROMPT = load_prompt("classification_system_prompt_batch.txt").strip()
+BATCH_USER_PROMPT_TEMPLATE = load_prompt("classification_user_prompt_batch.txt").strip()
+
+
+def _split_template(template: str, field_name: str) -> Tuple[str, str]:
+    """
+    Split a str.format template around its single field.
+    
+    Formatting once with a placeholder resolves escaped braces exactly as
+    ``format`` would, so concatenating ``prefix + value + suffix`` gives the
+    same prompt without escaping the value or re-parsing the template.
+    """
+    prefix, suffix = template.format(**{field_name: "\x00"}).split("\x00")
+    return prefix, suffix
+
+
+# Bias strong enough to restrict sampling to the label tokens
+LABEL_LOGIT_BIAS = 100
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model_name: str):
+    """
+    Return the tiktoken encoding for a model, or None if it is unavailable.
+    
+    Without an encoding there is no label logit bias and truncation counts
+    characters instead of tokens, so the fallback is logged once per model.
+    """
+    if tiktoken is None:
+        logger.warning(
+            "tiktoken is not installed; classifying without label logit bias "
+            f"and approximating tokens as {CHARS_PER_TOKEN} characters"
+        )
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        logger.warning(
+            f"No tokenizer known for model {model_name}; classifying without label logit bias "
+            f"and approximating tokens as {CHARS_PER_TOKEN} characters"
+        )
+        return None
+
+
+@lru_cache(maxsize=None)
+def _label_logit_bias(model_name: str) -> Optional[Dict[str, int]]:
+    """
+    Build a logit bias restricting the single output token to a class label.
+    
+    Args:
+        model_name: OpenAI model name used to pick the tokenizer
+        
+    Returns:
+        Mapping of label token ids to bias, or None if the labels cannot be
+        tokenized (tiktoken not installed, unknown model, or multi-token labels)
+    """
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        return None
+    
+    logit_bias = {}
+    for doc_type in DocumentType:
+        if doc_type == DocumentType.UNKNOWN:
+            continue
+        tokens = encoding.encode(doc_type.value)
+        if len(tokens) != 1:
+            return None
+        logit_bias[str(tokens[0])] = LABEL_LOGIT_BIAS
+    return logit_bias
+
 
 class LLMClassifier(BaseClassifier):
     """
@@ -45,16 +182,49 @@ class LLMClassifier(BaseClassifier):
         
         self.model_name = model_name
         self.api_key = api_key
+        self.max_concurrency = kwargs.get(
+            "max_concurrency", self.settings.get("classifier.max_concurrency", 16)
+        )
+        # Token budget kept from the start and end of each document
+        self.head_tokens = kwargs.get(
+            "head_tokens", self.settings.get("classifier.head_tokens", DEFAULT_HEAD_TOKENS)
+        )
+        self.tail_tokens = kwargs.get(
+            "tail_tokens", self.settings.get("classifier.tail_tokens", DEFAULT_TAIL_TOKENS)
+        )
+        # Number of documents packed into a single request by predict_batch
+        self.group_size = kwargs.get(
+            "group_size", self.settings.get("classifier.group_size", 1)
+        )
+        # Alternatives requested for the label token; lower values shrink responses
+        self.top_logprobs = kwargs.get(
+            "top_logprobs", self.settings.get("classifier.top_logprobs", DEFAULT_TOP_LOGPROBS)
+        )
+        # Parse classification responses from raw JSON instead of the SDK models
+        self.raw_responses = kwargs.get(
+            "raw_responses", self.settings.get("classifier.raw_responses", True)
+        )
+        # Processes extracting PDF text for predict_batch_offline (0 uses threads)
+        self.extraction_processes = kwargs.get(
+            "extraction_processes", self.settings.get("classifier.extraction_processes", 0)
+        )
         
         # Initialize OpenAI client
         self.client = self._initialize_client()
         
         # Initialize PDF extractor for text extraction
-        self.pdf_extractor = PDFExtractor()
+        self.pdf_extractor = create_pdf_extractor()
+        
+        # Cache of parsed responses keyed by (model, prompts)
+        self.response_cache = self._initialize_cache()
         
         # Load prompts
-        self.system_prompt = self._load_system_prompt()
-        self.user_prompt_template = self._load_user_prompt()
+        self.system_prompt = SYSTEM_PROMPT
+        self.user_prompt_template = USER_PROMPT_TEMPLATE
+        self.batch_system_prompt = BATCH_SYSTEM_PROMPT
+        self.batch_user_prompt_template = BATCH_USER_PROMPT_TEMPLATE
+        self._user_prompt_parts = _split_template(self.user_prompt_template, "document_content")
+        self._batch_user_prompt_parts = _split_template(self.batch_user_prompt_template, "documents")
     
     def _initialize_client(self):
         """Initialize the OpenAI client."""
@@ -63,11 +233,24 @@ class LLMClassifier(BaseClassifier):
             return None
         
         try:
-            return OpenAI(api_key=self.api_key)
+            return get_openai_client(self.api_key, self.settings.get("openai.base_url"))
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             return None
     
+    def _initialize_cache(self) -> Optional[DiskCache]:
+        """Initialize the on-disk response cache if enabled in settings."""
+        if not self.settings.get("cache.enabled", False):
+            return None
+        cache_dir = self.settings.get_path("cache.dir", ".cache") / "classifier_responses"
+        return DiskCache(cache_dir)
+    
+    def _initialize_async_client(self):
+        """Initialize an async OpenAI client for concurrent batch requests."""
+        if not self.api_key:
+            raise ValueError("No API key provided - LLM classification will not work")
+        return create_async_openai_client(self.api_key, self.settings.get("openai.base_url"))
+    
     def train(self, training_data: List[tuple], **kwargs) -> None:
         """
         Fine-tune or configure the LLM classifier.
@@ -84,69 +267,373 @@ class LLMClassifier(BaseClassifier):
         # Implementation for LLM training/fine-tuning
         pass
     
-    def _load_system_prompt(self):
-        """Load system prompt from resources."""
-        prompt_path = Path(__file__).parent.parent.parent / "resources" / "prompts" / "classification_system_prompt.txt"
-        with open(prompt_path, "r") as f:
-            return f.read().strip()
-
-    def _load_user_prompt(self):
-        """Load user prompt template from resources."""
-        prompt_path = Path(__file__).parent.parent.parent / "resources" / "prompts" / "classification_user_prompt.txt"
-        with open(prompt_path, "r") as f:
-            return f.read().strip()
-
-    def predict(self, document_path: str) -> ClassificationResult:
-        text = self._extract_text_from_pdf(Path(document_path))
-        # Escape any curly braces in the text to avoid format errors
-        escaped_text = text[:5000].replace("{", "{{").replace("}", "}}")
-        user_prompt = self.user_prompt_template.format(document_content=escaped_text)
-        
-        # Use chat completions API
-        response = self.client.chat.completions.create(
+    def predict(self, document_path: Union[str, DocumentContext]) -> ClassificationResult:
+        """
+        Classify a single document using LLM.
+        
+        Args:
+            document_path: Path to the document to classify, or its pre-extracted DocumentContext
+            
+        Returns:
+            ClassificationResult with predicted type and confidence
+        """
+        text = self._get_document_text(document_path)
+        request = self._build_request(text)
+        
+        cache_key = self._cache_key(request)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.raw_responses:
+            raw_response = self.client.chat.completions.with_raw_response.create(**request)
+            result = self._parse_completion_body(orjson.loads(raw_response.content))
+        else:
+            result = self._parse_llm_response(self.client.chat.completions.create(**request))
+        self._cache_result(cache_key, result)
+        return result
+    
+    async def apredict(self, document_path: Union[str, DocumentContext],
+                       client: Optional["AsyncOpenAI"] = None) -> ClassificationResult:
+        """
+        Classify a single document without blocking the event loop.
+        
+        Args:
+            document_path: Path to the document to classify, or its pre-extracted DocumentContext
+            client: Async OpenAI client to reuse (a new one is created when omitted)
+            
+        Returns:
+            ClassificationResult with predicted type and confidence
+        """
+        if client is not None:
+            return await self._apredict(client, document_path)
+        async with self._initialize_async_client() as client:
+            return await self._apredict(client, document_path)
+    
+    def predict_batch(self, document_paths: List[Union[str, DocumentContext]]) -> List[ClassificationResult]:
+        """
+        Classify multiple documents using LLM.
+        
+        Requests are issued concurrently, bounded by ``max_concurrency``, and
+        PDF text extraction runs in a thread pool so it overlaps in-flight calls.
+        When ``group_size`` > 1, documents are packed ``group_size`` at a time
+        into a single prompt so the system prompt is paid once per group.
+        Must not be called from within a running event loop.
+        
+        Args:
+            document_paths: List of document paths to classify
+            
+        Returns:
+            List of ClassificationResult objects, in input order
+        """
+        return asyncio.run(self._apredict_batch(document_paths))
+    
+    async def _apredict_batch(self, document_paths: List[str]) -> List[ClassificationResult]:
+        """Classify documents concurrently and map failures to UNKNOWN results."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with self._initialize_async_client() as client:
+            if self.group_size > 1:
+                groups = [
+                    document_paths[i:i + self.group_size]
+                    for i in range(0, len(document_paths), self.group_size)
+                ]
+                tasks = [self._apredict_group(client, group, semaphore) for group in groups]
+                group_responses = await asyncio.gather(*tasks, return_exceptions=True)
+                # Spread group-level failures over every document in the group
+                responses = []
+                for group, group_response in zip(groups, group_responses):
+                    if isinstance(group_response, Exception):
+                        responses.extend([group_response] * len(group))
+                    else:
+                        responses.extend(group_response)
+            else:
+                tasks = [self._apredict(client, path, semaphore) for path in document_paths]
+                responses = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = []
+        for path, response in zip(document_paths, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error classifying {path}: {response}")
+                response = self._failed_result(str(response))
+            results.append(response)
+        return results
+    
+    def predict_batch_offline(self, document_paths: List[Union[str, DocumentContext]],
+                              poll_interval: float = BATCH_POLL_INTERVAL,
+                              max_poll_interval: float = BATCH_MAX_POLL_INTERVAL,
+                              timeout: Optional[float] = None) -> List[ClassificationResult]:
+        """
+        Classify documents through the OpenAI Batch API.
+        
+        All uncached requests are uploaded as one JSONL file and processed
+        asynchronously by OpenAI at a reduced token price, without a round
+        trip per document. Results can take up to the 24h completion window,
+        so this suits offline bulk classification rather than interactive use.
+        
+        Args:
+            document_paths: List of document paths or pre-extracted DocumentContexts
+            poll_interval: Initial seconds between batch status checks, doubled after each check
+            max_poll_interval: Upper bound on the seconds between status checks
+            timeout: Seconds to wait before cancelling the batch (None waits indefinitely)
+            
+        Returns:
+            List of ClassificationResult objects, in input order; documents whose
+            request failed are classified as UNKNOWN
+        """
+        if not document_paths:
+            return []
+        
+        requests = [self._build_request(text) for text in self._extract_texts(document_paths)]
+        results = [self._get_cached_result(self._cache_key(request)) for request in requests]
+        
+        pending = {str(i): request for i, (request, result) in enumerate(zip(requests, results)) if result is None}
+        if pending:
+            bodies = run_batch_job(self.client, pending, "classification", poll_interval, max_poll_interval, timeout)
+            for custom_id, request in pending.items():
+                index = int(custom_id)
+                body = bodies.get(custom_id)
+                if body is None:
+                    results[index] = self._failed_result(f"No batch output for {document_paths[index]}")
+                    continue
+                results[index] = self._parse_completion_body(body)
+                self._cache_result(self._cache_key(request), results[index])
+        return results
+    
+    @staticmethod
+    def _failed_result(message: str) -> ClassificationResult:
+        """Build the UNKNOWN result reported for a document that could not be classified."""
+        return ClassificationResult(
+            document_type=DocumentType.UNKNOWN,
+            confidence_score=_EMPTY_CONFIDENCES.copy(),
+            raw_response=message
+        )
+    
+    async def _apredict(self, client: "AsyncOpenAI", document_path: Union[str, DocumentContext],
+                        semaphore: Optional[asyncio.Semaphore] = None) -> ClassificationResult:
+        """Classify a single document with the async client, bounded by the semaphore if given."""
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(None, self._get_document_text, document_path)
+        request = self._build_request(text)
+        
+        cache_key = self._cache_key(request)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+        
+        # nullcontext only supports "async with" from Python 3.10
+        if semaphore is None:
+            response = await client.chat.completions.create(**request)
+        else:
+            async with semaphore:
+                response = await client.chat.completions.create(**request)
+        result = self._parse_llm_response(response)
+        self._cache_result(cache_key, result)
+        return result
+    
+    async def _apredict_group(self, client: "AsyncOpenAI", document_paths: List[str],
+                              semaphore: asyncio.Semaphore) -> List[ClassificationResult]:
+        """
+        Classify a group of documents with a single grouped prompt.
+        
+        Documents with a cached grouped classification are left out of the
+        prompt; the group request is skipped when all of them are cached.
+        """
+        loop = asyncio.get_running_loop()
+        texts = await asyncio.gather(*[
+            loop.run_in_executor(None, self._get_document_text, path)
+            for path in document_paths
+        ])
+        cache_keys = [self._group_cache_key(text) for text in texts]
+        results = [self._get_cached_result(cache_key) for cache_key in cache_keys]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        async with semaphore:
+            response = await client.chat.completions.create(
+                **self._build_group_request([texts[index] for index in pending])
+            )
+        group_results = self._parse_group_response(response.choices[0].message.content, len(pending))
+        for index, result in zip(pending, group_results):
+            results[index] = result
+            if result.document_type != DocumentType.UNKNOWN:
+                self._cache_result(cache_keys[index], result)
+        return results
+    
+    def _build_group_request(self, texts: List[str]) -> Dict[str, Any]:
+        """
+        Build the chat completion request parameters for a group of documents.
+        
+        Each document is truncated to its head and tail like single-document prompts.
+        
+        Args:
+            texts: Extracted text for each document; ids are list positions
+            
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
+        documents = "\n".join(
+            f"=== DOC {doc_id} ===\n{self._truncate_text(text)}\n" for doc_id, text in enumerate(texts)
+        )
+        prefix, suffix = self._batch_user_prompt_parts
+        return dict(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": self.batch_system_prompt},
+                {"role": "user", "content": prefix + documents + suffix}
+            ],
+            max_tokens=GROUP_TOKENS_PER_DOCUMENT * len(texts) + GROUP_RESPONSE_MARGIN_TOKENS,
+            temperature=0
+        )
+    
+    def _parse_group_response(self, content: str, group_length: int) -> List[ClassificationResult]:
+        """
+        Parse a grouped JSON array response into one ClassificationResult per document.
+        
+        Entries are parsed independently, so a missing or malformed entry only
+        makes its own document UNKNOWN.
+        
+        Args:
+            content: Raw JSON array returned by the LLM
+            group_length: Number of documents in the group
+            
+        Returns:
+            List of ClassificationResult objects ordered by document id
+        """
+        try:
+            entries = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Could not parse grouped classification response: {e}")
+            entries = []
+        if not isinstance(entries, list):
+            logger.warning("Grouped classification response is not a JSON array")
+            entries = []
+        entries_by_id = {str(entry.get("id")): entry for entry in entries if isinstance(entry, dict)}
+        return [self._parse_group_entry(entries_by_id.get(str(doc_id))) for doc_id in range(group_length)]
+    
+    def _parse_group_entry(self, entry: Optional[Dict[str, Any]]) -> ClassificationResult:
+        """Build the result of one grouped response entry, UNKNOWN if it is missing or malformed."""
+        if entry is None:
+            return self._failed_result("No entry for the document in the grouped response")
+        label = entry.get("document_type")
+        document_type = _TYPE_MAP.get(label, DocumentType.UNKNOWN) if isinstance(label, str) else DocumentType.UNKNOWN
+        type_confidences = _EMPTY_CONFIDENCES.copy()
+        if document_type != DocumentType.UNKNOWN:
+            try:
+                type_confidences[document_type.value] = float(entry.get("confidence", 0.0))
+            except (TypeError, ValueError):
+                return self._failed_result(f"Invalid confidence in grouped response entry: {entry}")
+        return ClassificationResult(
+            document_type=document_type,
+            confidence_score=type_confidences,
+            raw_response=orjson.dumps(entry).decode()
+        )
+    
+    def _get_cached_result(self, cache_key: str) -> Optional[ClassificationResult]:
+        """Return the cached result for a cache key, if any."""
+        if self.response_cache is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        logger.debug("Classification cache hit")
+        return ClassificationResult.from_dict(cached)
+    
+    def _cache_result(self, cache_key: str, result: ClassificationResult) -> None:
+        """Store a successfully parsed result in the response cache."""
+        if self.response_cache is not None:
+            self.response_cache.set(cache_key, result.to_dict())
+    
+    def _group_cache_key(self, text: str) -> str:
+        """Build the response cache key of one document classified in a grouped prompt."""
+        return DiskCache.make_key(
+            self.model_name, self.batch_system_prompt, *self._batch_user_prompt_parts,
+            self.head_tokens, self.tail_tokens, text
+        )
+    
+    @staticmethod
+    def _cache_key(request: Dict[str, Any]) -> str:
+        """Build the response cache key from the model name and prompts."""
+        return DiskCache.make_key(
+            request["model"], *(message["content"] for message in request["messages"])
+        )
+    
+    def _build_request(self, text_content: str) -> Dict[str, Any]:
+        """
+        Build the chat completion request parameters for a document.
+        
+        Args:
+            text_content: Extracted text from the document
+            
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
+        request = dict(
             model=self.model_name,
             messages=[
                 {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": user_prompt}
+                {"role": "user", "content": self._create_classification_prompt(text_content)}
             ],
             max_tokens=1,
             temperature=0,
             # Get logprobs for the response tokens
             logprobs=True,
-            top_logprobs=20
+            top_logprobs=self.top_logprobs
         )
+        # Constrain the single output token to one of the class labels
+        logit_bias = _label_logit_bias(self.model_name)
+        if logit_bias:
+            request["logit_bias"] = logit_bias
+        return request
+    
+    def _extract_texts(self, documents: List[Union[str, Path, DocumentContext]]) -> List[str]:
+        """
+        Get the LLM input text of many documents in parallel.
         
-        content = response.choices[0].message.content.strip()
-        token_confidences = {
-            logprob.token: math.exp(logprob.logprob)  # Convert log probability to confidence
-            for logprob in response.choices[0].logprobs.content[0].top_logprobs
-        }
-
-        # for each document type, get the confidence score
-        # Initialize confidence scores for all document types to 0
-        type_confidences = {doc_type.value: 0.0 for doc_type in DocumentType}
-        # Update confidence scores from token probabilities
-        for doc_type, confidence in token_confidences.items():
-            if doc_type in type_confidences:
-                type_confidences[doc_type] = confidence
+        pdfplumber parsing is pure Python and holds the GIL, so with
+        ``extraction_processes`` > 0 PDFs are parsed in worker processes;
+        otherwise a thread pool is used. Pre-extracted DocumentContexts are
+        read in-process.
         
-        return ClassificationResult(
-                document_type=DocumentType(max(type_confidences.items(), key=lambda x: x[1])[0]),
-                confidence_score=type_confidences,
-                raw_response=content)
+        Args:
+            documents: Document paths or pre-extracted DocumentContexts
+            
+        Returns:
+            Document texts, in input order
+        """
+        paths = [document for document in documents if not isinstance(document, DocumentContext)]
+        if not self.extraction_processes or len(paths) < 2:
+            with ThreadPoolExecutor(max_workers=min(len(documents), os.cpu_count() or 1)) as executor:
+                return list(executor.map(self._get_document_text, documents))
+        
+        with ProcessPoolExecutor(max_workers=min(len(paths), self.extraction_processes)) as executor:
+            futures = [
+                None if isinstance(document, DocumentContext)
+                else executor.submit(_extract_pdf_text, Path(document))
+                for document in documents
+            ]
+            return [
+                self._get_document_text(document) if future is None else future.result()
+                for document, future in zip(documents, futures)
+            ]
     
-    def predict_batch(self, document_paths: List[str]) -> List[ClassificationResult]:
+    def _get_document_text(self, document: Union[str, Path, DocumentContext]) -> str:
         """
-        Classify multiple documents using LLM.
+        Get the text sent to the LLM, reusing already extracted text when available.
         
         Args:
-            document_paths: List of document paths to classify
+            document: Path to the document or its pre-extracted DocumentContext
             
         Returns:
-            List of ClassificationResult objects
+            Full document text, truncated later by ``_truncate_text``
         """
-        # Implementation for batch LLM classification
-        pass
+        if isinstance(document, DocumentContext):
+            text = document.full_text
+            if not text:
+                raise ValueError(f"No text content extracted from PDF: {document.path}")
+            return text
+        return self._extract_text_from_pdf(Path(document))
     
     def _extract_text_from_pdf(self, pdf_path: Path) -> str:
         """
@@ -158,7 +645,7 @@ class LLMClassifier(BaseClassifier):
         Returns:
             Extracted text content
         """
-        return self.pdf_extractor.extract_text(pdf_path)
+        return _extract_pdf_text(pdf_path, self.pdf_extractor)
     
     def _create_classification_prompt(self, text_content: str) -> str:
         """
@@ -170,18 +657,87 @@ class LLMClassifier(BaseClassifier):
         Returns:
             Formatted prompt for the LLM
         """
-        # Implementation for prompt creation
-        pass
+        # The template is pre-split, so document braces need no escaping
+        prefix, suffix = self._user_prompt_parts
+        return prefix + self._truncate_text(text_content) + suffix
+    
+    def _truncate_text(self, text: str) -> str:
+        """
+        Keep the start and end of a document within the token budget.
+        
+        Headers and footers carry most of the classification signal (titles,
+        dates, totals, signatures), so the middle of long documents is dropped.
+        Tokens are counted with tiktoken when available, otherwise approximated
+        from characters.
+        
+        Args:
+            text: Document text
+            
+        Returns:
+            Text of at most ``head_tokens + tail_tokens`` tokens
+        """
+        encoding = _get_encoding(self.model_name)
+        if encoding is None:
+            head = self.head_tokens * CHARS_PER_TOKEN
+            tail = self.tail_tokens * CHARS_PER_TOKEN
+            if len(text) <= head + tail:
+                return text
+            return text[:head] + TRUNCATION_MARKER + text[len(text) - tail:]
+        
+        tokens = encoding.encode(text)
+        if len(tokens) <= self.head_tokens + self.tail_tokens:
+            return text
+        head = encoding.decode(tokens[:self.head_tokens])
+        tail = encoding.decode(tokens[len(tokens) - self.tail_tokens:])
+        return head + TRUNCATION_MARKER + tail
     
-    def _parse_llm_response(self, response: str) -> ClassificationResult:
+    def _parse_llm_response(self, response) -> ClassificationResult:
         """
         Parse LLM response into ClassificationResult.
         
         Args:
-            response: Raw response from the LLM
+            response: Chat completion response from the LLM
             
         Returns:
             Parsed ClassificationResult
         """
-        # Implementation for response parsing
-        pass 
\ No newline at end of file
+        content = response.choices[0].message.content.strip()
+        
+        # Confidence scores for all document types start at 0 and are updated from
+        # the probabilities of label tokens; other tokens are skipped before math.exp
+        type_confidences = _EMPTY_CONFIDENCES.copy()
+        for logprob in response.choices[0].logprobs.content[0].top_logprobs:
+            if logprob.token in _EMPTY_CONFIDENCES:
+                type_confidences[logprob.token] = math.exp(logprob.logprob)
+        
+        return self._result_from_confidences(type_confidences, content)
+    
+    def _parse_completion_body(self, body: Dict[str, Any]) -> ClassificationResult:
+        """
+        Parse a decoded chat completion JSON body into ClassificationResult.
+        
+        Only the message and the label logprobs are read, straight from the
+        dict, so the SDK's pydantic response models are never built.
+        
+        Args:
+            body: Chat completion response body
+            
+        Returns:
+            Parsed ClassificationResult
+        """
+        choice = body["choices"][0]
+        type_confidences = _EMPTY_CONFIDENCES.copy()
+        for logprob in choice["logprobs"]["content"][0]["top_logprobs"]:
+            token = logprob["token"]
+            if token in _EMPTY_CONFIDENCES:
+                type_confidences[token] = math.exp(logprob["logprob"])
+        
+        return self._result_from_confidences(type_confidences, choice["message"]["content"].strip())
+    
+    @staticmethod
+    def _result_from_confidences(type_confidences: Dict[str, float], content: str) -> ClassificationResult:
+        """Build the result for the most probable document type."""
+        return ClassificationResult(
+                document_type=_TYPE_MAP[max(type_confidences, key=type_confidences.__getitem__)],
+                confidence_score=type_confidences,
+                raw_response=content)
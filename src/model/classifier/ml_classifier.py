@@ -2,38 +2,63 @@
 Classical ML-based document classifier using traditional machine learning.
 """
 
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Tuple
 from pathlib import Path
+import logging
+import re
+import zlib
+
+import numpy as np
 
 from .base import BaseClassifier
-from ..types import DocumentType, ClassificationResult
+from ..types import DocumentType, ClassificationResult, DocumentContext
+from ..extractor.pdf_extractor import create_pdf_extractor
+
+logger = logging.getLogger(__name__)
+
+# Characters of document text used as classifier input
+MAX_DOCUMENT_CHARS = 5000
+
+_TOKEN_RE = re.compile(r"[a-z]{2,}")
+
+# Maps model labels to document types without going through the Enum constructor
+_TYPE_MAP = {doc_type.value: doc_type for doc_type in DocumentType}
+
+# Zero confidence for every document type, copied as the starting point of each result
+_EMPTY_CONFIDENCES = {doc_type.value: 0.0 for doc_type in DocumentType}
 
 
 class MLClassifier(BaseClassifier):
     """
     Document classifier using classical machine learning approaches.
     
-    This classifier uses traditional ML techniques like:
-    - TF-IDF + SVM/Random Forest
-    - Word embeddings + Neural Networks
-    - BERT-based models
-    - Ensemble methods
+    The "hashing_logreg" model hashes word unigrams into a fixed-size feature
+    vector (no vocabulary to store or load) and scores it with a multinomial
+    logistic regression, so a prediction is a single matrix-vector product.
+    It is cheap enough to run in front of the LLM classifier and answer the
+    easy documents on its own.
     """
     
-    def __init__(self, model_type: str = "tfidf_svm", **kwargs):
+    def __init__(self, model_type: str = "hashing_logreg", **kwargs):
         """
         Initialize the ML classifier.
         
         Args:
-            model_type: Type of ML model to use ("tfidf_svm", "bert", "ensemble")
-            **kwargs: Additional configuration parameters
+            model_type: Type of ML model to use (only "hashing_logreg" is implemented)
+            **kwargs: Additional configuration parameters (n_features, model_path)
         """
-        super().__init__()
+        super().__init__(kwargs.get("model_path"))
+        if model_type != "hashing_logreg":
+            raise ValueError(f"Unsupported ML model type: {model_type}")
         self.model_type = model_type
         self.config = kwargs
+        self.n_features = kwargs.get("n_features", 2 ** 16)
         self.model = None
-        self.vectorizer = None
         self.label_encoder = None
+        self.pdf_extractor = create_pdf_extractor()
+        
+        if self.model_path is not None:
+            self.load_model(self.model_path)
     
     def train(self, training_data: List[tuple], **kwargs) -> None:
         """
@@ -41,36 +66,123 @@ class MLClassifier(BaseClassifier):
         
         Args:
             training_data: List of (document_path, document_type) tuples
-            **kwargs: Additional training parameters (test_size, random_state, etc.)
+            **kwargs: Additional training parameters (epochs, learning_rate, l2)
+        """
+        texts = [self._get_document_text(path) for path, _ in training_data]
+        labels = [doc_type for _, doc_type in training_data]
+        self.train_on_texts(texts, labels, **kwargs)
+    
+    def train_on_texts(self, texts: List[str], labels: List[DocumentType],
+                       epochs: int = 200, learning_rate: float = 1.0, l2: float = 1e-4) -> None:
         """
-        # Implementation for ML model training
-        pass
+        Fit the logistic regression on already extracted document texts.
+        
+        Hashed features are kept sparse (the non-zero feature indices and
+        values of each text), so memory and the cost of each gradient step
+        grow with the number of distinct tokens rather than with
+        ``n_features`` per document.
+        
+        Args:
+            texts: Document texts
+            labels: Document type of each text
+            epochs: Number of full-batch gradient descent steps
+            learning_rate: Gradient descent step size
+            l2: L2 regularization strength
+        """
+        if not texts or len(texts) != len(labels):
+            raise ValueError("Training requires the same non-zero number of texts and labels")
+        
+        label_encoder = sorted({DocumentType(label).value for label in labels})
+        # A single class would always be predicted with confidence 1.0
+        if len(label_encoder) < 2:
+            raise ValueError("Training requires documents of at least two document types")
+        label_index = {value: i for i, value in enumerate(label_encoder)}
+        num_texts, num_classes = len(texts), len(label_encoder)
+        targets = np.zeros((num_texts, num_classes), dtype=np.float32)
+        for row, label in enumerate(labels):
+            targets[row, label_index[DocumentType(label).value]] = 1.0
+        
+        # Coordinate form of the sparse feature matrix: one (row, column, value) per non-zero
+        sparse_features = [self._sparse_features(text) for text in texts]
+        rows = np.repeat(np.arange(num_texts), [len(indices) for indices, _ in sparse_features])
+        columns = np.concatenate([indices for indices, _ in sparse_features])
+        values = np.concatenate([feature_values for _, feature_values in sparse_features])
+        
+        weights = np.zeros((self.n_features, num_classes), dtype=np.float32)
+        bias = np.zeros(num_classes, dtype=np.float32)
+        
+        for _ in range(epochs):
+            contributions = weights[columns] * values[:, None]
+            scores = np.stack([
+                np.bincount(rows, weights=contributions[:, c], minlength=num_texts) for c in range(num_classes)
+            ], axis=1)
+            probabilities = self._softmax(scores + bias)
+            error = (probabilities - targets) / num_texts
+            row_errors = error[rows] * values[:, None]
+            gradient = np.stack([
+                np.bincount(columns, weights=row_errors[:, c], minlength=self.n_features) for c in range(num_classes)
+            ], axis=1)
+            weights -= learning_rate * (gradient + l2 * weights).astype(np.float32)
+            bias -= learning_rate * error.sum(axis=0).astype(np.float32)
+        
+        self.label_encoder = label_encoder
+        self.model = (weights, bias)
+        self.is_trained = True
     
-    def predict(self, document_path: Union[str, Path]) -> ClassificationResult:
+    def predict(self, document_path: Union[str, Path, DocumentContext]) -> ClassificationResult:
         """
         Classify a document using trained ML model.
         
         Args:
-            document_path: Path to the document to classify
-            
+            document_path: Path to the document to classify, or its pre-extracted DocumentContext
+        
         Returns:
             ClassificationResult with predicted type and confidence
         """
-        # Implementation for ML-based classification
-        pass
+        return self.predict_text(self._get_document_text(document_path))
     
-    def predict_batch(self, document_paths: List[Union[str, Path]]) -> List[ClassificationResult]:
+    def predict_text(self, text: str) -> ClassificationResult:
         """
-        Classify multiple documents using trained ML model.
+        Classify already extracted document text.
         
         Args:
-            document_paths: List of document paths to classify
-            
+            text: Document text content
+        
         Returns:
-            List of ClassificationResult objects
+            ClassificationResult with per-type probabilities as confidence scores
         """
-        # Implementation for batch ML classification
-        pass
+        probabilities = self.predict_proba(text)
+        type_confidences = _EMPTY_CONFIDENCES.copy()
+        type_confidences.update(probabilities)
+        best = max(probabilities, key=probabilities.__getitem__)
+        return ClassificationResult(
+            document_type=_TYPE_MAP[best],
+            confidence_score=type_confidences,
+            raw_response=f"ml:{self.model_type}"
+        )
+    
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """
+        Compute class probabilities for a document text.
+        
+        Args:
+            text: Document text content
+        
+        Returns:
+            Mapping of document type value to probability
+        """
+        if not self.is_trained:
+            raise ValueError("Cannot predict with an untrained model")
+        weights, bias = self.model
+        indices, values = self._sparse_features(text)
+        probabilities = self._softmax(values @ weights[indices] + bias)
+        return dict(zip(self.label_encoder, probabilities.tolist()))
+    
+    def _get_document_text(self, document: Union[str, Path, DocumentContext]) -> str:
+        """Get the classifier input text, reusing already extracted text when available."""
+        if isinstance(document, DocumentContext):
+            return document.text_chunk(MAX_DOCUMENT_CHARS)
+        return self.pdf_extractor.extract_text_chunk(Path(document), max_chars=MAX_DOCUMENT_CHARS)
     
     def _extract_features(self, document_path: Path) -> Any:
         """
@@ -78,12 +190,29 @@ class MLClassifier(BaseClassifier):
         
         Args:
             document_path: Path to the document
-            
+        
         Returns:
             Feature vector for the document
         """
-        # Implementation for feature extraction
-        pass
+        return self._vectorize(self._get_document_text(document_path))
+    
+    def _vectorize(self, text: str) -> np.ndarray:
+        """Hash word counts into an L2-normalized, log-scaled feature vector."""
+        vector = np.zeros(self.n_features, dtype=np.float32)
+        indices, values = self._sparse_features(text)
+        vector[indices] = values
+        return vector
+    
+    def _sparse_features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the non-zero indices and values of the hashed feature vector of a text."""
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode()) % self.n_features for token in self._preprocess_text(text).split()),
+            dtype=np.int64
+        )
+        indices, counts = np.unique(hashes, return_counts=True)
+        values = np.log1p(counts).astype(np.float32)
+        norm = np.linalg.norm(values)
+        return indices, values / norm if norm else values
     
     def _preprocess_text(self, text: str) -> str:
         """
@@ -91,12 +220,11 @@ class MLClassifier(BaseClassifier):
         
         Args:
             text: Raw text content
-            
+        
         Returns:
             Preprocessed text
         """
-        # Implementation for text preprocessing
-        pass
+        return " ".join(_TOKEN_RE.findall(text[:MAX_DOCUMENT_CHARS].lower()))
     
     def _get_prediction_confidence(self, prediction_proba: List[float]) -> float:
         """
@@ -104,29 +232,45 @@ class MLClassifier(BaseClassifier):
         
         Args:
             prediction_proba: List of prediction probabilities
-            
+        
         Returns:
             Confidence score
         """
-        # Implementation for confidence calculation
-        pass
+        return float(max(prediction_proba)) if len(prediction_proba) else 0.0
+    
+    @staticmethod
+    def _softmax(scores: np.ndarray) -> np.ndarray:
+        """Row-wise softmax."""
+        scores = scores - scores.max(axis=-1, keepdims=True)
+        exp_scores = np.exp(scores)
+        return exp_scores / exp_scores.sum(axis=-1, keepdims=True)
     
     def save_model(self, path: Union[str, Path]) -> None:
         """
         Save the trained ML model to disk.
         
         Args:
-            path: Path where to save the model
+            path: Path where to save the model (.npz)
         """
-        # Implementation for model saving
-        pass
+        if not self.is_trained:
+            raise ValueError("Cannot save untrained model")
+        weights, bias = self.model
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, weights=weights, bias=bias, labels=np.array(self.label_encoder))
     
     def load_model(self, path: Union[str, Path]) -> None:
         """
         Load a trained ML model from disk.
         
         Args:
-            path: Path to the saved model
+            path: Path to the saved model (.npz)
         """
-        # Implementation for model loading
-        pass 
\ No newline at end of file
+        with np.load(Path(path)) as data:
+            self.model = (data["weights"], data["bias"])
+            self.label_encoder = data["labels"].tolist()
+        self.n_features = self.model[0].shape[0]
+        self.model_path = Path(path)
+        self.is_trained = True
+        logger.info(f"ML classifier loaded from: {path}")
@@ -2,17 +2,40 @@
 Configuration manager for the model package.
 """
 
-import json
+import copy
+from types import MappingProxyType
+
+import orjson
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 import logging
 
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 from .default_config import DEFAULT_CONFIG
 
 logger = logging.getLogger(__name__)
 
 
+def _merge_inplace(base: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """
+    Recursively merge ``update`` into ``base`` without copying the dicts of ``base``.
+    
+    New dict values are deep-copied, so later merges never mutate the caller's data.
+    """
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge_inplace(base[key], value)
+        elif isinstance(value, dict):
+            base[key] = copy.deepcopy(value)
+        else:
+            base[key] = value
+
+
 class ConfigManager:
     """
     Manages configuration for the model package.
@@ -28,7 +51,9 @@ class ConfigManager:
         Args:
             config_path: Path to configuration file (optional)
         """
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
+        # Merges update self.config in place, so the view only changes on reset
+        self._readonly = MappingProxyType(self.config)
         self.config_path = config_path
         
         if config_path and config_path.exists():
@@ -47,11 +72,10 @@ class ConfigManager:
         
         try:
             if config_path.suffix.lower() == '.json':
-                with open(config_path, 'r') as f:
-                    file_config = json.load(f)
+                file_config = orjson.loads(config_path.read_bytes())
             elif config_path.suffix.lower() in ['.yml', '.yaml']:
-                with open(config_path, 'r') as f:
-                    file_config = yaml.safe_load(f)
+                with open(config_path, 'rb') as f:
+                    file_config = yaml.load(f, Loader=YamlLoader)
             else:
                 logger.error(f"Unsupported configuration file format: {config_path.suffix}")
                 return
@@ -73,11 +97,10 @@ class ConfigManager:
             config_path.parent.mkdir(parents=True, exist_ok=True)
             
             if config_path.suffix.lower() == '.json':
-                with open(config_path, 'w') as f:
-                    json.dump(self.config, f, indent=2)
+                config_path.write_bytes(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
             elif config_path.suffix.lower() in ['.yml', '.yaml']:
                 with open(config_path, 'w') as f:
-                    yaml.dump(self.config, f, default_flow_style=False)
+                    yaml.dump(self.config, f, Dumper=YamlDumper, default_flow_style=False)
             else:
                 logger.error(f"Unsupported configuration file format: {config_path.suffix}")
                 return
@@ -87,19 +110,31 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
     
-    def get_config(self, section: Optional[str] = None) -> Dict[str, Any]:
+    def get_config(self, section: Optional[str] = None) -> Mapping[str, Any]:
         """
-        Get configuration or a specific section.
+        Get a read-only view of the configuration or a specific section.
+        
+        Views reflect later updates without copying; use
+        :meth:`get_mutable_copy` to get a dictionary that can be modified.
         
         Args:
             section: Configuration section to retrieve (optional)
             
         Returns:
-            Configuration dictionary or section
+            Read-only configuration mapping or section
         """
         if section:
-            return self.config.get(section, {})
-        return self.config.copy()
+            return MappingProxyType(self.config.get(section, {}))
+        return self._readonly
+    
+    def get_mutable_copy(self) -> Dict[str, Any]:
+        """
+        Get a deep copy of the configuration that callers may modify.
+        
+        Returns:
+            Configuration dictionary
+        """
+        return copy.deepcopy(self.config)
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """
@@ -115,7 +150,8 @@ class ConfigManager:
         """
         Reset configuration to default values.
         """
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
+        self._readonly = MappingProxyType(self.config)
         logger.info("Configuration reset to defaults")
     
     def _merge_config(self, new_config: Dict[str, Any]) -> None:
@@ -125,17 +161,7 @@ class ConfigManager:
         Args:
             new_config: New configuration to merge
         """
-        def merge_dicts(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
-            """Recursively merge dictionaries."""
-            result = base.copy()
-            for key, value in update.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = merge_dicts(result[key], value)
-                else:
-                    result[key] = value
-            return result
-        
-        self.config = merge_dicts(self.config, new_config)
+        _merge_inplace(self.config, new_config)
     
     def validate_config(self) -> list:
         """
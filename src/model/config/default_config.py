@@ -7,7 +7,18 @@ DEFAULT_CONFIG = {
         "type": "llm",  # "llm" or "ml"
         "model_name": "gpt-4",
         "confidence_threshold": 0.7,
-        "batch_size": 10
+        "batch_size": 10,
+        "max_concurrency": 16,
+        "group_size": 1,
+        "head_tokens": 1000,
+        "tail_tokens": 500,
+        "top_logprobs": 20,  # label alternatives returned by the LLM
+        "raw_responses": True,  # parse responses from raw JSON instead of SDK models
+        "extraction_processes": 0,  # PDF text extraction processes for predict_batch_offline
+        "fast_path": {
+            "model_path": None,  # trained MLClassifier (.npz) consulted before the LLM
+            "threshold": 0.9
+        }
     },
     "extractor": {
         "type": "llm",  # "llm" or "rule"
@@ -18,7 +29,10 @@ DEFAULT_CONFIG = {
             "currency",
             "parties"
         ],
-        "confidence_threshold": 0.6
+        "confidence_threshold": 0.6,
+        "batch_mode": "async",  # "async" (concurrent requests) or "offline" (OpenAI Batch API)
+        "page_workers": 0,  # processes extracting the pages of one PDF in parallel; 0 or 1 is serial
+        "pdf_backend": "pdfplumber"  # "pdfplumber" or "pdfium" (faster native text extraction)
     },
     "pipeline": {
         "enable_validation": True,
@@ -32,6 +46,15 @@ DEFAULT_CONFIG = {
         "temp_dir": "./temp",
         "output_dir": "./output"
     },
+    "api": {
+        "analysis_workers": None  # defaults to CPU count
+    },
+    "cache": {
+        "enabled": False,
+        "dir": "./.cache",  # relative to the project root
+        "extraction_ttl": 86400,  # seconds cached LLM entity extractions are reused
+        "analysis_ttl": 86400  # seconds cached analysis results are reused
+    },
     "logging": {
         "level": "INFO",
         "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -2,16 +2,48 @@
 Simple settings management for the smart document system.
 """
 
+import copy
 import os
 import yaml
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 import logging
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Repository root holding config.yaml and .env; relative configured paths resolve against it
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# ${VAR_NAME} references substituted from the environment
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Parsed configuration files keyed by (path, mtime_ns, size). Each entry also keeps
+# the environment variables substituted into it, so a changed variable forces a re-parse.
+# Entries are never handed out directly: every Settings instance gets its own deep copy.
+_PARSE_CACHE: Dict[Tuple[str, int, int], Tuple[Dict[str, Optional[str]], Dict[str, Any]]] = {}
+
+# Marks dot-path lookups that found no value in Settings._get_cache
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _load_env_file() -> None:
+    """Load environment variables from the project .env file once per process."""
+    env_file = PROJECT_ROOT / ".env"
+    if env_file.exists():
+        load_dotenv(env_file)
+        logger.info(f"Environment variables loaded from: {env_file}")
+    else:
+        logger.warning("No .env file found")
+
 
 class Settings:
     """
@@ -25,6 +57,9 @@ class Settings:
         Args:
             config_path: Path to YAML configuration file (optional)
         """
+        # Resolved dot-path lookups; settings are never modified after loading
+        self._get_cache: Dict[str, Any] = {}
+        
         # Load environment variables from .env file
         self._load_env_vars()
         
@@ -33,14 +68,7 @@ class Settings:
     
     def _load_env_vars(self):
         """Load environment variables from .env file."""
-        # Try to load from project root
-        project_root = Path(__file__).parent.parent.parent.parent
-        env_file = project_root / ".env"
-        if env_file.exists():
-            load_dotenv(env_file)
-            logger.info(f"Environment variables loaded from: {env_file}")
-        else:
-            logger.warning("No .env file found")
+        _load_env_file()
     
     def _load_config_file(self, config_path: Optional[Path] = None):
         """Load configuration from YAML file with environment variable substitution."""
@@ -48,21 +76,29 @@ class Settings:
             config_file = config_path
         else:
             # Try to load from project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            config_file = project_root / "config.yaml"
+            config_file = PROJECT_ROOT / "config.yaml"
         
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         
         try:
+            stat = config_file.stat()
+            cache_key = (str(config_file), stat.st_mtime_ns, stat.st_size)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None and all(os.getenv(name) == value for name, value in cached[0].items()):
+                self._config_data = copy.deepcopy(cached[1])
+                return
+            
             with open(config_file, 'r') as f:
                 content = f.read()
+            env_values = {name: os.getenv(name) for name in _ENV_VAR_RE.findall(content)} if '${' in content else {}
             
             # Substitute environment variables (${VAR_NAME} format)
             content = self._substitute_env_vars(content)
             
             # Load YAML
-            self._config_data = yaml.safe_load(content) or {}
+            self._config_data = yaml.load(content, Loader=YamlLoader) or {}
+            _PARSE_CACHE[cache_key] = (env_values, copy.deepcopy(self._config_data))
             logger.info(f"Configuration loaded from: {config_file}")
             
         except Exception as e:
@@ -70,13 +106,12 @@ class Settings:
             raise
     
     def _substitute_env_vars(self, content: str) -> str:
-        """Substitute environment variables in the content."""
-        def replace_var(match):
-            var_name = match.group(1)
-            return os.getenv(var_name, match.group(0))  # Return original if not found
-        
-        # Replace ${VAR_NAME} patterns
-        return re.sub(r'\$\{([^}]+)\}', replace_var, content)
+        """Substitute environment variables in the content, keeping unknown references as-is."""
+        # Most files reference no variables; a substring scan is cheaper than a regex pass
+        if '${' not in content:
+            return content
+        environ_get = os.environ.get
+        return _ENV_VAR_RE.sub(lambda match: environ_get(match.group(1), match.group(0)), content)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -89,15 +124,33 @@ class Settings:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config_data
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._lookup(key)
+        return default if value is _MISSING else value
+    
+    def get_path(self, key: str, default: str) -> Path:
+        """
+        Get a configured filesystem path, resolving relative paths against the project root.
         
-        for k in keys:
+        Args:
+            key: Configuration key (e.g., "cache.dir")
+            default: Path used if the key is not set
+            
+        Returns:
+            Absolute path, independent of the current working directory
+        """
+        return PROJECT_ROOT / Path(self.get(key) or default)
+    
+    def _lookup(self, key: str) -> Any:
+        """Walk the configuration along a dot-separated key, returning _MISSING if absent."""
+        value = self._config_data
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
-        
+                return _MISSING
         return value
     
     def __getattr__(self, name: str) -> Any:
@@ -111,24 +164,23 @@ class Settings:
         return self.get(key)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Return the entire configuration as a dictionary."""
-        return self._config_data.copy()
+        """Return a copy of the entire configuration that callers may modify freely."""
+        return copy.deepcopy(self._config_data)
 
 
-# Global settings instance
+# Settings installed by init_settings, served by get_settings instead of the default file
 _settings = None
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return _settings if _settings is not None else Settings()
 
 
 def init_settings(config_path: Optional[Path] = None) -> Settings:
     """Initialize settings with a specific config path."""
     global _settings
     _settings = Settings(config_path)
-    return _settings 
\ No newline at end of file
+    get_settings.cache_clear()
+    return _settings
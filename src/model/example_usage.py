@@ -92,23 +92,19 @@ def example_field_extractors():
     """Example of using specialized field extractors."""
     print("\n=== Field Extractors Example ===")
     
-    from model.extractor import DateExtractor, AmountExtractor, PartyExtractor
+    from model.extractor import CompositeFieldExtractor
     
-    # Initialize specialized extractors
-    date_extractor = DateExtractor()
-    amount_extractor = AmountExtractor()
-    party_extractor = PartyExtractor()
+    # Runs the date, amount, currency and party extractors over one text read
+    field_extractor = CompositeFieldExtractor()
     
     document_path = Path("resources/data/invoice1.pdf")
     if document_path.exists():
-        # Extract specific fields
-        date_result = date_extractor.extract(document_path)
-        amount_result = amount_extractor.extract(document_path)
-        party_result = party_extractor.extract(document_path)
+        result = field_extractor.extract(document_path)
         
-        print(f"Date extraction: {date_result}")
-        print(f"Amount extraction: {amount_result}")
-        print(f"Party extraction: {party_result}")
+        print(f"Date extraction: {result.metadata.document_date}")
+        print(f"Amount extraction: {result.metadata.total_amount}")
+        print(f"Currency extraction: {result.metadata.currency}")
+        print(f"Party extraction: {result.metadata.parties}")
 
 
 if __name__ == "__main__":
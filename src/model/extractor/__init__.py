@@ -2,36 +2,63 @@
 Metadata extraction models and utilities.
 """
 
-from .base import BaseExtractor
-from .base_pdf_extractor import BasePDFExtractor
-from .pdf_extractor import PDFExtractor
-from .llm_extractor import LLMExtractor
-from .rule_extractor import RuleExtractor
-from .field_extractors import (
-    DateExtractor,
-    AmountExtractor,
-    PartyExtractor,
-    CurrencyExtractor
-)
-from .entity_extractor import BaseEntityExtractor
-from .invoice_extractor import InvoiceExtractor
-from .contract_extractor import ContractExtractor
-from .report_extractor import ReportExtractor
-from .extractor_factory import ExtractorFactory
+import importlib
+
+# Submodule defining each public name. Submodules are imported on first attribute
+# access (PEP 562), so using one extractor does not load pdfplumber, the OpenAI
+# client and every other extractor with it.
+_EXPORTS = {
+    "BaseExtractor": ".base",
+    "BasePDFExtractor": ".base_pdf_extractor",
+    "PDFExtractor": ".pdf_extractor",
+    "PdfiumPDFExtractor": ".pdfium_extractor",
+    "create_pdf_extractor": ".pdf_extractor",
+    "LLMExtractor": ".llm_extractor",
+    "RuleExtractor": ".rule_extractor",
+    "BaseFieldExtractor": ".field_extractors",
+    "DateExtractor": ".field_extractors",
+    "AmountExtractor": ".field_extractors",
+    "PartyExtractor": ".field_extractors",
+    "CurrencyExtractor": ".field_extractors",
+    "CompositeFieldExtractor": ".field_extractors",
+    "BaseEntityExtractor": ".entity_extractor",
+    "InvoiceExtractor": ".invoice_extractor",
+    "ContractExtractor": ".contract_extractor",
+    "ReportExtractor": ".report_extractor",
+    "ExtractorFactory": ".extractor_factory"
+}
 
 __all__ = [
     "BaseExtractor",
     "BasePDFExtractor",
     "PDFExtractor",
+    "PdfiumPDFExtractor",
+    "create_pdf_extractor",
     "LLMExtractor", 
     "RuleExtractor",
+    "BaseFieldExtractor",
     "DateExtractor",
     "AmountExtractor",
     "PartyExtractor",
     "CurrencyExtractor",
+    "CompositeFieldExtractor",
     "BaseEntityExtractor",
     "InvoiceExtractor",
     "ContractExtractor",
     "ReportExtractor",
     "ExtractorFactory"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
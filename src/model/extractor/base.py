@@ -3,11 +3,13 @@ Base extractor interface for metadata extraction.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Dict, Any, List
 from pathlib import Path
 from datetime import datetime
+import os
 
-from ..types import ExtractedMetadata, ExtractionResult
+from ..types import ExtractedMetadata, ExtractionResult, DocumentContext
 
 
 class BaseExtractor(ABC):
@@ -29,13 +31,13 @@ class BaseExtractor(ABC):
         self.extraction_fields = []
     
     @abstractmethod
-    def extract(self, document_path: Union[str, Path], 
+    def extract(self, document_path: Union[str, Path, DocumentContext], 
                 document_type: str = None) -> ExtractionResult:
         """
         Extract metadata from a document.
         
         Args:
-            document_path: Path to the document
+            document_path: Path to the document, or its pre-extracted DocumentContext
             document_type: Type of document (if known)
             
         Returns:
@@ -43,20 +45,28 @@ class BaseExtractor(ABC):
         """
         pass
     
-    @abstractmethod
     def extract_batch(self, document_paths: List[Union[str, Path]], 
                      document_types: List[str] = None) -> List[ExtractionResult]:
         """
         Extract metadata from multiple documents.
         
+        Documents are processed concurrently on a thread pool, since PDF parsing
+        spends most of its time in I/O and C code that releases the GIL. Subclasses
+        whose ``extract`` is not thread-safe should override this method.
+        
         Args:
             document_paths: List of document paths
             document_types: List of document types (if known)
             
         Returns:
-            List of ExtractionResult objects
+            List of ExtractionResult objects, in input order
         """
-        pass
+        if not document_paths:
+            return []
+        types = list(document_types or [])
+        types += [None] * (len(document_paths) - len(types))
+        with ThreadPoolExecutor(max_workers=min(len(document_paths), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.extract, document_paths, types))
     
     def get_supported_fields(self) -> List[str]:
         """
@@ -92,6 +102,22 @@ class BaseExtractor(ABC):
         
         return errors
     
+    def _get_document_text(self, document: Union[str, Path, DocumentContext]) -> str:
+        """
+        Get the text of a document, reusing already extracted text when available.
+        
+        Args:
+            document: Path to the document or its pre-extracted DocumentContext
+            
+        Returns:
+            Document text content
+        """
+        if isinstance(document, DocumentContext):
+            if not document.full_text.strip():
+                raise ValueError(f"No text content extracted from PDF: {document.path}")
+            return document.full_text
+        return self._extract_text_from_pdf(Path(document))
+    
     def _extract_text_from_pdf(self, pdf_path: Path) -> str:
         """
         Extract text content from PDF for processing.
@@ -102,8 +128,8 @@ class BaseExtractor(ABC):
         Returns:
             Extracted text content
         """
-        # Implementation for PDF text extraction
-        pass
+        from .pdf_extractor import create_pdf_extractor
+        return create_pdf_extractor().extract_text(pdf_path)
     
     def _extract_tables_from_pdf(self, pdf_path: Path) -> List[Dict]:
         """
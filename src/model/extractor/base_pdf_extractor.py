@@ -3,13 +3,19 @@ Base class for PDF extraction operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Union, Dict, Any, List, Optional
+from typing import Union, Dict, Any, List, Optional, Callable, Iterator, Tuple
 from pathlib import Path
 import logging
+import os
 from model.types import DocumentType
+from ..config.settings import get_settings
+from ..utils.cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
+# Part of every extraction cache key; bump when extraction output changes to drop stale entries
+_CACHE_VERSION = 1
+
 
 class BasePDFExtractor(ABC):
     """
@@ -22,7 +28,61 @@ class BasePDFExtractor(ABC):
     
     def __init__(self):
         """Initialize the base PDF extractor."""
-        self.supported_formats = ['.pdf']
+        self.supported_formats = ('.pdf',)
+        self._text_cache = self._initialize_cache()
+    
+    def _initialize_cache(self) -> Optional[DiskCache]:
+        """Initialize the on-disk extraction cache if enabled in settings."""
+        settings = get_settings()
+        if not settings.get("cache.enabled", False):
+            return None
+        return DiskCache(settings.get_path("cache.dir", ".cache") / "pdf_text")
+    
+    def _cached(self, operation: str, pdf_path: Union[str, Path],
+                compute: Callable[[], Any], *params: Any,
+                should_cache: Callable[[Any], bool] = bool) -> Any:
+        """
+        Return a cached extraction result, computing and storing it on a miss.
+        
+        Entries are keyed by the extractor class and the resolved path,
+        modification time and size of the file, so edited files are
+        re-extracted and backends do not share results. Bumping
+        ``_CACHE_VERSION`` invalidates every entry. Empty results are not
+        cached.
+        
+        Args:
+            operation: Name of the extraction operation
+            pdf_path: Path to the PDF file
+            compute: Callable producing the result on a cache miss
+            *params: Additional parameters that affect the result
+            should_cache: Predicate deciding whether a computed result is stored
+                (defaults to storing non-empty results)
+            
+        Returns:
+            The cached or freshly computed result
+        """
+        if self._text_cache is None:
+            return compute()
+        
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            return compute()
+        
+        key = DiskCache.make_key(
+            _CACHE_VERSION, type(self).__name__, operation, Path(pdf_path).resolve(), stat.st_mtime_ns, stat.st_size, *params
+        )
+        value = self._text_cache.get(key)
+        if value is None:
+            value = compute()
+            if should_cache(value):
+                self._text_cache.set(key, value)
+        return value
+    
+    def clear_cache(self) -> None:
+        """Remove every cached extraction result from disk."""
+        if self._text_cache is not None:
+            self._text_cache.clear()
     
     @abstractmethod
     def extract_text(self, pdf_path: Union[str, Path]) -> str:
@@ -41,7 +101,50 @@ class BasePDFExtractor(ABC):
         """
         pass
     
+    def extract_all(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Extract text, page count and metadata of a PDF in one call.
+        
+        Backends that can read every property from a single open of the file
+        override this; the default delegates to the individual methods.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary with "text", "page_count" and "metadata" entries
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a valid PDF
+        """
+        return {
+            "text": self.extract_text(pdf_path),
+            "page_count": self.get_page_count(pdf_path),
+            "metadata": self.get_metadata(pdf_path)
+        }
+    
     @abstractmethod
+    def iter_page_texts(self, pdf_path: Union[str, Path]) -> Iterator[str]:
+        """
+        Lazily yield the text of a PDF one page at a time.
+        
+        Concatenating the yielded strings gives the text returned by
+        ``extract_text`` (before stripping), so callers that need only a
+        prefix can stop parsing early.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Iterator over page text segments
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a valid PDF
+        """
+        pass
+    
     def get_page_count(self, pdf_path: Union[str, Path]) -> int:
         """
         Get the number of pages in a PDF file.
@@ -52,13 +155,42 @@ class BasePDFExtractor(ABC):
         Returns:
             Number of pages in the PDF
         """
-        pass
+        return self._cached(
+            "page_count", pdf_path, lambda: self._get_page_count_internal(Path(pdf_path))
+        )
     
     @abstractmethod
+    def _get_page_count_internal(self, pdf_path: Path) -> int:
+        """
+        Internal method to count the pages of a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Number of pages in the PDF
+        """
+        pass
+    
     def get_metadata(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Extract metadata from PDF file properties.
         
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary containing PDF metadata
+        """
+        return self._cached(
+            "metadata", pdf_path, lambda: self._get_metadata_internal(Path(pdf_path))
+        )
+    
+    @abstractmethod
+    def _get_metadata_internal(self, pdf_path: Path) -> Dict[str, Any]:
+        """
+        Internal method to read metadata from PDF file properties.
+        
         Args:
             pdf_path: Path to the PDF file
             
@@ -82,7 +214,7 @@ class BasePDFExtractor(ABC):
         if not pdf_path.exists():
             return False
         
-        if not pdf_path.suffix.lower() in self.supported_formats:
+        if pdf_path.suffix.lower() not in self.supported_formats:
             return False
         
         return self._validate_pdf_internal(pdf_path)
@@ -112,8 +244,32 @@ class BasePDFExtractor(ABC):
         Returns:
             Extracted text content (truncated)
         """
-        full_text = self.extract_text(pdf_path)
-        return full_text[:max_chars]
+        return self._cached(
+            "text_chunk", pdf_path,
+            lambda: self._extract_text_chunk_internal(Path(pdf_path), max_chars),
+            max_chars
+        )
+    
+    def _extract_text_chunk_internal(self, pdf_path: Path, max_chars: int) -> str:
+        """
+        Internal method to extract truncated text content from a PDF.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            max_chars: Maximum number of characters to extract
+            
+        Returns:
+            Extracted text content (truncated)
+        """
+        # Stop parsing pages once enough text has been collected
+        page_texts = []
+        total = 0
+        for page_text in self.iter_page_texts(pdf_path):
+            page_texts.append(page_text)
+            total += len(page_text)
+            if total > max_chars:
+                break
+        return "".join(page_texts).strip()[:max_chars]
     
     def extract_tables(self, pdf_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """
@@ -145,11 +301,11 @@ class BasePDFExtractor(ABC):
         logger.warning("Image extraction not implemented in this extractor")
         return []
     
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> Tuple[str, ...]:
         """
-        Get list of supported file formats.
+        Get supported file formats.
         
         Returns:
-            List of supported file extensions
+            Immutable tuple of supported file extensions
         """
-        return self.supported_formats.copy() 
\ No newline at end of file
+        return self.supported_formats 
\ No newline at end of file
@@ -3,11 +3,12 @@ Specialized entity extractor for Contract documents.
 """
 
 from typing import Dict, Any, List
-import re, json
+import re
 from datetime import datetime
-from pathlib import Path
+
 from .entity_extractor import BaseEntityExtractor
 from ..types import DocumentType
+from ..utils.prompts import load_prompt
 
 
 class ContractExtractor(BaseEntityExtractor):
@@ -22,8 +23,6 @@ class ContractExtractor(BaseEntityExtractor):
     
     def __init__(self, llm_model: str = "gpt-4", api_key: str = None):
         super().__init__(DocumentType.CONTRACT, llm_model, api_key)
-        self._sys_prompt_path = Path(__file__).parent.parent.parent / "resources" / "prompts" / self._sys_prompt_name
-        self._user_prompt_path = Path(__file__).parent.parent.parent / "resources" / "prompts" / self._user_prompt_name
     
     def _setup_extraction_fields(self):
         """Setup extraction fields for contracts."""
@@ -59,54 +58,26 @@ class ContractExtractor(BaseEntityExtractor):
         #TODO implement extract rules for simpler entities (ex: date) when the time to fine tune a model
         return {}
     
-    def _extract_llm_entities(self, text_content: str, rule_based_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_llm_messages(self, text_content: str) -> List[Dict[str, str]]:
         """
-        Extract complex contract entities using LLM-based methods.
+        Build the chat messages asking the LLM for complex contract entities.
         
         Args:
             text_content: Extracted text from the contract
-            rule_based_results: Results from rule-based extraction
             
         Returns:
-            Dictionary of extracted entities
+            System and user messages for the extraction request
         """
-        # Create a specialized prompt for contract extraction
-        instruction = self._create_contract_extract_sys_prompt()
-        user_prompt = self._create_contract_extract_user_prompt(text_content)
-
-        # Call LLM with the contract extraction prompt
-        try:
-            response = self.llm_extractor.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": instruction},
-                    {"role": "user", "content": user_prompt}
-                ],
-                model=self.llm_extractor.model_name,
-                temperature=0.0,  # Use deterministic output for extraction
-                max_tokens=2048,  # Allow sufficient tokens for detailed extraction
-                timeout=self.settings.get('llm', {}).get('timeout', 30),
-                stream=False
-            )
-            
-            # Parse the JSON response
-            extracted_entities = json.loads(response.choices[0].message.content)
-            
-            # Merge with rule-based results, preferring LLM results for overlapping fields
-            #TODO here instead of merging, we should check if the LLM results are more accurate than the rule-based results
-            entities = {**rule_based_results, **extracted_entities}
-            
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"TODO add here a logging about JSONDecodeError: {str(e)}")
-            entities = rule_based_results.copy()  # Fall back to rule-based results
-        
-        return entities
+        return [
+            {"role": "system", "content": self._create_contract_extract_sys_prompt()},
+            {"role": "user", "content": self._create_contract_extract_user_prompt(text_content)}
+        ]
     
     def _create_contract_extract_sys_prompt(self, **kwargs) -> str:
         """Create specialized prompt for contract entity extraction."""
         # Load the system prompt template
         
-        with open(self._sys_prompt_path) as f:
-            prompt_template = f.read()
+        prompt_template = load_prompt(self._sys_prompt_name)
             
         # Format the prompt with the text content
         if kwargs:
@@ -120,8 +91,7 @@ class ContractExtractor(BaseEntityExtractor):
         """Create specialized prompt for contract entity extraction."""
         # Load the system prompt template
         
-        with open(self._user_prompt_path) as f:
-            prompt_template = f.read()
+        prompt_template = load_prompt(self._user_prompt_name)
 
         prompt = prompt_template.format(
             contract_text=text_content
@@ -3,18 +3,48 @@ Hybrid entity extraction system combining rule-based and LLM-based extraction.
 """
 
 from abc import ABC, abstractmethod
-from typing import Union, List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Union, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
+import asyncio
+import logging
+import os
 import time
 import re
+import threading
+
+import orjson
 import pdfplumber
 
 from .base import BaseExtractor
 from .llm_extractor import LLMExtractor
 from .field_extractors import DateExtractor, AmountExtractor, PartyExtractor, CurrencyExtractor
-from ..types import ExtractedMetadata, ExtractionResult, DocumentType
+from ..types import ExtractedMetadata, ExtractionResult, DocumentType, DocumentContext
 from ..config.settings import get_settings
+from ..utils.cache import DiskCache
+from ..utils.openai_batch import BATCH_POLL_INTERVAL, BATCH_MAX_POLL_INTERVAL, run_batch_job
+from ..utils.openai_client import create_async_openai_client
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+# Texts of recently read PDFs keyed by (resolved path, mtime_ns, size), shared by all
+# entity extractors so repeated extraction rounds on a document skip pdfplumber
+_PDF_TEXT_CACHE_SIZE = 128
+_pdf_text_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_pdf_text_cache_lock = threading.Lock()
+
+# PDFs longer than _SCANNED_MIN_PAGES whose first _SCANNED_PROBE_PAGES pages have
+# no characters are treated as scanned, without reading the remaining pages
+_SCANNED_MIN_PAGES = 5
+_SCANNED_PROBE_PAGES = 3
+
+# Reported in the result errors when only the rule-based fields could be extracted
+MALFORMED_LLM_RESPONSE_ERROR = "LLM response was not valid JSON; only rule-based fields were extracted"
 
 
 class BaseEntityExtractor(BaseExtractor):
@@ -46,17 +76,15 @@ class BaseEntityExtractor(BaseExtractor):
         if api_key is None:
             api_key = self.settings.get('openai', {}).get('api_key')
         
-        # Initialize specialized extractors
-        self.date_extractor = DateExtractor()
-        self.amount_extractor = AmountExtractor()
-        self.party_extractor = PartyExtractor()
-        self.currency_extractor = CurrencyExtractor()
         self.llm_extractor = LLMExtractor(model_name=llm_model, api_key=api_key)
+        self.response_cache = self._initialize_response_cache()
         
         # Define extraction fields for this document type
         self.rule_based_fields = []
         self.llm_based_fields = []
         self._setup_extraction_fields()
+        # Fields scored by _calculate_confidence_score, fixed once the subclass has set them up
+        self._all_fields = tuple(self.rule_based_fields) + tuple(self.llm_based_fields)
     
     @abstractmethod
     def _setup_extraction_fields(self):
@@ -81,97 +109,343 @@ class BaseEntityExtractor(BaseExtractor):
         pass
     
     @abstractmethod
-    def _extract_llm_entities(self, text_content: str, rule_based_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_llm_messages(self, text_content: str) -> List[Dict[str, str]]:
         """
-        Extract complex entities using LLM-based methods.
+        Build the chat messages asking the LLM for complex entities.
         Must be implemented by subclasses.
         
         Args:
             text_content: Extracted text from the document
-            rule_based_results: Results from rule-based extraction
             
         Returns:
-            Dictionary of extracted entities
+            Chat messages for the extraction request
         """
         pass
     
-    def extract(self, document_path: Union[str, Path], 
+    def _build_llm_request(self, text_content: str) -> Dict[str, Any]:
+        """
+        Build the chat completion request body for LLM entity extraction.
+        
+        Only API body fields are included, so the same body can be uploaded to
+        the Batch API; client options such as the timeout go in ``_llm_timeout``.
+        """
+        return dict(
+            messages=self._build_llm_messages(text_content),
+            model=self.llm_extractor.model_name,
+            temperature=0.0,  # Use deterministic output for extraction
+            max_tokens=2048,  # Allow sufficient tokens for detailed extraction
+            stream=False
+        )
+    
+    @property
+    def _llm_timeout(self) -> float:
+        """Seconds an interactive LLM extraction request may take."""
+        return self.settings.get('llm.timeout', 30)
+    
+    def _initialize_response_cache(self) -> Optional[DiskCache]:
+        """Initialize the on-disk cache of LLM extraction responses if enabled in settings."""
+        if not self.settings.get("cache.enabled", False):
+            return None
+        cache_dir = self.settings.get_path("cache.dir", ".cache") / "extractor_responses"
+        return DiskCache(cache_dir, ttl=self.settings.get("cache.extraction_ttl", 86400))
+    
+    def _get_cached_entities(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached LLM entities for a request, if any."""
+        if self.response_cache is None:
+            return None
+        cached = self.response_cache.get(self._cache_key(request))
+        if cached is not None:
+            logger.debug("Entity extraction cache hit")
+        return cached
+    
+    @staticmethod
+    def _cache_key(request: Dict[str, Any]) -> str:
+        """Build the response cache key from the model name and prompts."""
+        return DiskCache.make_key(
+            request["model"], *(message["content"] for message in request["messages"])
+        )
+    
+    def _parse_llm_entities(self, content: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Parse the entities of an LLM response, caching them on success.
+        
+        Args:
+            content: JSON message content returned by the LLM
+            request: Chat completion arguments the response answers
+            
+        Returns:
+            Dictionary of LLM-extracted entities, or None if the response is malformed
+        """
+        try:
+            extracted_entities = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            # Malformed model output: keep the rule-based fields. API and other
+            # errors propagate so extract() reports them in the result errors.
+            logger.warning(f"Could not parse LLM extraction response: {e}")
+            return None
+        
+        if self.response_cache is not None:
+            self.response_cache.set(self._cache_key(request), extracted_entities)
+        return extracted_entities
+    
+    @staticmethod
+    def _merge_llm_entities(rule_based_results: Dict[str, Any],
+                            extracted_entities: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
+        """Merge LLM entities over the rule-based ones, reporting a malformed LLM response as an error."""
+        if extracted_entities is None:
+            return dict(rule_based_results), [MALFORMED_LLM_RESPONSE_ERROR]
+        #TODO here instead of merging, we should check if the LLM results are more accurate than the rule-based results
+        return {**rule_based_results, **extracted_entities}, []
+    
+    def _extract_llm_entities(self, text_content: str,
+                              rule_based_results: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Extract complex entities using LLM-based methods.
+        
+        Responses are cached by model and prompts, so documents with the same
+        text are only sent to the LLM once.
+        
+        Args:
+            text_content: Extracted text from the document
+            rule_based_results: Results from rule-based extraction
+            
+        Returns:
+            Tuple of the extracted entities, preferring LLM results for overlapping
+            fields, and the errors to report (a malformed LLM response)
+        """
+        request = self._build_llm_request(text_content)
+        extracted_entities = self._get_cached_entities(request)
+        if extracted_entities is None:
+            response = self.llm_extractor.client.chat.completions.create(**request, timeout=self._llm_timeout)
+            extracted_entities = self._parse_llm_entities(response.choices[0].message.content, request)
+        return self._merge_llm_entities(rule_based_results, extracted_entities)
+    
+    async def _aextract_llm_entities(self, client: "AsyncOpenAI", text_content: str,
+                                     rule_based_results: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Async counterpart of _extract_llm_entities using the given async client."""
+        request = self._build_llm_request(text_content)
+        extracted_entities = self._get_cached_entities(request)
+        if extracted_entities is None:
+            response = await client.chat.completions.create(**request, timeout=self._llm_timeout)
+            extracted_entities = self._parse_llm_entities(response.choices[0].message.content, request)
+        return self._merge_llm_entities(rule_based_results, extracted_entities)
+    
+    @cached_property
+    def date_extractor(self) -> DateExtractor:
+        """Rule-based document date extractor."""
+        return DateExtractor()
+    
+    @cached_property
+    def amount_extractor(self) -> AmountExtractor:
+        """Rule-based total amount extractor."""
+        return AmountExtractor()
+    
+    @cached_property
+    def party_extractor(self) -> PartyExtractor:
+        """Rule-based party extractor."""
+        return PartyExtractor()
+    
+    @cached_property
+    def currency_extractor(self) -> CurrencyExtractor:
+        """Rule-based currency extractor."""
+        return CurrencyExtractor()
+    
+    def extract(self, document_path: Union[str, Path, DocumentContext], 
                 document_type: str = None) -> ExtractionResult:
         """
         Extract entities from a document using hybrid approach.
         
         Args:
-            document_path: Path to the document
+            document_path: Path to the document, or its pre-extracted DocumentContext
             document_type: Type of document (if known)
             
         Returns:
             ExtractionResult with extracted entities
         """
         start_time = time.time()
-        errors = []
         
         try:
             # Extract text from PDF
-            text_content = self._extract_text_from_pdf(Path(document_path))
+            text_content = self._get_document_text(document_path)
             
             # Step 1: Rule-based extraction for standard entities
             rule_based_results = self._extract_rule_based_entities(text_content)
             
             # Step 2: LLM-based extraction for complex entities
-            combined_results = self._extract_llm_entities(text_content, rule_based_results)
+            combined_results, errors = self._extract_llm_entities(text_content, rule_based_results)
             
-            # Step 4: Create metadata object
-            metadata = self._create_metadata(combined_results)
-            
-            # Step 5: Validate results
-            validation_errors = self.validate_metadata(metadata)
-            errors.extend(validation_errors)
-            
-            processing_time = time.time() - start_time
-            extraction_result = ExtractionResult(
-                metadata=metadata,
-                extraction_method="hybrid_entity_extraction", # TODO change it later depending on a mode of extraction, do as enum
-                processing_time=processing_time,
-                errors=errors
-            )
-
-            return extraction_result
+            return self._build_result(combined_results, start_time, errors)
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            errors.append(f"Extraction failed: {str(e)}")
-            
-            # Return empty metadata on error
-            metadata = ExtractedMetadata(
-                document_type=self.document_type,
-                confidence_score=0.0,
-                extraction_date=datetime.now()
-            )
+            return self._failed_result(str(e), start_time)
+    
+    async def aextract(self, document_path: Union[str, Path, DocumentContext],
+                       document_type: str = None,
+                       client: Optional["AsyncOpenAI"] = None) -> ExtractionResult:
+        """
+        Extract entities from a document without blocking the event loop.
+        
+        PDF reading runs in the default executor and the LLM request goes
+        through the async OpenAI client.
+        
+        Args:
+            document_path: Path to the document, or its pre-extracted DocumentContext
+            document_type: Type of document (if known)
+            client: Async OpenAI client to reuse (a new one is created when omitted)
             
-            return ExtractionResult(
-                metadata=metadata,
-                extraction_method="hybrid_entity_extraction",
-                processing_time=processing_time,
-                errors=errors
+        Returns:
+            ExtractionResult with extracted entities
+        """
+        if client is not None:
+            return await self._aextract(client, document_path)
+        async with self._initialize_async_client() as client:
+            return await self._aextract(client, document_path)
+    
+    async def _aextract(self, client: "AsyncOpenAI",
+                        document_path: Union[str, Path, DocumentContext]) -> ExtractionResult:
+        """Run the hybrid extraction of one document with the given async client."""
+        start_time = time.time()
+        try:
+            text_content = await asyncio.get_running_loop().run_in_executor(
+                None, self._get_document_text, document_path
             )
+            rule_based_results = self._extract_rule_based_entities(text_content)
+            combined_results, errors = await self._aextract_llm_entities(client, text_content, rule_based_results)
+            return self._build_result(combined_results, start_time, errors)
+        except Exception as e:
+            return self._failed_result(str(e), start_time)
+    
+    def _initialize_async_client(self) -> "AsyncOpenAI":
+        """Create an async OpenAI client for the configured API key."""
+        if not self.llm_extractor.api_key:
+            raise ValueError("No API key provided - LLM extraction will not work")
+        return create_async_openai_client(self.llm_extractor.api_key, self.settings.get("openai.base_url"))
+    
+    def _build_result(self, extracted_entities: Dict[str, Any], start_time: float,
+                      errors: List[str] = ()) -> ExtractionResult:
+        """Create and validate the extraction result for extracted entities, keeping the given errors."""
+        metadata = self._create_metadata(extracted_entities)
+        errors = list(errors) + self.validate_metadata(metadata)
+        
+        return ExtractionResult(
+            metadata=metadata,
+            extraction_method="hybrid_entity_extraction", # TODO change it later depending on a mode of extraction, do as enum
+            processing_time=time.time() - start_time,
+            errors=errors
+        )
+    
+    def _failed_result(self, error: str, start_time: float) -> ExtractionResult:
+        """Create an extraction result with empty metadata for a failed extraction."""
+        metadata = ExtractedMetadata(
+            document_type=self.document_type,
+            confidence_score=0.0,
+            extraction_date=datetime.now()
+        )
+        
+        return ExtractionResult(
+            metadata=metadata,
+            extraction_method="hybrid_entity_extraction",
+            processing_time=time.time() - start_time,
+            errors=[f"Extraction failed: {error}"]
+        )
     
     def extract_batch(self, document_paths: List[Union[str, Path]], 
                      document_types: List[str] = None) -> List[ExtractionResult]:
         """
         Extract entities from multiple documents.
         
+        LLM requests share one async OpenAI client and up to
+        ``llm.num_workers`` documents are in flight at once, with PDF reads
+        running in the default executor. Must not be called from within a
+        running event loop (use ``aextract`` there). With
+        ``extractor.batch_mode: offline`` the documents go through
+        ``extract_batch_offline`` instead.
+        
         Args:
             document_paths: List of document paths
             document_types: List of document types (if known)
             
         Returns:
-            List of ExtractionResult objects
+            List of ExtractionResult objects, in input order
+        """
+        if not document_paths:
+            return []
+        if self.settings.get("extractor.batch_mode", "async") == "offline":
+            return self.extract_batch_offline(document_paths)
+        return asyncio.run(self._aextract_batch(document_paths))
+    
+    async def _aextract_batch(self, document_paths: List[Union[str, Path]]) -> List[ExtractionResult]:
+        """Extract documents concurrently, bounded by ``llm.num_workers``."""
+        semaphore = asyncio.Semaphore(self.settings.get("llm.num_workers", 16))
+        
+        async def extract_one(client: "AsyncOpenAI", document_path: Union[str, Path]) -> ExtractionResult:
+            async with semaphore:
+                return await self._aextract(client, document_path)
+        
+        try:
+            client = self._initialize_async_client()
+        except ValueError as e:
+            start_time = time.time()
+            return [self._failed_result(str(e), start_time) for _ in document_paths]
+        
+        async with client:
+            return await asyncio.gather(*[extract_one(client, path) for path in document_paths])
+    
+    def extract_batch_offline(self, document_paths: List[Union[str, Path, DocumentContext]],
+                              poll_interval: float = BATCH_POLL_INTERVAL,
+                              max_poll_interval: float = BATCH_MAX_POLL_INTERVAL,
+                              timeout: Optional[float] = None) -> List[ExtractionResult]:
         """
-        results = []
-        for i, doc_path in enumerate(document_paths):
-            doc_type = document_types[i] if document_types and i < len(document_types) else None
-            result = self.extract(doc_path, doc_type)
-            results.append(result)
+        Extract entities from multiple documents through the OpenAI Batch API.
+        
+        Uncached LLM requests are uploaded as one JSONL job processed at a
+        reduced token price within the 24h completion window, so this suits
+        offline bulk extraction rather than interactive use.
+        
+        Args:
+            document_paths: List of document paths or pre-extracted DocumentContexts
+            poll_interval: Initial seconds between batch status checks, doubled after each check
+            max_poll_interval: Upper bound on the seconds between status checks
+            timeout: Seconds to wait before cancelling the batch (None waits indefinitely)
+            
+        Returns:
+            List of ExtractionResult objects, in input order
+        """
+        start_time = time.time()
+        results: List[Optional[ExtractionResult]] = [None] * len(document_paths)
+        prepared = {}
+        pending = {}
+        for index, document_path in enumerate(document_paths):
+            try:
+                text_content = self._get_document_text(document_path)
+                rule_based_results = self._extract_rule_based_entities(text_content)
+                request = self._build_llm_request(text_content)
+            except Exception as e:
+                results[index] = self._failed_result(str(e), start_time)
+                continue
+            cached = self._get_cached_entities(request)
+            prepared[index] = (rule_based_results, request, cached)
+            if cached is None:
+                pending[str(index)] = request
+        
+        bodies = {}
+        if pending:
+            bodies = run_batch_job(
+                self.llm_extractor.client, pending, "extraction", poll_interval, max_poll_interval, timeout
+            )
+        
+        for index, (rule_based_results, request, extracted_entities) in prepared.items():
+            if extracted_entities is None:
+                body = bodies.get(str(index))
+                if body is None:
+                    results[index] = self._failed_result(f"No batch output for {document_paths[index]}", start_time)
+                    continue
+                extracted_entities = self._parse_llm_entities(body["choices"][0]["message"]["content"], request)
+            try:
+                combined_results, errors = self._merge_llm_entities(rule_based_results, extracted_entities)
+                results[index] = self._build_result(combined_results, start_time, errors)
+            except Exception as e:
+                results[index] = self._failed_result(str(e), start_time)
         return results
     
     def _create_metadata(self, extracted_entities: Dict[str, Any]) -> ExtractedMetadata:
@@ -217,19 +491,21 @@ class BaseEntityExtractor(BaseExtractor):
         Returns:
             Confidence score between 0 and 1
         """
-        total_fields = len(self.rule_based_fields) + len(self.llm_based_fields)
-        if total_fields == 0:
+        if not self._all_fields:
             return 0.0
         
-        extracted_count = sum(1 for field in self.rule_based_fields + self.llm_based_fields 
-                            if field in extracted_entities and extracted_entities[field] is not None)
+        get = extracted_entities.get
+        extracted_count = sum(1 for field in self._all_fields if get(field) is not None)
         
-        return extracted_count / total_fields
+        return extracted_count / len(self._all_fields)
     
     def _extract_text_from_pdf(self, pdf_path: Path) -> str:
         """
         Extract text content from PDF for processing.
         
+        Texts are kept in a process-wide LRU cache, so a document is only
+        parsed again once the file changes.
+        
         Args:
             pdf_path: Path to the PDF file
             
@@ -239,14 +515,32 @@ class BaseEntityExtractor(BaseExtractor):
         # This would typically use a PDF processing library like PyPDF2 or pdfplumber
         # For now, we'll use a placeholder implementation
         try:
-            text_content = ""
+            stat = os.stat(pdf_path)
+            cache_key = (str(Path(pdf_path).resolve()), stat.st_mtime_ns, stat.st_size)
+            with _pdf_text_cache_lock:
+                text_content = _pdf_text_cache.get(cache_key)
+                if text_content is not None:
+                    _pdf_text_cache.move_to_end(cache_key)
+                    return text_content
+            
             with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text_content += page.extract_text() + "\n"
+                pages = pdf.pages
+                # Image-only (scanned) documents have no character objects; give up
+                # after a few pages instead of running layout analysis on every page
+                if len(pages) > _SCANNED_MIN_PAGES and not any(
+                    page.chars for page in pages[:_SCANNED_PROBE_PAGES]
+                ):
+                    raise Exception("No text layer found, the PDF looks scanned")
+                page_texts = [page.extract_text() or "" for page in pages]
+            text_content = "\n".join(page_texts) + "\n"
             
             if not text_content.strip():
                 raise Exception("No text content extracted from PDF")
-                
+            
+            with _pdf_text_cache_lock:
+                _pdf_text_cache[cache_key] = text_content
+                while len(_pdf_text_cache) > _PDF_TEXT_CACHE_SIZE:
+                    _pdf_text_cache.popitem(last=False)
             return text_content
             
         except Exception as e:
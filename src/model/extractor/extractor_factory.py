@@ -4,6 +4,7 @@ Factory for creating entity extractors based on document type.
 
 from typing import Optional
 from pathlib import Path
+import re
 
 from .entity_extractor import BaseEntityExtractor
 from .contract_extractor import ContractExtractor
@@ -12,6 +13,25 @@ from .report_extractor import ReportExtractor
 from ..types import DocumentType
 from ..config.settings import get_settings
 
+# Extractor class for each supported document type
+_EXTRACTOR_REGISTRY = {
+    DocumentType.INVOICE: InvoiceExtractor,
+    DocumentType.CONTRACT: ContractExtractor,
+    DocumentType.EARNINGS_REPORT: ReportExtractor,
+}
+
+# File name keywords hinting at a document type, scanned in a single pass
+_FILE_NAME_RE = re.compile(
+    r"(?P<invoice>invoice|bill)|(?P<contract>contract|agreement)|(?P<report>report|earnings)"
+)
+
+# Document type for each keyword group, in priority order when a name matches several
+_TYPE_BY_GROUP = {
+    "invoice": DocumentType.INVOICE,
+    "contract": DocumentType.CONTRACT,
+    "report": DocumentType.EARNINGS_REPORT,
+}
+
 
 class ExtractorFactory:
     """
@@ -33,23 +53,20 @@ class ExtractorFactory:
         Returns:
             Entity extractor instance
         """
-        # Get settings
-        settings = get_settings()
+        try:
+            extractor_class = _EXTRACTOR_REGISTRY[document_type]
+        except KeyError:
+            raise ValueError(f"Unsupported document type: {document_type}") from None
         
         # Use settings if not provided
-        if llm_model is None:
-            llm_model = settings.get_model_name()
-        if api_key is None:
-            api_key = settings.get_api_key()
+        if llm_model is None or api_key is None:
+            settings = get_settings()
+            if llm_model is None:
+                llm_model = settings.get("llm.model_name")
+            if api_key is None:
+                api_key = settings.get("openai.api_key")
         
-        if document_type == DocumentType.INVOICE:
-            return InvoiceExtractor(llm_model=llm_model, api_key=api_key)
-        elif document_type == DocumentType.CONTRACT:
-            return ContractExtractor(llm_model=llm_model, api_key=api_key)
-        elif document_type == DocumentType.EARNINGS_REPORT:
-            return ReportExtractor(llm_model=llm_model, api_key=api_key)
-        else:
-            raise ValueError(f"Unsupported document type: {document_type}")
+        return extractor_class(llm_model=llm_model, api_key=api_key)
     
     @staticmethod
     def create_extractor_from_file(file_path: Path, 
@@ -68,30 +85,16 @@ class ExtractorFactory:
         Returns:
             Entity extractor instance
         """
-        # Get settings
-        settings = get_settings()
-        
-        # Use settings if not provided
-        if llm_model is None:
-            llm_model = settings.get_model_name()
-        if api_key is None:
-            api_key = settings.get_api_key()
-        
         # If document type is provided, use it
         if document_type:
             return ExtractorFactory.create_extractor(document_type, llm_model, api_key)
         
         # Otherwise, try to infer from file content or extension
         # This is a simplified implementation - you might want to add more sophisticated detection
-        file_extension = file_path.suffix.lower()
-        file_name = file_path.name.lower()
+        matched_groups = {match.lastgroup for match in _FILE_NAME_RE.finditer(file_path.name.lower())}
+        for group, inferred_type in _TYPE_BY_GROUP.items():
+            if group in matched_groups:
+                return ExtractorFactory.create_extractor(inferred_type, llm_model, api_key)
         
-        if 'invoice' in file_name or 'bill' in file_name:
-            return InvoiceExtractor(llm_model=llm_model, api_key=api_key)
-        elif 'contract' in file_name or 'agreement' in file_name:
-            return ContractExtractor(llm_model=llm_model, api_key=api_key)
-        elif 'report' in file_name or 'earnings' in file_name:
-            return ReportExtractor(llm_model=llm_model, api_key=api_key)
-        else:
-            # Default to invoice extractor
-            return InvoiceExtractor(llm_model=llm_model, api_key=api_key) 
\ No newline at end of file
+        # Default to invoice extractor
+        return ExtractorFactory.create_extractor(DocumentType.INVOICE, llm_model, api_key)
@@ -3,109 +3,270 @@ Specialized field extractors for specific metadata types.
 """
 
 from abc import ABC, abstractmethod
-from typing import Union, List, Any, Optional
+from typing import Union, List, Any, Optional, Dict
 from pathlib import Path
 from datetime import datetime
+import time
 import re
 
 from .base import BaseExtractor
+from ..types import DocumentType, DocumentContext, ExtractedMetadata, ExtractionResult
 
+# Deletion table stripping currency symbols, codes, labels and thousands
+# separators from a matched amount; float() tolerates remaining whitespace
+_AMOUNT_DELETE = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit() and chr(c) != "."
+))
 
-class DateExtractor(BaseExtractor):
-    """Specialized extractor for date fields."""
+
+def _parse_amount(value: str) -> float:
+    """Convert a matched amount such as ``"Total: $1,234.56"`` to a float."""
+    return float(value.translate(_AMOUNT_DELETE))
+
+
+def _union_patterns(patterns: List[re.Pattern]) -> re.Pattern:
+    """
+    Combine patterns into a single alternation so text is scanned once.
+    
+    Each pattern becomes a named group ``g<index>`` so matches can be dispatched
+    on ``match.lastgroup``. Case-insensitive patterns keep their flag as a scoped
+    inline flag, leaving the other alternatives case-sensitive.
+    
+    Args:
+        patterns: Compiled patterns to combine
+        
+    Returns:
+        Compiled union pattern
+    """
+    alternatives = []
+    for index, pattern in enumerate(patterns):
+        body = f"(?i:{pattern.pattern})" if pattern.flags & re.IGNORECASE else pattern.pattern
+        alternatives.append(f"(?P<g{index}>{body})")
+    return re.compile("|".join(alternatives))
+
+
+class BaseFieldExtractor(BaseExtractor):
+    """
+    Base class for regex-based extractors of a single metadata field.
+    
+    Subclasses define their patterns and implement ``_extract_from_text``,
+    which scans the union of those patterns once per document.
+    """
     
     def __init__(self):
         super().__init__()
-        self.extraction_fields = ["document_date"]
+        patterns = self._get_patterns()
+        self._union = _union_patterns(patterns) if patterns else None
+    
+    @abstractmethod
+    def _get_patterns(self) -> List[re.Pattern]:
+        """Return the compiled patterns used by this extractor."""
+        pass
+    
+    @abstractmethod
+    def _extract_from_text(self, text: str) -> Dict[str, Any]:
+        """
+        Extract field values from already extracted document text.
+        
+        Args:
+            text: Document text content
+            
+        Returns:
+            Dictionary mapping field names to extracted values
+        """
+        pass
+    
+    def extract(self, document_path: Union[str, Path, DocumentContext], 
+                document_type: str = None) -> ExtractionResult:
+        """Extract field information from a document path or DocumentContext."""
+        start_time = time.time()
+        errors = []
+        
+        try:
+            fields = self._extract_from_text(self._get_document_text(document_path))
+        except Exception as e:
+            fields = {}
+            errors.append(f"Extraction failed: {str(e)}")
+        
+        try:
+            doc_type = DocumentType(document_type) if document_type else DocumentType.UNKNOWN
+        except ValueError:
+            doc_type = DocumentType.UNKNOWN
+        
+        found = sum(1 for field in self.extraction_fields if fields.get(field))
+        metadata = ExtractedMetadata(
+            document_type=doc_type,
+            confidence_score=found / len(self.extraction_fields),
+            extraction_date=datetime.now(),
+            **fields
+        )
+        
+        return ExtractionResult(
+            metadata=metadata,
+            extraction_method="rule_based",
+            processing_time=time.time() - start_time,
+            errors=errors
+        )
+
+
+class DateExtractor(BaseFieldExtractor):
+    """Specialized extractor for date fields."""
+    
+    def __init__(self):
         self.date_patterns = [
             re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
             re.compile(r'\b\d{4}-\d{2}-\d{2}\b'),
             re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b', re.IGNORECASE)
         ]
+        super().__init__()
+        self.extraction_fields = ["document_date"]
     
-    def extract(self, document_path: Union[str, Path], 
-                document_type: str = None):
-        """Extract date information from document."""
-        # Implementation for date extraction
-        pass
+    def _get_patterns(self) -> List[re.Pattern]:
+        return self.date_patterns
     
-    def extract_batch(self, document_paths: List[Union[str, Path]], 
-                     document_types: List[str] = None):
-        """Extract dates from multiple documents."""
-        # Implementation for batch date extraction
-        pass
+    def _extract_from_text(self, text: str) -> Dict[str, Any]:
+        """Return the first date in the text that parses successfully."""
+        for match in self._union.finditer(text):
+            parsed = self._parse_date(match.lastgroup, match.group())
+            if parsed is not None:
+                return {"document_date": parsed}
+        return {"document_date": None}
+    
+    @staticmethod
+    def _parse_date(group: str, value: str) -> Optional[datetime]:
+        """Parse a matched date string according to the pattern that matched it."""
+        if group == "g0":
+            value = value.replace("-", "/")
+            formats = ("%m/%d/%Y", "%d/%m/%Y", "%m/%d/%y", "%d/%m/%y")
+        elif group == "g1":
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        else:
+            value = value.replace(",", "")
+            formats = ("%B %d %Y", "%b %d %Y")
+        
+        for fmt in formats:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        return None
 
 
-class AmountExtractor(BaseExtractor):
+class AmountExtractor(BaseFieldExtractor):
     """Specialized extractor for monetary amounts."""
     
     def __init__(self):
-        super().__init__()
-        self.extraction_fields = ["total_amount"]
         self.amount_patterns = [
             re.compile(r'\$\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?'),
             re.compile(r'\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:USD|EUR|GBP)\b'),
             re.compile(r'\bTotal[:\s]*\$?\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?\b', re.IGNORECASE)
         ]
+        super().__init__()
+        self.extraction_fields = ["total_amount"]
     
-    def extract(self, document_path: Union[str, Path], 
-                document_type: str = None):
-        """Extract amount information from document."""
-        # Implementation for amount extraction
-        pass
+    def _get_patterns(self) -> List[re.Pattern]:
+        return self.amount_patterns
     
-    def extract_batch(self, document_paths: List[Union[str, Path]], 
-                     document_types: List[str] = None):
-        """Extract amounts from multiple documents."""
-        # Implementation for batch amount extraction
-        pass
+    def _extract_from_text(self, text: str) -> Dict[str, Any]:
+        """Return the first explicit total, falling back to the largest amount."""
+        amounts = []
+        for match in self._union.finditer(text):
+            amount = _parse_amount(match.group())
+            if match.lastgroup == "g2":
+                return {"total_amount": amount}
+            amounts.append(amount)
+        return {"total_amount": max(amounts) if amounts else None}
 
 
-class CurrencyExtractor(BaseExtractor):
+class CurrencyExtractor(BaseFieldExtractor):
     """Specialized extractor for currency information."""
     
+    # Currency implied by the symbol patterns, keyed by pattern group
+    _SYMBOL_CURRENCIES = {"g1": "USD", "g2": "EUR", "g3": "GBP"}
+    
     def __init__(self):
-        super().__init__()
-        self.extraction_fields = ["currency"]
         self.currency_patterns = [
             re.compile(r'\b(?:USD|EUR|GBP|CAD|AUD|JPY)\b'),
             re.compile(r'\$\s*\d'),
             re.compile(r'€\s*\d'),
             re.compile(r'£\s*\d')
         ]
+        super().__init__()
+        self.extraction_fields = ["currency"]
     
-    def extract(self, document_path: Union[str, Path], 
-                document_type: str = None):
-        """Extract currency information from document."""
-        # Implementation for currency extraction
-        pass
+    def _get_patterns(self) -> List[re.Pattern]:
+        return self.currency_patterns
     
-    def extract_batch(self, document_paths: List[Union[str, Path]], 
-                     document_types: List[str] = None):
-        """Extract currencies from multiple documents."""
-        # Implementation for batch currency extraction
-        pass
+    def _extract_from_text(self, text: str) -> Dict[str, Any]:
+        """Return the first currency code or symbol found in the text."""
+        match = self._union.search(text)
+        if match is None:
+            return {"currency": None}
+        return {"currency": self._SYMBOL_CURRENCIES.get(match.lastgroup, match.group())}
 
 
-class PartyExtractor(BaseExtractor):
+class PartyExtractor(BaseFieldExtractor):
     """Specialized extractor for party/entity information."""
     
     def __init__(self):
-        super().__init__()
-        self.extraction_fields = ["parties"]
         self.party_patterns = [
-            re.compile(r'\b(?:From|To|Seller|Buyer|Vendor|Client)[:\s]*(.+?)(?:\n|$)'),
+            re.compile(r'\b(?:From|To|Seller|Buyer|Vendor|Client)\b[:\s]*(.+?)(?:\n|$)'),
             re.compile(r'\b(?:Company|Corp|Inc|LLC|Ltd)\b', re.IGNORECASE)
         ]
+        super().__init__()
+        self.extraction_fields = ["parties"]
+        # Index of the party name capture group nested inside the first alternative
+        self._name_group = self._union.groupindex["g0"] + 1
     
-    def extract(self, document_path: Union[str, Path], 
-                document_type: str = None):
-        """Extract party information from document."""
-        # Implementation for party extraction
-        pass
+    def _get_patterns(self) -> List[re.Pattern]:
+        return self.party_patterns
+    
+    def _extract_from_text(self, text: str) -> Dict[str, Any]:
+        """Return the unique party names introduced by a role label."""
+        parties = []
+        for match in self._union.finditer(text):
+            if match.lastgroup != "g0":
+                continue
+            party = match.group(self._name_group).strip()
+            if party and party not in parties:
+                parties.append(party)
+        return {"parties": parties}
+
+
+class CompositeFieldExtractor(BaseFieldExtractor):
+    """
+    Runs all field extractors over a single read of the document text.
+    
+    Each sub-extractor would otherwise parse the PDF on its own; here the text
+    is extracted once and every extractor scans it with its pattern union.
+    """
+    
+    def __init__(self, extractors: List[BaseFieldExtractor] = None):
+        """
+        Initialize the composite extractor.
+        
+        Args:
+            extractors: Field extractors to combine (defaults to date, amount,
+                currency and party extractors)
+        """
+        self.extractors = extractors or [
+            DateExtractor(), AmountExtractor(), CurrencyExtractor(), PartyExtractor()
+        ]
+        super().__init__()
+        self.extraction_fields = [
+            field for extractor in self.extractors for field in extractor.extraction_fields
+        ]
+    
+    def _get_patterns(self) -> List[re.Pattern]:
+        # Patterns are scanned by the sub-extractors
+        return []
     
-    def extract_batch(self, document_paths: List[Union[str, Path]], 
-                     document_types: List[str] = None):
-        """Extract parties from multiple documents."""
-        # Implementation for batch party extraction
-        pass 
\ No newline at end of file
+    def _extract_from_text(self, text: str) -> Dict[str, Any]:
+        """Merge the fields extracted by every sub-extractor."""
+        fields = {}
+        for extractor in self.extractors:
+            fields.update(extractor._extract_from_text(text))
+        return fields
@@ -5,11 +5,10 @@ Specialized entity extractor for Invoice documents.
 from typing import Dict, Any, List
 import re
 from datetime import datetime
-from pathlib import Path
-import json
 
 from .entity_extractor import BaseEntityExtractor
 from ..types import DocumentType
+from ..utils.prompts import load_prompt
 
 
 class InvoiceExtractor(BaseEntityExtractor):
@@ -21,12 +20,11 @@ class InvoiceExtractor(BaseEntityExtractor):
     _document_type: DocumentType = DocumentType.INVOICE
     _sys_prompt_name: str = "invoice_entity_extract_system_prompt.txt"
     _user_prompt_name: str = "invoice_entity_extract_user_prompt.txt"
+    _instructions_prompt_name: str = "invoice_entity_extract_instructions_prompt.txt"
     
     
     def __init__(self, llm_model: str = "gpt-4", api_key: str = None):
         super().__init__(DocumentType.INVOICE, llm_model, api_key)
-        self._sys_prompt_path = Path(__file__).parent.parent.parent / "resources" / "prompts" / self._sys_prompt_name
-        self._user_prompt_path = Path(__file__).parent.parent.parent / "resources" / "prompts" / self._user_prompt_name
     
     def _setup_extraction_fields(self):
         """Setup extraction fields for invoices."""
@@ -146,61 +144,33 @@ class InvoiceExtractor(BaseEntityExtractor):
         
         return entities
     
-    def _extract_llm_entities(self, text_content: str, rule_based_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_llm_messages(self, text_content: str) -> List[Dict[str, str]]:
         """
-        Extract complex invoice entities using LLM-based methods.
+        Build the chat messages asking the LLM for complex invoice entities.
         
         Args:
             text_content: Extracted text from the invoice
-            rule_based_results: Results from rule-based extraction
             
         Returns:
-            Dictionary of extracted entities
+            System and user messages for the extraction request
         """
-        # Create a specialized prompt for invoice extraction
-        sys_prompt = self._create_invoice_extract_sys_prompt()
-        user_prompt = self._create_invoice_extract_user_prompt(text_content)
-        
-        # Use LLM to extract complex entities
-        try:
-            response = self.llm_extractor.client.chat.completions.create(
-                messages=[      
-                    {"role": "system", "content": sys_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                model=self.llm_extractor.model_name,
-                temperature=0.0,  # Use deterministic output for extraction
-                max_tokens=2048,  # Allow sufficient tokens for detailed extraction
-                timeout=self.settings.get('llm', {}).get('timeout', 30),
-                stream=False
-            )
-            extracted_entities = json.loads(response.choices[0].message.content)
-            entities = {**rule_based_results, **extracted_entities}
-        except Exception as e:
-            print(f"TODO add here a logging about Exception: {str(e)}")
-            entities = {**rule_based_results}
-
-        return entities
+        # Everything before the document text is identical across calls, so the
+        # provider can serve that prefix from its prompt cache
+        return [
+            {"role": "system", "content": self._create_invoice_extract_sys_prompt()},
+            {"role": "user", "content": load_prompt(self._instructions_prompt_name)},
+            {"role": "user", "content": self._create_invoice_extract_user_prompt(text_content)}
+        ]
     
     def _create_invoice_extract_sys_prompt(self, **kwargs) -> str:
         """Create specialized prompt for invoice entity extraction."""
-        with open(self._sys_prompt_path) as f:
-            prompt = f.read()
-
-        if kwargs:
-            prompt = prompt.format(**kwargs)
-        else:
-            prompt = prompt
-
-        return prompt
+        # Templates are read from disk once and cached by load_prompt
+        prompt = load_prompt(self._sys_prompt_name)
+        return prompt.format(**kwargs) if kwargs else prompt
     
     def _create_invoice_extract_user_prompt(self, text_content: str) -> str:
         """Create specialized prompt for invoice entity extraction."""
-        with open(self._user_prompt_path) as f:
-            prompt = f.read()
-
-        prompt = prompt.format(invoice_text=text_content)
-        return prompt
+        return load_prompt(self._user_prompt_name).format(invoice_text=text_content)
     
     def _extract_line_items_llm(self, text_content: str) -> List[Dict]:
         """Extract line items using LLM."""
@@ -2,17 +2,17 @@
 LLM-based metadata extractor using language models.
 """
 
-from typing import Union, List, Dict, Any
+from typing import Union, Dict, Any
 from pathlib import Path
 from datetime import datetime
 import os
 import json
 import logging
-from openai import OpenAI
 
 from .base import BaseExtractor
 from ..types import ExtractedMetadata, ExtractionResult
 from ..config.settings import get_settings
+from ..utils.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +61,7 @@ class LLMExtractor(BaseExtractor):
             return None
         
         try:
-            return OpenAI(api_key=self.api_key)
+            return get_openai_client(self.api_key, self.settings.get("openai.base_url"))
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             return None
@@ -81,21 +81,6 @@ class LLMExtractor(BaseExtractor):
         # Implementation for LLM-based extraction
         pass
     
-    def extract_batch(self, document_paths: List[Union[str, Path]], 
-                     document_types: List[str] = None) -> List[ExtractionResult]:
-        """
-        Extract metadata from multiple documents using LLM.
-        
-        Args:
-            document_paths: List of document paths
-            document_types: List of document types (if known)
-            
-        Returns:
-            List of ExtractionResult objects
-        """
-        # Implementation for batch LLM extraction
-        pass
-    
     def _create_extraction_prompt(self, text_content: str, 
                                  document_type: str = None) -> str:
         """
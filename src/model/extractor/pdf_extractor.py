@@ -2,15 +2,103 @@
 Concrete PDF extractor implementation using pdfplumber.
 """
 
-from typing import Union, Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, Dict, Any, List, Optional, Iterator
 from pathlib import Path
 import logging
+import multiprocessing
+import threading
 import pdfplumber
 
 from .base_pdf_extractor import BasePDFExtractor
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Shorter documents are parsed serially; process start-up and IPC cost more than they save
+MIN_PARALLEL_PAGES = 4
+
+# Process pools for page-parallel text extraction keyed by worker count, created on
+# first use. Workers are spawned rather than forked, since extraction is started from
+# threads (e.g. the API's analysis executor) and forking a threaded process is unsafe.
+_page_pools: Dict[int, ProcessPoolExecutor] = {}
+_page_pools_lock = threading.Lock()
+
+
+def _get_page_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared page extraction pool with max_workers processes, creating it on first use."""
+    with _page_pools_lock:
+        pool = _page_pools.get(max_workers)
+        if pool is None:
+            pool = _page_pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return pool
+
+
+def shutdown_page_pools() -> None:
+    """Shut down the page extraction process pools, waiting for running extractions."""
+    with _page_pools_lock:
+        pools = list(_page_pools.values())
+        _page_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+def _page_segments(pdf, start: int, stop: int) -> Iterator[str]:
+    """Yield the marked text of pages [start, stop) of an open pdfplumber document."""
+    for page_num in range(start, stop):
+        try:
+            page_text = pdf.pages[page_num].extract_text()
+        except Exception as e:
+            logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+            continue
+        if page_text:
+            yield f"\n--- Page {page_num + 1} ---\n{page_text}"
+
+
+def _metadata_dict(pdf) -> Dict[str, Any]:
+    """Build the metadata dictionary of an open pdfplumber document."""
+    metadata = pdf.metadata
+    if not metadata:
+        return {'page_count': len(pdf.pages)}
+    return {
+        'title': metadata.get('Title', ''),
+        'author': metadata.get('Author', ''),
+        'subject': metadata.get('Subject', ''),
+        'creator': metadata.get('Creator', ''),
+        'producer': metadata.get('Producer', ''),
+        'creation_date': metadata.get('CreationDate', ''),
+        'modification_date': metadata.get('ModDate', ''),
+        'page_count': len(pdf.pages)
+    }
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract the marked text of pages [start, stop) in a worker process."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return list(_page_segments(pdf, start, stop))
+
+
+def create_pdf_extractor(backend: Optional[str] = None) -> BasePDFExtractor:
+    """
+    Create the PDF extractor for a text extraction backend.
+    
+    Args:
+        backend: "pdfplumber" or "pdfium" (defaults to ``extractor.pdf_backend``)
+        
+    Returns:
+        PDF extractor instance
+    """
+    if backend is None:
+        backend = get_settings().get("extractor.pdf_backend", "pdfplumber")
+    if backend == "pdfium":
+        from .pdfium_extractor import PdfiumPDFExtractor
+        return PdfiumPDFExtractor()
+    if backend != "pdfplumber":
+        raise ValueError(f"Unsupported PDF backend: {backend}")
+    return PDFExtractor()
+
 
 class PDFExtractor(BasePDFExtractor):
     """
@@ -20,15 +108,26 @@ class PDFExtractor(BasePDFExtractor):
     from PDF documents using the pdfplumber library.
     """
     
-    def __init__(self):
-        """Initialize the PDF extractor."""
+    def __init__(self, page_workers: Optional[int] = None):
+        """
+        Initialize the PDF extractor.
+        
+        Args:
+            page_workers: Processes extracting the pages of one document in parallel
+                (defaults to ``extractor.page_workers``; 0 or 1 extracts serially)
+        """
         super().__init__()
         self._pdf_cache = {}  # Simple cache for PDF objects
+        if page_workers is None:
+            page_workers = get_settings().get("extractor.page_workers", 0)
+        self.page_workers = page_workers or 0
     
     def extract_text(self, pdf_path: Union[str, Path]) -> str:
         """
         Extract text content from a PDF file using pdfplumber.
         
+        Results are cached on disk per file version, see ``_cached``.
+        
         Args:
             pdf_path: Path to the PDF file
             
@@ -39,46 +138,132 @@ class PDFExtractor(BasePDFExtractor):
             FileNotFoundError: If PDF file doesn't exist
             ValueError: If file is not a valid PDF
         """
-        pdf_path = Path(pdf_path)
+        return self._cached("text", pdf_path, lambda: self._extract_text_internal(Path(pdf_path)))
+    
+    def _extract_text_internal(self, pdf_path: Path) -> str:
+        """Extract the full text of a PDF without going through the cache."""
+        page_texts = self.iter_page_texts(pdf_path)
         
+        try:
+            if self.page_workers > 1:
+                page_count = self.get_page_count(pdf_path)
+                if page_count >= MIN_PARALLEL_PAGES:
+                    page_texts = self._extract_page_texts_parallel(pdf_path, page_count)
+            return "".join(page_texts).strip()
+        except Exception as e:
+            logger.error(f"Error reading PDF {pdf_path}: {e}")
+            raise ValueError(f"Failed to extract text from PDF: {e}")
+    
+    def extract_all(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Extract text, page count and metadata while opening the PDF only once.
+        
+        Results of PDFs without any text are not cached, like ``extract_text``.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary with "text", "page_count" and "metadata" entries
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a valid PDF
+        """
+        return self._cached(
+            "all", pdf_path, lambda: self._extract_all_internal(Path(pdf_path)),
+            should_cache=lambda result: bool(result["text"].strip())
+        )
+    
+    def _extract_all_internal(self, pdf_path: Path) -> Dict[str, Any]:
+        """Extract every document property in a single pass, without going through the cache."""
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-        
-        if not self.validate_pdf(pdf_path):
+        if pdf_path.suffix.lower() not in self.supported_formats:
             raise ValueError(f"File is not a valid PDF: {pdf_path}")
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += f"\n--- Page {page_num + 1} ---\n"
-                            text += page_text
-                    except Exception as e:
-                        logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
-                        continue
-                
-                return text.strip()
-                
+            pdf = pdfplumber.open(pdf_path)
         except Exception as e:
-            logger.error(f"Error reading PDF {pdf_path}: {e}")
-            raise ValueError(f"Failed to extract text from PDF: {e}")
+            raise ValueError(f"File is not a valid PDF: {pdf_path}") from e
+        
+        with pdf:
+            page_count = len(pdf.pages)
+            try:
+                metadata = _metadata_dict(pdf)
+            except Exception as e:
+                logger.error(f"Error extracting metadata from {pdf_path}: {e}")
+                metadata = {}
+            if self.page_workers > 1 and page_count >= MIN_PARALLEL_PAGES:
+                page_texts = self._extract_page_texts_parallel(pdf_path, page_count)
+            else:
+                page_texts = _page_segments(pdf, 0, page_count)
+            text = "".join(page_texts).strip()
+        
+        return {"text": text, "page_count": page_count, "metadata": metadata}
     
-    def get_page_count(self, pdf_path: Union[str, Path]) -> int:
+    def iter_page_texts(self, pdf_path: Union[str, Path]) -> Iterator[str]:
         """
-        Get the number of pages in a PDF file.
+        Lazily yield the text of each page, prefixed with a page marker.
+        
+        The file is validated eagerly; pages are only parsed as the iterator
+        is consumed.
         
         Args:
             pdf_path: Path to the PDF file
             
         Returns:
-            Number of pages in the PDF
+            Iterator over page text segments
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a valid PDF
         """
         pdf_path = Path(pdf_path)
         
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        if not self.validate_pdf(pdf_path):
+            raise ValueError(f"File is not a valid PDF: {pdf_path}")
+        
+        return self._iter_page_texts(pdf_path)
+    
+    def _iter_page_texts(self, pdf_path: Path) -> Iterator[str]:
+        """Generator behind ``iter_page_texts``; opens the PDF on first use."""
+        with pdfplumber.open(pdf_path) as pdf:
+            yield from _page_segments(pdf, 0, len(pdf.pages))
+    
+    def _extract_page_texts_parallel(self, pdf_path: Path, page_count: int) -> List[str]:
+        """
+        Extract page texts with contiguous page ranges spread over the shared process pool.
+        
+        pdfplumber pages cannot be pickled, so each worker opens the file and
+        parses its own range; ranges are joined back in page order.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_count: Number of pages in the PDF
+            
+        Returns:
+            Marked page text segments, in page order
+        """
+        workers = min(self.page_workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        pool = _get_page_pool(self.page_workers)
+        ranges = pool.map(_extract_page_range, [str(pdf_path)] * workers, bounds[:-1], bounds[1:])
+        return [segment for segments in ranges for segment in segments]
+    
+    def _get_page_count_internal(self, pdf_path: Path) -> int:
+        """
+        Get the number of pages in a PDF file using pdfplumber.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Number of pages in the PDF
+        """
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 return len(pdf.pages)
@@ -86,9 +271,9 @@ class PDFExtractor(BasePDFExtractor):
             logger.error(f"Error getting page count for {pdf_path}: {e}")
             return 0
     
-    def get_metadata(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def _get_metadata_internal(self, pdf_path: Path) -> Dict[str, Any]:
         """
-        Extract metadata from PDF file properties.
+        Extract metadata from PDF file properties using pdfplumber.
         
         Args:
             pdf_path: Path to the PDF file
@@ -96,26 +281,9 @@ class PDFExtractor(BasePDFExtractor):
         Returns:
             Dictionary containing PDF metadata
         """
-        pdf_path = Path(pdf_path)
-        
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                metadata = pdf.metadata
-                
-                if metadata:
-                    return {
-                        'title': metadata.get('Title', ''),
-                        'author': metadata.get('Author', ''),
-                        'subject': metadata.get('Subject', ''),
-                        'creator': metadata.get('Creator', ''),
-                        'producer': metadata.get('Producer', ''),
-                        'creation_date': metadata.get('CreationDate', ''),
-                        'modification_date': metadata.get('ModDate', ''),
-                        'page_count': len(pdf.pages)
-                    }
-                else:
-                    return {'page_count': len(pdf.pages)}
-                    
+                return _metadata_dict(pdf)
         except Exception as e:
             logger.error(f"Error extracting metadata from {pdf_path}: {e}")
             return {}
@@ -225,45 +393,8 @@ class PDFExtractor(BasePDFExtractor):
             
         return image_paths
     
-    def extract_text_chunk(self, pdf_path: Union[str, Path], max_chars: int = 2000) -> str:
-        """
-        Extract text content from PDF, truncated to specified length.
-        Enhanced version with better text extraction using pdfplumber.
-        
-        Args:
-            pdf_path: Path to the PDF file
-            max_chars: Maximum number of characters to extract
-            
-        Returns:
-            Extracted text content (truncated)
-        """
-        pdf_path = Path(pdf_path)
-        
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                
-                for page in pdf.pages:
-                    try:
-                        # Use pdfplumber's enhanced text extraction
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                            
-                        # Stop if we've reached the character limit
-                        if len(text) >= max_chars:
-                            break
-                            
-                    except Exception as e:
-                        logger.warning(f"Error extracting text from page: {e}")
-                        continue
-                
-                return text[:max_chars].strip()
-                
-        except Exception as e:
-            logger.error(f"Error reading PDF {pdf_path}: {e}")
-            return ""
-    
     def clear_cache(self):
         """Clear the PDF cache."""
-        self._pdf_cache.clear() 
\ No newline at end of file
+        self._pdf_cache.clear()
+        if self._text_cache is not None:
+            self._text_cache.clear() 
\ No newline at end of file
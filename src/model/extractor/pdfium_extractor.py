@@ -0,0 +1,172 @@
+"""
+PDF extractor backed by PDFium through pypdfium2.
+"""
+
+from typing import Union, Dict, Any, Iterator
+from pathlib import Path
+import logging
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - installed with pdfplumber>=0.11
+    pdfium = None
+
+from .base_pdf_extractor import BasePDFExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class PdfiumPDFExtractor(BasePDFExtractor):
+    """
+    PDF extractor using the PDFium C library through pypdfium2.
+    
+    Text extraction runs in native code and skips pdfplumber's pure-Python
+    layout analysis, so it is much faster on text-heavy documents. Tables and
+    images are not supported; use PDFExtractor for those.
+    """
+    
+    def __init__(self):
+        """Initialize the PDFium extractor."""
+        if pdfium is None:
+            raise ImportError("pypdfium2 is required for the pdfium PDF backend")
+        super().__init__()
+    
+    def extract_text(self, pdf_path: Union[str, Path]) -> str:
+        """
+        Extract text content from a PDF file using PDFium.
+        
+        Results are cached on disk per file version, see ``_cached``.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Extracted text content
+        
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a valid PDF
+        """
+        return self._cached("text", pdf_path, lambda: self._extract_text_internal(Path(pdf_path)))
+    
+    def _extract_text_internal(self, pdf_path: Path) -> str:
+        """Extract the full text of a PDF without going through the cache."""
+        page_texts = self.iter_page_texts(pdf_path)
+        
+        try:
+            return "".join(page_texts).strip()
+        except Exception as e:
+            logger.error(f"Error reading PDF {pdf_path}: {e}")
+            raise ValueError(f"Failed to extract text from PDF: {e}")
+    
+    def iter_page_texts(self, pdf_path: Union[str, Path]) -> Iterator[str]:
+        """
+        Lazily yield the text of each page, prefixed with a page marker.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Iterator over page text segments
+        
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a valid PDF
+        """
+        pdf_path = Path(pdf_path)
+        
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        if not self.validate_pdf(pdf_path):
+            raise ValueError(f"File is not a valid PDF: {pdf_path}")
+        
+        return self._iter_page_texts(pdf_path)
+    
+    def _iter_page_texts(self, pdf_path: Path) -> Iterator[str]:
+        """Generator behind ``iter_page_texts``; opens the PDF on first use."""
+        document = pdfium.PdfDocument(pdf_path)
+        try:
+            for page_num in range(len(document)):
+                page = document[page_num]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_bounded().strip()
+                    finally:
+                        textpage.close()
+                except Exception as e:
+                    logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+                    continue
+                finally:
+                    page.close()
+                if page_text:
+                    yield f"\n--- Page {page_num + 1} ---\n{page_text}"
+        finally:
+            document.close()
+    
+    def _get_page_count_internal(self, pdf_path: Path) -> int:
+        """
+        Get the number of pages in a PDF file using PDFium.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Number of pages in the PDF
+        """
+        try:
+            document = pdfium.PdfDocument(pdf_path)
+        except Exception as e:
+            logger.error(f"Error getting page count for {pdf_path}: {e}")
+            return 0
+        try:
+            return len(document)
+        finally:
+            document.close()
+    
+    def _get_metadata_internal(self, pdf_path: Path) -> Dict[str, Any]:
+        """
+        Extract metadata from PDF file properties using PDFium.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Dictionary containing PDF metadata
+        """
+        try:
+            document = pdfium.PdfDocument(pdf_path)
+        except Exception as e:
+            logger.error(f"Error extracting metadata from {pdf_path}: {e}")
+            return {}
+        try:
+            metadata = document.get_metadata_dict(skip_empty=False)
+            return {
+                'title': metadata.get('Title', ''),
+                'author': metadata.get('Author', ''),
+                'subject': metadata.get('Subject', ''),
+                'creator': metadata.get('Creator', ''),
+                'producer': metadata.get('Producer', ''),
+                'creation_date': metadata.get('CreationDate', ''),
+                'modification_date': metadata.get('ModDate', ''),
+                'page_count': len(document)
+            }
+        finally:
+            document.close()
+    
+    def _validate_pdf_internal(self, pdf_path: Path) -> bool:
+        """
+        Internal method to validate PDF file structure using PDFium.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            True if file is a valid PDF, False otherwise
+        """
+        try:
+            pdfium.PdfDocument(pdf_path).close()
+            return True
+        except Exception:
+            return False
@@ -48,21 +48,6 @@ class RuleExtractor(BaseExtractor):
         # Implementation for rule-based extraction
         pass
     
-    def extract_batch(self, document_paths: List[Union[str, Path]], 
-                     document_types: List[str] = None) -> List[ExtractionResult]:
-        """
-        Extract metadata from multiple documents using rules.
-        
-        Args:
-            document_paths: List of document paths
-            document_types: List of document types (if known)
-            
-        Returns:
-            List of ExtractionResult objects
-        """
-        # Implementation for batch rule-based extraction
-        pass
-    
     def _load_patterns(self) -> Dict[str, List[re.Pattern]]:
         """
         Load regex patterns for different metadata fields.
@@ -7,8 +7,8 @@ from pathlib import Path
 from datetime import datetime
 
 from .classifier import BaseClassifier, LLMClassifier, MLClassifier
-from .extractor import BaseExtractor, LLMExtractor, RuleExtractor
-from .types import DocumentType, ExtractedMetadata, ClassificationResult, ExtractionResult
+from .extractor import BaseExtractor, LLMExtractor, RuleExtractor, create_pdf_extractor
+from .types import DocumentType, ExtractedMetadata, ClassificationResult, ExtractionResult, DocumentContext
 
 
 class DocumentPipeline:
@@ -37,6 +37,7 @@ class DocumentPipeline:
         self.extractor = extractor
         self.config = config or {}
         self.processing_history = []
+        self.pdf_extractor = create_pdf_extractor()
     
     def process_single(self, document_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -48,8 +49,17 @@ class DocumentPipeline:
         Returns:
             Dictionary containing classification and extraction results
         """
-        # Implementation for single document processing
-        pass
+        # Parse the PDF once and share the text between both stages
+        context = DocumentContext.from_pdf(document_path, self.pdf_extractor)
+        
+        classification_result = self.classify_document(context)
+        extraction_result = self.extract_metadata(context, classification_result.document_type)
+        
+        return {
+            "document_path": str(context.path),
+            "classification": classification_result,
+            "extraction": extraction_result
+        }
     
     def process_batch(self, document_paths: List[Union[str, Path]]) -> List[Dict[str, Any]]:
         """
@@ -64,12 +74,12 @@ class DocumentPipeline:
         # Implementation for batch processing
         pass
     
-    def classify_document(self, document_path: Union[str, Path]) -> ClassificationResult:
+    def classify_document(self, document_path: Union[str, Path, DocumentContext]) -> ClassificationResult:
         """
         Classify a single document.
         
         Args:
-            document_path: Path to the document
+            document_path: Path to the document, or its pre-extracted DocumentContext
             
         Returns:
             ClassificationResult
@@ -77,16 +87,15 @@ class DocumentPipeline:
         if not self.classifier:
             raise ValueError("No classifier configured")
         
-        # Implementation for document classification
-        pass
+        return self.classifier.predict(document_path)
     
-    def extract_metadata(self, document_path: Union[str, Path], 
+    def extract_metadata(self, document_path: Union[str, Path, DocumentContext], 
                         document_type: DocumentType = None) -> ExtractionResult:
         """
         Extract metadata from a document.
         
         Args:
-            document_path: Path to the document
+            document_path: Path to the document, or its pre-extracted DocumentContext
             document_type: Known document type (if available)
             
         Returns:
@@ -95,8 +104,7 @@ class DocumentPipeline:
         if not self.extractor:
             raise ValueError("No extractor configured")
         
-        # Implementation for metadata extraction
-        pass
+        return self.extractor.extract(document_path, document_type.value if document_type else None)
     
     def validate_results(self, classification_result: ClassificationResult,
                         extraction_result: ExtractionResult) -> List[str]:
@@ -2,11 +2,12 @@
 Type definitions for document classification and metadata extraction.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
+from pathlib import Path
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DocumentType(Enum):
@@ -19,6 +20,8 @@ class DocumentType(Enum):
 
 class Action(BaseModel):
     """Model for document actions."""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     title: str
     description: Optional[str] = None
@@ -62,6 +65,23 @@ class ClassificationResult:
     def __post_init__(self):
         if self.raw_response is None:
             self.raw_response = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "document_type": self.document_type.value,
+            "confidence_score": dict(self.confidence_score),
+            "raw_response": self.raw_response
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClassificationResult":
+        """Rebuild a ClassificationResult from :meth:`to_dict` output."""
+        return cls(
+            document_type=DocumentType(data["document_type"]),
+            confidence_score=data["confidence_score"],
+            raw_response=data.get("raw_response")
+        )
 
 
 @dataclass
@@ -74,4 +94,41 @@ class ExtractionResult:
     
     def __post_init__(self):
         if self.errors is None:
-            self.errors = [] 
\ No newline at end of file
+            self.errors = [] 
+
+
+@dataclass
+class DocumentContext:
+    """
+    Text and properties of a document, extracted once and shared by the
+    classifier and the extractors so the PDF is only parsed a single time.
+    """
+    path: Path
+    full_text: str
+    page_count: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def text_chunk(self, max_chars: int) -> str:
+        """Return the first ``max_chars`` characters of the document text."""
+        return self.full_text[:max_chars]
+    
+    @classmethod
+    def from_pdf(cls, pdf_path, pdf_extractor) -> "DocumentContext":
+        """
+        Build a context by extracting a PDF once.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pdf_extractor: PDF extractor providing text, page count and metadata
+            
+        Returns:
+            DocumentContext for the PDF
+        """
+        pdf_path = Path(pdf_path)
+        extracted = pdf_extractor.extract_all(pdf_path)
+        return cls(
+            path=pdf_path,
+            full_text=extracted["text"],
+            page_count=extracted["page_count"],
+            metadata=extracted["metadata"]
+        )
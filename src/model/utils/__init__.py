@@ -6,6 +6,11 @@ from .pdf_utils import extract_text_from_pdf, extract_tables_from_pdf
 from .text_utils import preprocess_text, normalize_text
 from .validation import validate_document_path, validate_metadata
 from .document_store import DocumentStore
+from .cache import DiskCache
+from .openai_client import get_openai_client, create_async_openai_client
+from .openai_batch import run_batch_job
+from .rate_limiter import RateLimiter
+from .prompts import load_prompt
 
 __all__ = [
     "extract_text_from_pdf",
@@ -14,5 +19,11 @@ __all__ = [
     "normalize_text",
     "validate_document_path",
     "validate_metadata",
-    "DocumentStore"
+    "DocumentStore",
+    "DiskCache",
+    "get_openai_client",
+    "create_async_openai_client",
+    "run_batch_job",
+    "RateLimiter",
+    "load_prompt"
 ] 
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Disk-backed cache for expensive, deterministic results (LLM responses, parsed text).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    A simple key/value cache that persists JSON-serializable values to disk.
+    
+    Each entry is stored as its own JSON file named after the key, so the cache
+    survives process restarts and can be shared between workers.
+    """
+    
+    def __init__(self, cache_dir: str = ".cache", ttl: Optional[float] = None):
+        """
+        Initialize the disk cache.
+        
+        Args:
+            cache_dir: Directory to store cache entries (relative to current working directory)
+            ttl: Seconds after which an entry is treated as a miss (None keeps entries forever)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key by hashing the given parts with BLAKE2b.
+        
+        Args:
+            *parts: Values identifying the cached computation
+            
+        Returns:
+            Hex digest usable as a cache key
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            hasher.update(str(part).encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Retrieve a cached value.
+        
+        Args:
+            key: The cache key
+            default: Value returned on a cache miss
+            
+        Returns:
+            The cached value or default if not found
+        """
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                if self.ttl is not None and time.time() - os.fstat(f.fileno()).st_mtime > self.ttl:
+                    return default
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            logger.warning(f"Failed to read cache entry {key}: {e}")
+            return default
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: The cache key
+            value: JSON-serializable value to store
+        """
+        # Write to a temporary file first so concurrent readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    def delete(self, key: str) -> bool:
+        """
+        Remove an entry from the cache.
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            True if an entry was removed, False if not found
+        """
+        try:
+            self._entry_path(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry in self.cache_dir.glob("*.json"):
+            entry.unlink(missing_ok=True)
+    
+    def __contains__(self, key: str) -> bool:
+        return self._entry_path(key).exists()
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
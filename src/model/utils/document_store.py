@@ -4,10 +4,12 @@ Document store for persisting and retrieving document analysis results.
 
 import json
 import os
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,17 +18,29 @@ logger = logging.getLogger(__name__)
 class DocumentStore:
     """
     A simple document store that persists analysis results to JSON files.
+    
+    Recently read results are kept in a bounded in-memory LRU cache so
+    repeated reads of the same document skip the file read and JSON parse.
+    Each hit is checked against the file's mtime and size, so results
+    overwritten or deleted by another process (e.g. another API worker) are
+    never served stale. Cached results are shared between callers and must
+    not be mutated.
     """
     
-    def __init__(self, storage_dir: str = "data/document_store"):
+    def __init__(self, storage_dir: str = "data/document_store", cache_size: int = 1024):
         """
         Initialize the document store.
         
         Args:
             storage_dir: Directory to store JSON files (relative to current working directory)
+            cache_size: Maximum number of analysis results kept in memory (0 disables caching)
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        # document_id -> ((mtime_ns, size) of the file when read, result)
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         logger.info(f"Document store initialized at: {self.storage_dir.absolute()}")
     
     def store_analysis(self, analysis_result: Dict[str, Any], document_id: Optional[str] = None) -> str:
@@ -55,6 +69,7 @@ class DocumentStore:
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(analysis_result, f, indent=2, ensure_ascii=False)
             
+            self._evict(document_id)
             logger.info(f"Stored analysis result for document ID: {document_id}")
             return document_id
             
@@ -75,14 +90,25 @@ class DocumentStore:
         filename = f"{document_id}.json"
         file_path = self.storage_dir / filename
         
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._evict(document_id)
             logger.warning(f"Analysis result not found for document ID: {document_id}")
             return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._cache_lock:
+            entry = self._cache.get(document_id)
+            if entry is not None and entry[0] == version:
+                self._cache.move_to_end(document_id)
+                return entry[1]
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 result = json.load(f)
             
+            self._remember(document_id, version, result)
             logger.info(f"Retrieved analysis result for document ID: {document_id}")
             return result
             
@@ -136,6 +162,7 @@ class DocumentStore:
         """
         filename = f"{document_id}.json"
         file_path = self.storage_dir / filename
+        self._evict(document_id)
         
         if not file_path.exists():
             logger.warning(f"Analysis result not found for deletion: {document_id}")
@@ -165,4 +192,19 @@ class DocumentStore:
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "storage_directory": str(self.storage_dir.absolute())
-        } 
\ No newline at end of file
+        } 
+    
+    def _remember(self, document_id: str, version: Tuple[int, int], result: Dict[str, Any]) -> None:
+        """Add a result read from a file version to the LRU cache, evicting the least recently used one when full."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[document_id] = (version, result)
+            self._cache.move_to_end(document_id)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _evict(self, document_id: str) -> None:
+        """Drop a document from the LRU cache."""
+        with self._cache_lock:
+            self._cache.pop(document_id, None)
@@ -0,0 +1,89 @@
+"""
+Submission and polling of OpenAI Batch API jobs.
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+import orjson
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+# Initial and maximum seconds between batch status checks
+BATCH_POLL_INTERVAL = 10.0
+BATCH_MAX_POLL_INTERVAL = 300.0
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def run_batch_job(client: "OpenAI", requests: Dict[str, Dict[str, Any]], name: str = "batch",
+                  poll_interval: float = BATCH_POLL_INTERVAL,
+                  max_poll_interval: float = BATCH_MAX_POLL_INTERVAL,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Upload chat completion requests as a Batch API job, wait for it and download its output.
+
+    Args:
+        client: OpenAI client used for the Files and Batches APIs
+        requests: Chat completion request parameters keyed by custom id
+        name: Job name used for the uploaded file and in log and error messages
+        poll_interval: Initial seconds between status checks, doubled after each check
+        max_poll_interval: Upper bound on the seconds between status checks
+        timeout: Seconds to wait before cancelling the batch (None waits indefinitely)
+
+    Returns:
+        Successful chat completion response bodies keyed by custom id
+    """
+    lines = b"".join(
+        orjson.dumps({"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": request}) + b"\n"
+        for custom_id, request in requests.items()
+    )
+    input_file = client.files.create(file=(f"{name}_batch.jsonl", lines), purpose="batch")
+    batch = client.batches.create(input_file_id=input_file.id, endpoint=BATCH_ENDPOINT, completion_window="24h")
+    logger.info(f"Submitted {name} batch {batch.id} with {len(requests)} requests")
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while batch.status not in _BATCH_TERMINAL_STATUSES:
+        if deadline is not None and time.monotonic() >= deadline:
+            client.batches.cancel(batch.id)
+            raise TimeoutError(f"{name.capitalize()} batch {batch.id} did not finish within {timeout}s")
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max_poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"{name.capitalize()} batch {batch.id} ended with status: {batch.status}")
+
+    # Requests that failed are written to a separate error file, not to the output file
+    if batch.error_file_id:
+        for entry in _read_jsonl(client, batch.error_file_id):
+            _log_failed_request(entry)
+
+    bodies = {}
+    if batch.output_file_id:
+        for entry in _read_jsonl(client, batch.output_file_id):
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                bodies[entry["custom_id"]] = response["body"]
+            else:
+                _log_failed_request(entry)
+    return bodies
+
+
+def _read_jsonl(client: "OpenAI", file_id: str) -> Iterator[Dict[str, Any]]:
+    """Download a Batch API JSONL file and yield its entries."""
+    for line in client.files.content(file_id).text.splitlines():
+        if line.strip():
+            yield orjson.loads(line)
+
+
+def _log_failed_request(entry: Dict[str, Any]) -> None:
+    """Log the error of a failed Batch API request entry."""
+    response = entry.get("response") or {}
+    error = entry.get("error") or (response.get("body") or {}).get("error") or response
+    logger.error(f"Batch request {entry.get('custom_id')} failed: {error}")
@@ -0,0 +1,99 @@
+"""
+Shared OpenAI client construction.
+
+Clients own an HTTP connection pool, so a single sync client per
+(API key, base URL) is shared process-wide and TLS sessions survive across
+classifier and extractor instances.
+"""
+
+import importlib.util
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - installed with openai>=1.0
+    httpx = None
+
+from ..config.settings import get_settings
+
+if TYPE_CHECKING:
+    # The SDK pulls in hundreds of modules, so it is only imported once a client is built
+    from openai import OpenAI, AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+
+def _http_transport_options() -> Dict[str, Any]:
+    """
+    Build connection options for the httpx transports used by the OpenAI clients.
+
+    Keep-alive connections are kept for every allowed connection so concurrent
+    requests reuse TLS sessions, and idle ones survive ``keepalive_expiry``
+    seconds (httpx closes them after 5s by default) so the pool stays warm
+    between batch waves. HTTP/2 multiplexing is enabled when the ``h2``
+    package is installed.
+    """
+    settings = get_settings()
+    max_connections = settings.get("openai.max_connections", 64)
+    return dict(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=settings.get("openai.keepalive_expiry", 60)
+        ),
+        retries=2
+    )
+
+
+def _create_http_client() -> Optional["httpx.Client"]:
+    """Create a tuned sync httpx client, or None to use the OpenAI default."""
+    if httpx is None:
+        return None
+    return httpx.Client(transport=httpx.HTTPTransport(**_http_transport_options()))
+
+
+def _create_async_http_client() -> Optional["httpx.AsyncClient"]:
+    """Create a tuned async httpx client, or None to use the OpenAI default."""
+    if httpx is None:
+        return None
+    return httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(**_http_transport_options()))
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> "OpenAI":
+    """
+    Get the process-wide OpenAI client for an API key and base URL.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: Alternative API base URL (optional)
+
+    Returns:
+        Shared OpenAI client
+    """
+    from openai import OpenAI
+    
+    logger.debug("Creating shared OpenAI client")
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=_create_http_client())
+
+
+def create_async_openai_client(api_key: str, base_url: Optional[str] = None) -> "AsyncOpenAI":
+    """
+    Create an async OpenAI client.
+
+    Async connection pools are bound to the event loop they were used on, so
+    a new client is created per loop and should be closed with ``async with``.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: Alternative API base URL (optional)
+
+    Returns:
+        New AsyncOpenAI client
+    """
+    from openai import AsyncOpenAI
+    
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=_create_async_http_client())
@@ -0,0 +1,22 @@
+"""
+Prompt templates shipped in the resources directory.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+PROMPT_DIR = Path(__file__).resolve().parent.parent.parent / "resources" / "prompts"
+
+
+@lru_cache(maxsize=None)
+def load_prompt(prompt_name: str) -> str:
+    """
+    Load a prompt template from resources, reading each file once per process.
+    
+    Args:
+        prompt_name: File name of the prompt in the prompts directory
+        
+    Returns:
+        Prompt template text
+    """
+    return (PROMPT_DIR / prompt_name).read_text()
@@ -0,0 +1,57 @@
+"""
+Request rate limiting for calls to rate-limited APIs.
+"""
+
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many requests start per minute.
+    
+    Callers reserve tokens up front and sleep off any deficit outside the
+    lock, so concurrent workers are spaced out evenly instead of all retrying
+    after a 429 response.
+    """
+    
+    def __init__(self, requests_per_minute: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            requests_per_minute: Sustained number of requests allowed per minute
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.rate = requests_per_minute / 60.0
+        # Allow bursts of up to one second worth of requests
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens, blocking until the reservation is covered.
+        
+        Args:
+            tokens: Number of requests about to be made
+        
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
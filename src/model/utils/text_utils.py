@@ -3,11 +3,59 @@ Text processing utility functions.
 """
 
 import re
+import string
+from collections import Counter
 from typing import List, Optional
 import logging
 
+import numpy as np
+
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # pragma: no cover - optional dependency
+    _rf_process = _rf_levenshtein = None
+
+try:
+    import editdistance
+except ImportError:  # pragma: no cover - optional dependency
+    editdistance = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import rather than on every call
+_WS_RE = re.compile(r"\s+")
+# Sentence terminator plus following whitespace; the leading character class lets
+# the regex engine skip ahead to candidate positions instead of testing a
+# lookbehind at every character
+_SENT_END_RE = re.compile(r"[.!?]\s+")
+_PARA_RE = re.compile(r"\n\s*\n")
+_SPECIAL_KEEP_SPACE_RE = re.compile(r"[^\w\s]")
+_SPECIAL_NO_SPACE_RE = re.compile(r"[^\w]")
+_KEYWORD_RE = re.compile(r"[a-z][a-z'-]{2,}")
+
+# Deletion tables for preprocess_text keyed by (remove_numbers, remove_punctuation),
+# so every flag combination is applied in a single str.translate pass
+_PREPROCESS_TABLES = {
+    (remove_numbers, remove_punctuation): str.maketrans("", "", (
+        (string.digits if remove_numbers else "") + (string.punctuation if remove_punctuation else "")
+    ))
+    for remove_numbers in (False, True)
+    for remove_punctuation in (False, True)
+}
+
+_STOPWORDS = frozenset("""
+    the and for are but not you all any can had her was one our out has have
+    this that with from they will would there their what when which who whom
+    been were into than then them these those such only other some more most
+    very over also its shall may must upon each per page
+""".split())
+
 
 def preprocess_text(text: str, remove_numbers: bool = False, 
                    remove_punctuation: bool = False) -> str:
@@ -16,14 +64,14 @@ def preprocess_text(text: str, remove_numbers: bool = False,
     
     Args:
         text: Raw text to preprocess
-        remove_numbers: Whether to remove numeric characters
-        remove_punctuation: Whether to remove punctuation
+        remove_numbers: Whether to remove ASCII digits
+        remove_punctuation: Whether to remove ASCII punctuation
         
     Returns:
         Preprocessed text
     """
-    # Implementation for text preprocessing
-    pass
+    text = text.lower().translate(_PREPROCESS_TABLES[(remove_numbers, remove_punctuation)])
+    return clean_whitespace(text)
 
 
 def normalize_text(text: str) -> str:
@@ -36,8 +84,7 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text
     """
-    # Implementation for text normalization
-    pass
+    return clean_whitespace(text).lower()
 
 
 def extract_sentences(text: str) -> List[str]:
@@ -50,8 +97,15 @@ def extract_sentences(text: str) -> List[str]:
     Returns:
         List of sentences
     """
-    # Implementation for sentence extraction
-    pass
+    text = text.strip()
+    sentences = []
+    start = 0
+    for match in _SENT_END_RE.finditer(text):
+        sentences.append(text[start:match.start() + 1])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
 
 
 def extract_paragraphs(text: str) -> List[str]:
@@ -64,8 +118,10 @@ def extract_paragraphs(text: str) -> List[str]:
     Returns:
         List of paragraphs
     """
-    # Implementation for paragraph extraction
-    pass
+    # Single-line text cannot contain a paragraph break
+    if "\n" not in text:
+        return [text.strip()] if text.strip() else []
+    return [paragraph.strip() for paragraph in _PARA_RE.split(text) if paragraph.strip()]
 
 
 def clean_whitespace(text: str) -> str:
@@ -78,8 +134,7 @@ def clean_whitespace(text: str) -> str:
     Returns:
         Text with cleaned whitespace
     """
-    # Implementation for whitespace cleaning
-    pass
+    return _WS_RE.sub(" ", text).strip()
 
 
 def remove_special_characters(text: str, keep_spaces: bool = True) -> str:
@@ -93,8 +148,9 @@ def remove_special_characters(text: str, keep_spaces: bool = True) -> str:
     Returns:
         Text with special characters removed
     """
-    # Implementation for special character removal
-    pass
+    if keep_spaces:
+        return _SPECIAL_KEEP_SPACE_RE.sub("", text)
+    return _SPECIAL_NO_SPACE_RE.sub("", text)
 
 
 def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
@@ -108,8 +164,10 @@ def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
     Returns:
         List of extracted keywords
     """
-    # Implementation for keyword extraction
-    pass
+    counts = Counter(
+        word for word in _KEYWORD_RE.findall(text.lower()) if word not in _STOPWORDS
+    )
+    return [word for word, _ in counts.most_common(max_keywords)]
 
 
 def calculate_text_similarity(text1: str, text2: str) -> float:
@@ -121,7 +179,85 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
         text2: Second text string
         
     Returns:
-        Similarity score between 0 and 1
+        Similarity score between 0 and 1 (normalized Levenshtein similarity)
+    """
+    if _rf_levenshtein is not None:
+        return _rf_levenshtein.normalized_similarity(text1, text2)
+    
+    longest = max(len(text1), len(text2))
+    if longest == 0:
+        return 1.0
+    return 1.0 - _levenshtein_distance(text1, text2) / longest
+
+
+def calculate_similarity_matrix(texts1: List[str], texts2: List[str]) -> List[List[float]]:
+    """
+    Calculate pairwise similarities between two lists of text strings.
+    
+    Uses rapidfuzz's multi-threaded ``cdist`` when available.
+    
+    Args:
+        texts1: Texts for the matrix rows
+        texts2: Texts for the matrix columns
+        
+    Returns:
+        Matrix of similarity scores between 0 and 1
     """
-    # Implementation for text similarity calculation
-    pass 
\ No newline at end of file
+    if _rf_process is not None:
+        return _rf_process.cdist(
+            texts1, texts2, scorer=_rf_levenshtein.normalized_similarity, workers=-1
+        ).tolist()
+    return [[calculate_text_similarity(a, b) for b in texts2] for a in texts1]
+
+
+def _levenshtein_distance(text1: str, text2: str) -> int:
+    """Levenshtein distance using editdistance or a Numba kernel if installed, else a two-row DP."""
+    if editdistance is not None:
+        return editdistance.eval(text1, text2)
+    
+    if _levenshtein_kernel is not None:
+        return int(_levenshtein_kernel(_code_points(text1), _code_points(text2)))
+    
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    previous = list(range(len(text2) + 1))
+    for i, char1 in enumerate(text1, start=1):
+        current = [i]
+        for j, char2 in enumerate(text2, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char1 != char2)
+            ))
+        previous = current
+    return previous[-1]
+
+
+def _code_points(text: str) -> np.ndarray:
+    """Unicode code points of a string as a uint32 array."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _wagner_fischer(a: np.ndarray, b: np.ndarray) -> int:
+    """
+    Levenshtein distance between two code point arrays with one reusable row pair.
+    
+    Written against numpy arrays only so it can be compiled with ``numba.njit``.
+    """
+    if a.size < b.size:
+        a, b = b, a
+    previous = np.arange(b.size + 1)
+    current = np.empty_like(previous)
+    for i in range(1, a.size + 1):
+        current[0] = i
+        char = a[i - 1]
+        for j in range(1, b.size + 1):
+            cost = 0 if char == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+        previous, current = current, previous
+    return previous[b.size]
+
+
+_levenshtein_kernel = (
+    numba.njit(cache=True, boundscheck=False)(_wagner_fischer) if numba is not None else None
+)
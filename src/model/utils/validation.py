@@ -2,51 +2,88 @@
 Validation utility functions.
 """
 
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union, Tuple
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import logging
+import os
+import stat
 
 from ..types import ExtractedMetadata, DocumentType
 
 logger = logging.getLogger(__name__)
 
+_VALID_CURRENCIES = frozenset({'USD', 'EUR', 'GBP', 'CAD', 'AUD', 'JPY'})
+# Required result keys; the frozensets allow a single C-level superset check on the
+# valid path, the tuples keep missing-field errors in a stable order
+_CLASSIFICATION_REQUIRED_FIELDS = ('document_type', 'confidence_score')
+_CLASSIFICATION_REQUIRED = frozenset(_CLASSIFICATION_REQUIRED_FIELDS)
+_EXTRACTION_REQUIRED_FIELDS = ('metadata', 'extraction_method', 'processing_time')
+_EXTRACTION_REQUIRED = frozenset(_EXTRACTION_REQUIRED_FIELDS)
+
 
 def validate_document_path(document_path: Union[str, Path]) -> List[str]:
     """
     Validate document path and file.
     
+    The file is stat-ed once, without building a Path object, and the checks are memoized on its path, size
+    and modification time, so validating the same unchanged file again in a
+    pipeline run costs a single syscall.
+    
     Args:
         document_path: Path to validate
         
     Returns:
         List of validation errors (empty if valid)
     """
-    errors = []
-    path = Path(document_path)
+    path = os.fspath(document_path)
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return [f"File does not exist: {path}"]
+    
+    return list(_validate_document_stat(
+        path, stat.S_ISREG(file_stat.st_mode), file_stat.st_size, file_stat.st_mtime_ns
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _validate_document_stat(path_str: str, is_file: bool, size: int, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Validate an existing document from its stat information.
     
-    if not path.exists():
-        errors.append(f"File does not exist: {path}")
-        return errors
+    Args:
+        path_str: Path of the document
+        is_file: Whether the path is a regular file
+        size: File size in bytes
+        mtime_ns: Modification time, only used as part of the cache key
+        
+    Returns:
+        Tuple of validation errors (empty if valid)
+    """
+    errors = []
     
-    if not path.is_file():
-        errors.append(f"Path is not a file: {path}")
+    if not is_file:
+        errors.append(f"Path is not a file: {path_str}")
     
-    if path.suffix.lower() != '.pdf':
-        errors.append(f"File is not a PDF: {path}")
+    if os.path.splitext(path_str)[1].lower() != '.pdf':
+        errors.append(f"File is not a PDF: {path_str}")
     
-    if path.stat().st_size == 0:
-        errors.append(f"File is empty: {path}")
+    if size == 0:
+        errors.append(f"File is empty: {path_str}")
     
-    return errors
+    return tuple(errors)
 
 
-def validate_metadata(metadata: ExtractedMetadata) -> List[str]:
+def validate_metadata(metadata: ExtractedMetadata, now: Optional[datetime] = None) -> List[str]:
     """
     Validate extracted metadata for consistency and completeness.
     
     Args:
         metadata: Metadata to validate
+        now: Reference time for the future-date check; batch callers compute it
+            once and pass it to every call (defaults to the current time)
         
     Returns:
         List of validation errors (empty if valid)
@@ -61,12 +98,11 @@ def validate_metadata(metadata: ExtractedMetadata) -> List[str]:
         errors.append("Total amount cannot be negative")
     
     if metadata.document_date is not None:
-        if metadata.document_date > datetime.now():
+        if metadata.document_date > (now or datetime.now()):
             errors.append("Document date cannot be in the future")
     
     if metadata.currency is not None:
-        valid_currencies = ['USD', 'EUR', 'GBP', 'CAD', 'AUD', 'JPY']
-        if metadata.currency not in valid_currencies:
+        if metadata.currency not in _VALID_CURRENCIES:
             errors.append(f"Invalid currency: {metadata.currency}")
     
     return errors
@@ -83,11 +119,11 @@ def validate_classification_result(result: Dict[str, Any]) -> List[str]:
         List of validation errors (empty if valid)
     """
     errors = []
-    required_fields = ['document_type', 'confidence_score']
     
-    for field in required_fields:
-        if field not in result:
-            errors.append(f"Missing required field: {field}")
+    if not result.keys() >= _CLASSIFICATION_REQUIRED:
+        errors.extend(
+            f"Missing required field: {field}" for field in _CLASSIFICATION_REQUIRED_FIELDS if field not in result
+        )
     
     if 'confidence_score' in result:
         score = result['confidence_score']
@@ -102,22 +138,23 @@ def validate_classification_result(result: Dict[str, Any]) -> List[str]:
     return errors
 
 
-def validate_extraction_result(result: Dict[str, Any]) -> List[str]:
+def validate_extraction_result(result: Dict[str, Any], now: Optional[datetime] = None) -> List[str]:
     """
     Validate extraction result structure.
     
     Args:
         result: Extraction result to validate
+        now: Reference time for the metadata date check (defaults to the current time)
         
     Returns:
         List of validation errors (empty if valid)
     """
     errors = []
-    required_fields = ['metadata', 'extraction_method', 'processing_time']
     
-    for field in required_fields:
-        if field not in result:
-            errors.append(f"Missing required field: {field}")
+    if not result.keys() >= _EXTRACTION_REQUIRED:
+        errors.extend(
+            f"Missing required field: {field}" for field in _EXTRACTION_REQUIRED_FIELDS if field not in result
+        )
     
     if 'processing_time' in result:
         time = result['processing_time']
@@ -125,7 +162,7 @@ def validate_extraction_result(result: Dict[str, Any]) -> List[str]:
             errors.append("Processing time must be a non-negative number")
     
     if 'metadata' in result:
-        metadata_errors = validate_metadata(result['metadata'])
+        metadata_errors = validate_metadata(result['metadata'], now)
         errors.extend(metadata_errors)
     
     return errors
@@ -0,0 +1,423 @@
+"""
+Pytest tests for LLMClassifier batch classification (no network access).
+"""
+
+import asyncio
+import json
+import math
+import os
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from model.classifier.llm_classifier import LLMClassifier
+from model.types import DocumentContext, DocumentType
+from model.utils.cache import DiskCache
+
+
+def _make_response(token: str, probability: float = 0.9):
+    """Build a minimal chat completion response with a single top logprob."""
+    top_logprob = SimpleNamespace(token=token, logprob=math.log(probability))
+    choice = SimpleNamespace(
+        message=SimpleNamespace(content=token),
+        logprobs=SimpleNamespace(content=[SimpleNamespace(top_logprobs=[top_logprob])])
+    )
+    return SimpleNamespace(choices=[choice])
+
+
+class FakeAsyncClient:
+    """Async client stub that answers based on the document text."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        user_prompt = kwargs["messages"][1]["content"]
+        if "=== DOC" in user_prompt:
+            return self._grouped_response(user_prompt)
+        if "FAIL" in user_prompt:
+            raise RuntimeError("simulated API error")
+        token = "Invoice" if "invoice" in user_prompt else "Contract"
+        return _make_response(token)
+
+    @staticmethod
+    def _grouped_response(user_prompt: str):
+        entries = [
+            {"id": doc_id, "document_type": "Invoice" if "invoice" in text else "Contract", "confidence": 0.8}
+            for doc_id, text in re.findall(r"=== DOC (\d+) ===\n(\S*)", user_prompt)
+        ]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(entries)))])
+
+
+@pytest.fixture
+def classifier(monkeypatch, tmp_path):
+    """LLMClassifier with PDF reads and the async client stubbed out."""
+    clf = LLMClassifier(model_name="gpt-4", api_key="test-key", max_concurrency=2)
+    clf.response_cache = DiskCache(tmp_path / "responses")
+    fake_client = FakeAsyncClient()
+    monkeypatch.setattr(clf, "_initialize_async_client", lambda: fake_client)
+    monkeypatch.setattr(clf, "_extract_text_from_pdf", lambda path: path.stem)
+    clf.fake_client = fake_client
+    return clf
+
+
+class TestPredictBatch:
+    """Test cases for LLMClassifier.predict_batch."""
+
+    def test_results_keep_input_order(self, classifier):
+        paths = ["a_invoice.pdf", "b_contract.pdf", "c_invoice.pdf"]
+        results = classifier.predict_batch(paths)
+
+        assert [r.document_type for r in results] == [
+            DocumentType.INVOICE, DocumentType.CONTRACT, DocumentType.INVOICE
+        ]
+
+    def test_concurrency_is_bounded(self, classifier):
+        classifier.predict_batch([f"doc_{i}_invoice.pdf" for i in range(8)])
+        assert 1 < classifier.fake_client.max_in_flight <= 2
+
+    def test_failures_map_to_unknown(self, classifier):
+        results = classifier.predict_batch(["ok_invoice.pdf", "FAIL.pdf"])
+
+        assert results[0].document_type == DocumentType.INVOICE
+        assert results[1].document_type == DocumentType.UNKNOWN
+        assert "simulated API error" in results[1].raw_response
+
+    def test_grouped_prompts(self, classifier):
+        classifier.group_size = 2
+        paths = ["a_invoice.pdf", "b_contract.pdf", "c_invoice.pdf"]
+        results = classifier.predict_batch(paths)
+
+        assert classifier.fake_client.calls == 2
+        assert [r.document_type for r in results] == [
+            DocumentType.INVOICE, DocumentType.CONTRACT, DocumentType.INVOICE
+        ]
+        assert results[1].confidence_score[DocumentType.CONTRACT.value] == 0.8
+
+    def test_grouped_results_hit_response_cache(self, classifier):
+        classifier.group_size = 2
+        classifier.predict_batch(["a_invoice.pdf", "b_contract.pdf"])
+        results = classifier.predict_batch(["a_invoice.pdf", "b_contract.pdf", "c_invoice.pdf"])
+
+        assert classifier.fake_client.calls == 2
+        assert [r.document_type for r in results] == [
+            DocumentType.INVOICE, DocumentType.CONTRACT, DocumentType.INVOICE
+        ]
+
+    def test_malformed_group_entries_only_fail_their_document(self, classifier):
+        content = json.dumps([
+            {"id": 0, "document_type": "Invoice", "confidence": 0.7},
+            {"id": 1, "document_type": "Contract", "confidence": None},
+            {"id": 2, "document_type": "Contract", "confidence": "high"},
+            "not an object",
+        ])
+
+        results = classifier._parse_group_response(content, 4)
+
+        assert [r.document_type for r in results] == [DocumentType.INVOICE] + [DocumentType.UNKNOWN] * 3
+        assert results[0].confidence_score[DocumentType.INVOICE.value] == 0.7
+        assert [r.document_type for r in classifier._parse_group_response('{"id": 0}', 2)] == [
+            DocumentType.UNKNOWN
+        ] * 2
+
+    def test_group_request_truncates_each_document(self, classifier, monkeypatch):
+        from model.classifier import llm_classifier
+
+        monkeypatch.setattr(llm_classifier, "tiktoken", None)
+        llm_classifier._get_encoding.cache_clear()
+        classifier.head_tokens, classifier.tail_tokens = 2, 3
+        text = "HEADER " + "body " * 500 + "SIGNATURE"
+
+        request = classifier._build_group_request([text, "short"])
+
+        assert classifier._truncate_text(text) in request["messages"][1]["content"]
+        assert "SIGNATURE" in request["messages"][1]["content"]
+        assert request["max_tokens"] > 32 * 2
+
+    def test_repeat_batches_hit_response_cache(self, classifier):
+        paths = ["a_invoice.pdf", "b_contract.pdf"]
+        first = classifier.predict_batch(paths)
+        second = classifier.predict_batch(paths)
+
+        assert classifier.fake_client.calls == 2
+        assert [r.document_type for r in second] == [r.document_type for r in first]
+
+
+def _completion_body(token: str, probability: float = 0.9) -> dict:
+    """Build a chat completion response body as returned in Batch API output files."""
+    top_logprob = {"token": token, "logprob": math.log(probability), "bytes": None}
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": token},
+            "logprobs": {"content": [dict(top_logprob, top_logprobs=[top_logprob])]}
+        }]
+    }
+
+
+class FakeBatchClient:
+    """Sync client stub for the Files and Batches APIs."""
+
+    def __init__(self):
+        self.uploaded_lines = []
+        self.retrieve_calls = 0
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    def _create_file(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded_lines = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file-input")
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="validating", output_file_id=None, error_file_id=None)
+
+    def _retrieve_batch(self, batch_id):
+        self.retrieve_calls += 1
+        if self.retrieve_calls < 2:
+            return SimpleNamespace(id=batch_id, status="in_progress", output_file_id=None, error_file_id=None)
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-output", error_file_id=None)
+
+    def _file_content(self, file_id):
+        lines = []
+        for entry in self.uploaded_lines:
+            user_prompt = entry["body"]["messages"][1]["content"]
+            if "FAIL" in user_prompt:
+                response = {"status_code": 500, "body": {"error": "simulated"}}
+            else:
+                token = "Invoice" if "invoice" in user_prompt else "Contract"
+                response = {"status_code": 200, "body": _completion_body(token)}
+            lines.append(json.dumps({"custom_id": entry["custom_id"], "response": response}))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class TestPredictBatchOffline:
+    """Test cases for classification through the OpenAI Batch API."""
+
+    @pytest.fixture
+    def batch_client(self, classifier, monkeypatch):
+        from model.utils import openai_batch
+
+        sleeps = []
+        monkeypatch.setattr(openai_batch.time, "sleep", sleeps.append)
+        client = FakeBatchClient()
+        client.sleeps = sleeps
+        classifier.client = client
+        return client
+
+    def test_results_keep_input_order(self, classifier, batch_client):
+        results = classifier.predict_batch_offline(["a_invoice.pdf", "b_contract.pdf", "FAIL.pdf"])
+
+        assert [r.document_type for r in results] == [
+            DocumentType.INVOICE, DocumentType.CONTRACT, DocumentType.UNKNOWN
+        ]
+        assert results[0].confidence_score[DocumentType.INVOICE.value] == pytest.approx(0.9)
+        assert batch_client.uploaded_lines[0]["url"] == "/v1/chat/completions"
+
+    def test_polling_backs_off(self, classifier, batch_client):
+        classifier.predict_batch_offline(["a_invoice.pdf"], poll_interval=1.0, max_poll_interval=1.5)
+
+        assert batch_client.sleeps == [1.0, 1.5]
+
+    def test_cached_documents_are_not_uploaded(self, classifier, batch_client):
+        classifier.predict_batch_offline(["a_invoice.pdf"])
+        results = classifier.predict_batch_offline(["a_invoice.pdf", "b_contract.pdf"])
+
+        assert [entry["custom_id"] for entry in batch_client.uploaded_lines] == ["1"]
+        assert results[0].document_type == DocumentType.INVOICE
+
+    def test_pdf_text_is_extracted_in_worker_processes(self, classifier, batch_client, monkeypatch):
+        from model.classifier import llm_classifier
+
+        monkeypatch.setattr(llm_classifier, "_extract_pdf_text", _stem_in_worker)
+        classifier.extraction_processes = 2
+        documents = ["a_invoice.pdf", DocumentContext(path=Path("b.pdf"), full_text="b_contract"), "c_contract.pdf"]
+
+        results = classifier.predict_batch_offline(documents)
+
+        assert [r.document_type for r in results] == [
+            DocumentType.INVOICE, DocumentType.CONTRACT, DocumentType.CONTRACT
+        ]
+        assert [request["body"]["messages"][1]["content"] for request in batch_client.uploaded_lines] == [
+            classifier._create_classification_prompt(text)
+            for text in ("a_invoice", "b_contract", "c_contract")
+        ]
+
+
+def _stem_in_worker(pdf_path):
+    """Stand-in for llm_classifier._extract_pdf_text that must run in a child process."""
+    assert os.getpid() != _TEST_PID
+    return pdf_path.stem
+
+
+_TEST_PID = os.getpid()
+
+
+class TestRawResponses:
+    """Test cases for parsing single-document responses from raw JSON."""
+
+    @pytest.fixture
+    def sync_client(self, classifier):
+        def create(**kwargs):
+            token = "Invoice" if "invoice" in kwargs["messages"][1]["content"] else "Contract"
+            return _completion_body(token)
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+            create=lambda **kwargs: ChatCompletion.model_validate(create(**kwargs)),
+            with_raw_response=SimpleNamespace(
+                create=lambda **kwargs: SimpleNamespace(content=json.dumps(create(**kwargs)).encode())
+            )
+        )))
+        classifier.client = client
+        classifier.response_cache = None
+        return client
+
+    @pytest.mark.parametrize("raw_responses", [True, False])
+    def test_predict(self, classifier, sync_client, raw_responses):
+        classifier.raw_responses = raw_responses
+
+        result = classifier.predict("a_invoice.pdf")
+
+        assert result.document_type == DocumentType.INVOICE
+        assert result.confidence_score[DocumentType.INVOICE.value] == pytest.approx(0.9)
+        assert result.raw_response == "Invoice"
+
+    def test_raw_and_sdk_parsing_agree(self, classifier):
+        body = _completion_body("Contract", 0.6)
+
+        raw = classifier._parse_completion_body(body)
+        parsed = classifier._parse_llm_response(ChatCompletion.model_validate(body))
+
+        assert raw.to_dict() == parsed.to_dict()
+
+
+def test_top_logprobs_is_configurable():
+    default = LLMClassifier(model_name="gpt-4", api_key="test-key")
+    narrow = LLMClassifier(model_name="gpt-4", api_key="test-key", top_logprobs=5)
+
+    assert default._build_request("text")["top_logprobs"] == 20
+    assert narrow._build_request("text")["top_logprobs"] == 5
+
+
+class TestLabelLogitBias:
+    """Test cases for constraining the output token to a class label."""
+
+    def test_request_biases_single_token_labels(self, classifier, monkeypatch):
+        from model.classifier import llm_classifier
+
+        vocabulary = {doc_type.value: [i] for i, doc_type in enumerate(DocumentType)}
+        encoding = SimpleNamespace(encode=lambda text: vocabulary.get(text, [99] * len(text.split())))
+        monkeypatch.setattr(llm_classifier, "tiktoken", SimpleNamespace(encoding_for_model=lambda name: encoding))
+        llm_classifier._label_logit_bias.cache_clear()
+        llm_classifier._get_encoding.cache_clear()
+
+        request = classifier._build_request("some text")
+
+        llm_classifier._label_logit_bias.cache_clear()
+        llm_classifier._get_encoding.cache_clear()
+        expected = {str(vocabulary[dt.value][0]) for dt in DocumentType if dt != DocumentType.UNKNOWN}
+        assert set(request["logit_bias"]) == expected
+        assert request["max_tokens"] == 1
+
+    def test_request_without_tokenizer_has_no_bias(self, classifier, monkeypatch):
+        from model.classifier import llm_classifier
+
+        monkeypatch.setattr(llm_classifier, "tiktoken", None)
+        llm_classifier._label_logit_bias.cache_clear()
+        llm_classifier._get_encoding.cache_clear()
+
+        assert "logit_bias" not in classifier._build_request("some text")
+
+
+class TestTruncation:
+    """Test cases for head and tail truncation of the document text."""
+
+    def test_short_text_is_unchanged(self, classifier, monkeypatch):
+        from model.classifier import llm_classifier
+
+        monkeypatch.setattr(llm_classifier, "tiktoken", None)
+        llm_classifier._get_encoding.cache_clear()
+
+        assert classifier._truncate_text("short document") == "short document"
+
+    def test_character_fallback_keeps_head_and_tail(self, classifier, monkeypatch):
+        from model.classifier import llm_classifier
+
+        monkeypatch.setattr(llm_classifier, "tiktoken", None)
+        llm_classifier._get_encoding.cache_clear()
+        classifier.head_tokens, classifier.tail_tokens = 2, 1
+
+        truncated = classifier._truncate_text("HEADER" + "x" * 100 + "END")
+
+        assert truncated == "HEADERxx" + llm_classifier.TRUNCATION_MARKER + "xEND"
+
+    def test_token_truncation_keeps_head_and_tail(self, classifier, monkeypatch):
+        from model.classifier import llm_classifier
+
+        encoding = SimpleNamespace(encode=str.split, decode=" ".join)
+        monkeypatch.setattr(llm_classifier, "tiktoken", SimpleNamespace(encoding_for_model=lambda name: encoding))
+        llm_classifier._get_encoding.cache_clear()
+        classifier.head_tokens, classifier.tail_tokens = 2, 1
+
+        truncated = classifier._truncate_text("Invoice 42 lorem ipsum dolor Total")
+
+        llm_classifier._get_encoding.cache_clear()
+        assert truncated == "Invoice 42" + llm_classifier.TRUNCATION_MARKER + "Total"
+
+    def test_path_and_context_give_the_same_prompt(self, monkeypatch):
+        from model.classifier import llm_classifier
+
+        monkeypatch.setattr(llm_classifier, "tiktoken", None)
+        llm_classifier._get_encoding.cache_clear()
+        text = "HEADER " + "body " * 5000 + "SIGNATURE"
+        clf = LLMClassifier(model_name="gpt-4", api_key="test-key")
+        clf.pdf_extractor = SimpleNamespace(extract_text=lambda path: text)
+
+        from_path = clf._create_classification_prompt(clf._get_document_text("doc.pdf"))
+        from_context = clf._create_classification_prompt(
+            clf._get_document_text(DocumentContext(path=Path("doc.pdf"), full_text=text))
+        )
+
+        assert from_path == from_context
+        assert "SIGNATURE" in from_path
+
+
+class TestPromptTemplates:
+    """Test cases for building user prompts from the pre-split templates."""
+
+    def test_document_braces_are_sent_verbatim(self, classifier):
+        prompt = classifier._create_classification_prompt('{"total": 10} }{')
+
+        assert '{"total": 10} }{' in prompt
+        assert "{document_content}" not in prompt
+
+    def test_group_prompt_keeps_template_text(self, classifier):
+        request = classifier._build_group_request(["first {doc}", "second"])
+        prompt = request["messages"][1]["content"]
+
+        assert prompt.startswith("Classify each of the following documents.")
+        assert "=== DOC 0 ===\nfirst {doc}" in prompt
+        assert "{documents}" not in prompt
@@ -0,0 +1,75 @@
+"""
+Pytest tests for the hashed-features logistic regression MLClassifier.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from model.classifier.ml_classifier import MLClassifier
+from model.types import DocumentContext, DocumentType
+
+TRAINING_TEXTS = [
+    ("INVOICE number 1001 bill to customer amount due payment terms net 30", DocumentType.INVOICE),
+    ("Invoice 2002 total due subtotal tax remit payment to vendor", DocumentType.INVOICE),
+    ("This agreement is entered into by the parties governing law termination clause", DocumentType.CONTRACT),
+    ("Contract agreement between the parties term obligations signatures effective date", DocumentType.CONTRACT),
+    ("Quarterly earnings report revenue net income earnings per share guidance", DocumentType.EARNINGS_REPORT),
+    ("Annual financial results revenue growth operating margin shareholders earnings", DocumentType.EARNINGS_REPORT),
+]
+
+
+@pytest.fixture
+def trained_classifier():
+    classifier = MLClassifier(n_features=2 ** 12)
+    classifier.train_on_texts([text for text, _ in TRAINING_TEXTS], [label for _, label in TRAINING_TEXTS])
+    return classifier
+
+
+def test_predict_text_returns_training_labels(trained_classifier):
+    for text, label in TRAINING_TEXTS:
+        assert trained_classifier.predict_text(text).document_type == label
+
+
+def test_predict_accepts_document_context(trained_classifier):
+    context = DocumentContext(path=Path("doc.pdf"), full_text="invoice amount due payment terms")
+
+    result = trained_classifier.predict(context)
+
+    assert result.document_type == DocumentType.INVOICE
+    assert set(result.confidence_score) == {doc_type.value for doc_type in DocumentType}
+    assert result.confidence_score[DocumentType.UNKNOWN.value] == 0.0
+
+
+def test_save_and_load_round_trip(trained_classifier, tmp_path):
+    model_path = tmp_path / "model.npz"
+    trained_classifier.save_model(model_path)
+
+    loaded = MLClassifier(model_path=model_path)
+
+    text = "agreement between the parties governing law"
+    assert loaded.predict_proba(text) == pytest.approx(trained_classifier.predict_proba(text))
+
+
+def test_untrained_classifier_refuses_to_predict():
+    with pytest.raises(ValueError):
+        MLClassifier().predict_proba("anything")
+
+
+def test_sparse_features_match_dense_vector(trained_classifier):
+    import numpy as np
+
+    text = "invoice invoice amount due payment terms"
+    indices, values = trained_classifier._sparse_features(text)
+    dense = trained_classifier._vectorize(text)
+
+    assert np.count_nonzero(dense) == len(indices)
+    assert dense[indices] == pytest.approx(values)
+    assert np.linalg.norm(dense) == pytest.approx(1.0)
+
+
+def test_single_label_training_is_rejected():
+    texts = [text for text, label in TRAINING_TEXTS if label == DocumentType.INVOICE]
+
+    with pytest.raises(ValueError, match="at least two document types"):
+        MLClassifier(n_features=2 ** 12).train_on_texts(texts, [DocumentType.INVOICE] * len(texts))
@@ -0,0 +1,283 @@
+"""
+Pytest tests for BaseEntityExtractor helpers (no network access).
+"""
+
+import asyncio
+import re
+
+import orjson
+
+from model.extractor.invoice_extractor import InvoiceExtractor
+
+
+class _FakeAsyncClient:
+    """Async OpenAI stand-in answering each request with the document named in its prompt."""
+
+    def __init__(self):
+        from types import SimpleNamespace
+
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        from types import SimpleNamespace
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        document = re.search(r"doc_\d+\.pdf", kwargs["messages"][-1]["content"]).group()
+        content = orjson.dumps({"vendor": document}).decode()
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+def test_extract_batch_runs_concurrently_and_keeps_order(monkeypatch):
+    extractor = InvoiceExtractor(api_key="test-key")
+    extractor.response_cache = None
+    client = _FakeAsyncClient()
+    extracted = {}
+    monkeypatch.setattr(extractor, "_initialize_async_client", lambda: client)
+    monkeypatch.setattr(extractor, "_get_document_text", lambda path: f"text of {path}")
+    monkeypatch.setattr(extractor, "_create_metadata", lambda entities: extracted.setdefault(entities["vendor"], entities))
+    monkeypatch.setattr(extractor, "validate_metadata", lambda metadata: [])
+    paths = [f"doc_{i}.pdf" for i in range(4)]
+
+    results = extractor.extract_batch(paths, ["invoice"])
+
+    assert [result.metadata["vendor"] for result in results] == paths
+    assert all(result.errors == [] for result in results)
+    assert client.max_in_flight > 1
+    assert client.closed
+    assert extractor.extract_batch([]) == []
+
+
+def test_extract_batch_without_api_key_reports_errors():
+    extractor = InvoiceExtractor(api_key="test-key")
+    extractor.llm_extractor.api_key = None
+
+    results = extractor.extract_batch(["a.pdf", "b.pdf"])
+
+    assert [result.errors for result in results] == [
+        ["Extraction failed: No API key provided - LLM extraction will not work"]
+    ] * 2
+
+
+def test_pdf_text_is_read_once_per_file_version(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from model.extractor import entity_extractor
+
+    opened = []
+
+    class FakePdf:
+        def __init__(self, path):
+            opened.append(path)
+            self.pages = [SimpleNamespace(extract_text=lambda: "page one"), SimpleNamespace(extract_text=lambda: None)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+    monkeypatch.setattr(entity_extractor.pdfplumber, "open", FakePdf)
+    monkeypatch.setattr(entity_extractor, "_pdf_text_cache", entity_extractor.OrderedDict())
+    extractor = InvoiceExtractor(api_key="test-key")
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    assert extractor._extract_text_from_pdf(pdf_path) == "page one\n\n"
+    assert extractor._extract_text_from_pdf(pdf_path) == "page one\n\n"
+    assert len(opened) == 1
+
+    pdf_path.write_bytes(b"%PDF-1.4 changed")
+    extractor._extract_text_from_pdf(pdf_path)
+    assert len(opened) == 2
+
+
+def test_field_extractors_are_built_on_first_use():
+    extractor = InvoiceExtractor(api_key="test-key")
+
+    assert "date_extractor" not in vars(extractor)
+    date_extractor = extractor.date_extractor
+    assert extractor.date_extractor is date_extractor
+    assert "amount_extractor" not in vars(extractor)
+
+
+def test_confidence_score_counts_non_empty_fields():
+    extractor = InvoiceExtractor(api_key="test-key")
+    fields = extractor.rule_based_fields + extractor.llm_based_fields
+    entities = {fields[0]: "value", fields[1]: None}
+
+    assert extractor._calculate_confidence_score(entities) == 1 / len(fields)
+
+
+def _fake_llm_client(create):
+    from types import SimpleNamespace
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_malformed_llm_json_falls_back_to_rule_based_results(monkeypatch):
+    from types import SimpleNamespace
+    from model.extractor.contract_extractor import ContractExtractor
+
+    extractor = ContractExtractor(api_key="test-key")
+    extractor.response_cache = None
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="not json"))])
+    monkeypatch.setattr(extractor.llm_extractor, "client", _fake_llm_client(lambda **kwargs: response))
+
+    from model.extractor.entity_extractor import MALFORMED_LLM_RESPONSE_ERROR
+
+    entities, errors = extractor._extract_llm_entities("text", {"party_a": "Acme"})
+
+    assert entities == {"party_a": "Acme"}
+    assert errors == [MALFORMED_LLM_RESPONSE_ERROR]
+
+
+def test_llm_api_errors_are_reported_in_result(monkeypatch):
+    from model.extractor.contract_extractor import ContractExtractor
+
+    def create(**kwargs):
+        raise RuntimeError("connection reset")
+
+    extractor = ContractExtractor(api_key="test-key")
+    extractor.response_cache = None
+    monkeypatch.setattr(extractor.llm_extractor, "client", _fake_llm_client(create))
+    monkeypatch.setattr(extractor, "_get_document_text", lambda document: "contract text")
+
+    result = extractor.extract("contract.pdf")
+
+    assert result.errors == ["Extraction failed: connection reset"]
+
+
+def test_scanned_pdf_fails_without_reading_every_page(tmp_path, monkeypatch):
+    import pytest
+    from model.extractor import entity_extractor
+
+    read_pages = []
+
+    class FakePage:
+        chars = []
+
+        def extract_text(self):
+            read_pages.append(self)
+            return ""
+
+    class FakePdf:
+        def __init__(self, path):
+            self.pages = [FakePage() for _ in range(40)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+    monkeypatch.setattr(entity_extractor.pdfplumber, "open", FakePdf)
+    extractor = InvoiceExtractor(api_key="test-key")
+    pdf_path = tmp_path / "scan.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    with pytest.raises(Exception, match="looks scanned"):
+        extractor._extract_text_from_pdf(pdf_path)
+    assert read_pages == []
+
+
+def test_llm_entities_are_cached_by_prompt(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from model.extractor.contract_extractor import ContractExtractor
+    from model.utils.cache import DiskCache
+
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"party_b": "Beta"}'))])
+
+    extractor = ContractExtractor(api_key="test-key")
+    extractor.response_cache = DiskCache(tmp_path / "responses")
+    monkeypatch.setattr(extractor.llm_extractor, "client", _fake_llm_client(create))
+
+    first = extractor._extract_llm_entities("same text", {"party_a": "Acme"})
+    second = extractor._extract_llm_entities("same text", {"party_a": "Other"})
+    extractor._extract_llm_entities("other text", {})
+
+    assert first == ({"party_a": "Acme", "party_b": "Beta"}, [])
+    assert second == ({"party_a": "Other", "party_b": "Beta"}, [])
+    assert len(calls) == 2
+    assert calls[0]["timeout"] == extractor.settings.get("llm.timeout", 30)
+
+
+class _FakeBatchClient:
+    """Sync client stub for the Files and Batches APIs, answering with the document named in each prompt."""
+
+    def __init__(self):
+        from types import SimpleNamespace
+
+        self.uploaded = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="batch-1", status="completed", output_file_id="file-output", error_file_id=None)
+        )
+
+    def _create_file(self, file, purpose):
+        from types import SimpleNamespace
+
+        self.uploaded = [orjson.loads(line) for line in file[1].splitlines()]
+        return SimpleNamespace(id="file-input")
+
+    def _file_content(self, file_id):
+        from types import SimpleNamespace
+
+        lines = []
+        for entry in self.uploaded:
+            document = re.search(r"doc_\d+\.pdf", entry["body"]["messages"][-1]["content"]).group()
+            if document == "doc_2.pdf":
+                response = {"status_code": 500, "body": {}}
+            else:
+                content = orjson.dumps({"vendor": document}).decode()
+                response = {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}
+            lines.append(orjson.dumps({"custom_id": entry["custom_id"], "response": response}).decode())
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def test_extract_batch_offline_uses_batch_api_and_cache(tmp_path, monkeypatch):
+    from model.utils.cache import DiskCache
+
+    extractor = InvoiceExtractor(api_key="test-key")
+    extractor.response_cache = DiskCache(tmp_path / "responses")
+    client = _FakeBatchClient()
+    monkeypatch.setattr(extractor.llm_extractor, "client", client)
+    monkeypatch.setattr(extractor, "_get_document_text", lambda path: f"text of {path}")
+    monkeypatch.setattr(extractor, "_create_metadata", lambda entities: entities)
+    monkeypatch.setattr(extractor, "validate_metadata", lambda metadata: [])
+
+    results = extractor.extract_batch_offline(["doc_0.pdf", "doc_1.pdf", "doc_2.pdf"])
+
+    assert [result.metadata.get("vendor") for result in results[:2]] == ["doc_0.pdf", "doc_1.pdf"]
+    assert results[2].errors == ["Extraction failed: No batch output for doc_2.pdf"]
+    assert client.uploaded[0]["url"] == "/v1/chat/completions"
+    assert set(client.uploaded[0]["body"]) == {"messages", "model", "temperature", "max_tokens", "stream"}
+
+    extractor.extract_batch_offline(["doc_1.pdf", "doc_3.pdf"])
+
+    assert [entry["custom_id"] for entry in client.uploaded] == ["1"]
+
+
+def test_llm_prompt_prefix_is_stable_across_documents():
+    from model.extractor.report_extractor import ReportExtractor
+
+    for extractor in (InvoiceExtractor(api_key="test-key"), ReportExtractor(api_key="test-key")):
+        first = extractor._build_llm_messages("first document")
+        second = extractor._build_llm_messages("second document")
+
+        assert first[:-1] == second[:-1]
+        assert "first document" in first[-1]["content"]
@@ -0,0 +1,54 @@
+"""
+Pytest tests for ExtractorFactory (no network access).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from model.extractor.contract_extractor import ContractExtractor
+from model.extractor.extractor_factory import ExtractorFactory
+from model.extractor.invoice_extractor import InvoiceExtractor
+from model.extractor.report_extractor import ReportExtractor
+from model.types import DocumentType
+
+
+@pytest.mark.parametrize("document_type, extractor_class", [
+    (DocumentType.INVOICE, InvoiceExtractor),
+    (DocumentType.CONTRACT, ContractExtractor),
+    (DocumentType.EARNINGS_REPORT, ReportExtractor),
+])
+def test_create_extractor(document_type, extractor_class):
+    extractor = ExtractorFactory.create_extractor(document_type, llm_model="test-model", api_key="test-key")
+
+    assert type(extractor) is extractor_class
+    assert extractor.llm_extractor.model_name == "test-model"
+
+
+def test_create_extractor_uses_settings_defaults():
+    extractor = ExtractorFactory.create_extractor(DocumentType.CONTRACT, api_key="test-key")
+
+    assert extractor.llm_extractor.model_name is not None
+
+
+def test_create_extractor_rejects_unsupported_type():
+    with pytest.raises(ValueError, match="Unsupported document type"):
+        ExtractorFactory.create_extractor(DocumentType.UNKNOWN, api_key="test-key")
+
+
+@pytest.mark.parametrize("file_name, extractor_class", [
+    ("service_agreement.pdf", ContractExtractor),
+    ("q3_earnings.pdf", ReportExtractor),
+    ("bill_2024.pdf", InvoiceExtractor),
+    ("scan.pdf", InvoiceExtractor),
+])
+def test_create_extractor_from_file_name(file_name, extractor_class):
+    extractor = ExtractorFactory.create_extractor_from_file(Path(file_name), api_key="test-key")
+
+    assert type(extractor) is extractor_class
+
+
+def test_create_extractor_from_file_name_keeps_keyword_priority():
+    extractor = ExtractorFactory.create_extractor_from_file(Path("contract_invoice.pdf"), api_key="test-key")
+
+    assert type(extractor) is InvoiceExtractor
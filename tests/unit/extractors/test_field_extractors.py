@@ -0,0 +1,106 @@
+"""
+Pytest tests for the regex-based field extractors
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from model.extractor.field_extractors import (
+    AmountExtractor,
+    CompositeFieldExtractor,
+    CurrencyExtractor,
+    DateExtractor,
+    PartyExtractor,
+    _parse_amount,
+)
+from model.types import DocumentContext
+
+SAMPLE_TEXT = (
+    "Invoice\n"
+    "From: Acme Corp\n"
+    "To: Beta LLC\n"
+    "Date: March 5, 2024\n"
+    "Due 2024-04-01\n"
+    "Item 1,200.00 USD\n"
+    "Total: $1,250.50\n"
+)
+
+
+def test_date_extractor_returns_first_parsed_date():
+    assert DateExtractor()._extract_from_text(SAMPLE_TEXT) == {"document_date": datetime(2024, 3, 5)}
+
+
+def test_date_extractor_parses_iso_dates():
+    assert DateExtractor()._extract_from_text("Issued 2023-12-31") == {"document_date": datetime(2023, 12, 31)}
+
+
+def test_amount_extractor_prefers_total():
+    assert AmountExtractor()._extract_from_text(SAMPLE_TEXT) == {"total_amount": 1250.5}
+
+
+def test_amount_extractor_falls_back_to_largest_amount():
+    assert AmountExtractor()._extract_from_text("$10.00 and $2,500.00") == {"total_amount": 2500.0}
+
+
+@pytest.mark.parametrize("text, currency", [
+    ("Paid 10 EUR", "EUR"),
+    ("Paid $ 10", "USD"),
+    ("Paid € 10", "EUR"),
+    ("Paid £10", "GBP"),
+    ("Nothing here", None),
+])
+def test_currency_extractor(text, currency):
+    assert CurrencyExtractor()._extract_from_text(text) == {"currency": currency}
+
+
+def test_party_extractor_ignores_labels_inside_words():
+    assert PartyExtractor()._extract_from_text(SAMPLE_TEXT) == {"parties": ["Acme Corp", "Beta LLC"]}
+
+
+def test_extract_batch_preserves_order(monkeypatch):
+    extractor = DateExtractor()
+    monkeypatch.setattr(extractor, "_extract_text_from_pdf", lambda path: path.stem)
+    
+    results = extractor.extract_batch(["2024-01-02.pdf", "none.pdf", "2023-05-06.pdf"], ["Invoice"])
+    
+    assert [r.metadata.document_date for r in results] == [datetime(2024, 1, 2), None, datetime(2023, 5, 6)]
+    assert results[0].metadata.document_type.value == "Invoice"
+
+
+def test_extract_accepts_document_context(monkeypatch):
+    extractor = AmountExtractor()
+    monkeypatch.setattr(extractor, "_extract_text_from_pdf", lambda path: pytest.fail("PDF parsed again"))
+    context = DocumentContext(path=Path("invoice.pdf"), full_text=SAMPLE_TEXT)
+    
+    assert extractor.extract(context).metadata.total_amount == 1250.5
+
+
+@pytest.mark.parametrize("value, amount", [
+    ("$ 1,234.56", 1234.56),
+    ("1,200.00 USD", 1200.0),
+    ("Total: $1,250.50", 1250.5),
+    ("$\xa0980", 980.0),
+])
+def test_parse_amount(value, amount):
+    assert _parse_amount(value) == amount
+
+
+def test_date_extractor_skips_invalid_iso_dates():
+    assert DateExtractor()._extract_from_text("2024-02-30 then 2024-03-01") == {"document_date": datetime(2024, 3, 1)}
+
+
+def test_composite_extractor_reads_text_once(monkeypatch):
+    extractor = CompositeFieldExtractor()
+    calls = []
+    monkeypatch.setattr(extractor, "_extract_text_from_pdf", lambda path: calls.append(path) or SAMPLE_TEXT)
+    
+    metadata = extractor.extract("invoice.pdf").metadata
+    
+    assert len(calls) == 1
+    assert metadata.document_date == datetime(2024, 3, 5)
+    assert metadata.total_amount == 1250.5
+    assert metadata.currency == "USD"
+    assert metadata.parties == ["Acme Corp", "Beta LLC"]
+    assert metadata.confidence_score == 1.0
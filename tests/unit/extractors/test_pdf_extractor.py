@@ -0,0 +1,188 @@
+"""
+Pytest tests for BasePDFExtractor text chunking (no real PDFs needed).
+"""
+
+from pathlib import Path
+
+from model.extractor.base_pdf_extractor import BasePDFExtractor
+
+
+class FakePDFExtractor(BasePDFExtractor):
+    """Extractor serving fixed page texts and counting how many are parsed."""
+
+    def __init__(self, pages):
+        super().__init__()
+        self._text_cache = None
+        self.pages = pages
+        self.pages_parsed = 0
+
+    def iter_page_texts(self, pdf_path):
+        for number, text in enumerate(self.pages, start=1):
+            self.pages_parsed += 1
+            yield f"\n--- Page {number} ---\n{text}"
+
+    def extract_text(self, pdf_path):
+        return "".join(self.iter_page_texts(pdf_path)).strip()
+
+    def _get_page_count_internal(self, pdf_path):
+        return len(self.pages)
+
+    def _get_metadata_internal(self, pdf_path):
+        return {}
+
+    def _validate_pdf_internal(self, pdf_path):
+        return True
+
+
+def test_extract_text_chunk_stops_parsing_early():
+    extractor = FakePDFExtractor(["x" * 100] * 50)
+
+    chunk = extractor.extract_text_chunk(Path("doc.pdf"), max_chars=250)
+
+    assert len(chunk) == 250
+    assert extractor.pages_parsed == 3
+
+
+def test_extract_text_chunk_is_prefix_of_full_text():
+    extractor = FakePDFExtractor(["alpha", "beta", "gamma"])
+    full_text = extractor.extract_text(Path("doc.pdf"))
+
+    for max_chars in (1, 10, 30, 1000):
+        assert extractor.extract_text_chunk(Path("doc.pdf"), max_chars=max_chars) == full_text[:max_chars]
+
+
+def _write_text_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    page_ids = [4 + 2 * i for i in range(len(page_texts))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids) + b"] /Count %d >>" % len(page_ids),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for page_id, text in zip(page_ids, page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode() + b") Tj ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    content = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(content)
+    content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    content += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    content += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(content)
+
+
+def test_parallel_page_extraction_matches_serial(tmp_path):
+    from model.extractor.pdf_extractor import PDFExtractor
+
+    pdf_path = tmp_path / "pages.pdf"
+    _write_text_pdf(pdf_path, [f"Page text {i}" for i in range(5)])
+    serial = PDFExtractor(page_workers=0)
+    parallel = PDFExtractor(page_workers=2)
+    serial._text_cache = parallel._text_cache = None
+
+    text = parallel.extract_text(pdf_path)
+
+    assert text == serial.extract_text(pdf_path)
+    assert text.startswith("--- Page 1 ---\nPage text 0")
+    assert "--- Page 5 ---\nPage text 4" in text
+
+
+def test_page_pools_follow_worker_count_and_spawn():
+    from model.extractor import pdf_extractor
+
+    try:
+        two = pdf_extractor._get_page_pool(2)
+        three = pdf_extractor._get_page_pool(3)
+
+        assert pdf_extractor._get_page_pool(2) is two
+        assert three is not two and three._max_workers == 3
+        assert two._mp_context.get_start_method() == "spawn"
+    finally:
+        pdf_extractor.shutdown_page_pools()
+    assert pdf_extractor._page_pools == {}
+
+
+def test_pdfium_backend_matches_pdfplumber(tmp_path):
+    import pytest
+    from model.extractor.pdf_extractor import PDFExtractor, create_pdf_extractor
+    from model.extractor.pdfium_extractor import PdfiumPDFExtractor
+
+    pdf_path = tmp_path / "pages.pdf"
+    _write_text_pdf(pdf_path, ["Invoice 42", "", "Total 10 EUR"])
+    pdfium_extractor = create_pdf_extractor("pdfium")
+    plumber_extractor = create_pdf_extractor("pdfplumber")
+    pdfium_extractor._text_cache = plumber_extractor._text_cache = None
+
+    assert type(pdfium_extractor) is PdfiumPDFExtractor
+    assert type(plumber_extractor) is PDFExtractor
+    assert pdfium_extractor.extract_text(pdf_path) == plumber_extractor.extract_text(pdf_path)
+    assert pdfium_extractor.get_page_count(pdf_path) == 3
+    assert pdfium_extractor.extract_text_chunk(pdf_path, max_chars=18) == "--- Page 1 ---\nInv"
+    with pytest.raises(ValueError, match="Unsupported PDF backend"):
+        create_pdf_extractor("pypdf2")
+
+
+def test_extract_text_is_cached_per_file_version(tmp_path):
+    import os
+    from model.extractor.pdf_extractor import PDFExtractor
+    from model.utils.cache import DiskCache
+
+    pdf_path = tmp_path / "doc.pdf"
+    _write_text_pdf(pdf_path, ["first"])
+    extractor = PDFExtractor()
+    extractor._text_cache = DiskCache(tmp_path / "cache")
+    parsed = []
+    extract = extractor._extract_text_internal
+    extractor._extract_text_internal = lambda path: parsed.append(path) or extract(path)
+
+    assert extractor.extract_text(pdf_path) == "--- Page 1 ---\nfirst"
+    assert extractor.extract_text(pdf_path) == "--- Page 1 ---\nfirst"
+    assert len(parsed) == 1
+
+    _write_text_pdf(pdf_path, ["second"])
+    os.utime(pdf_path, ns=(0, pdf_path.stat().st_mtime_ns + 1_000_000_000))
+    assert extractor.extract_text(pdf_path) == "--- Page 1 ---\nsecond"
+
+    extractor.clear_cache()
+    extractor.extract_text(pdf_path)
+    assert len(parsed) == 3
+
+
+def test_extract_all_opens_pdf_once(tmp_path, monkeypatch):
+    from model.extractor import pdf_extractor
+    from model.types import DocumentContext
+
+    pdf_path = tmp_path / "doc.pdf"
+    _write_text_pdf(pdf_path, ["first", "second"])
+    extractor = pdf_extractor.PDFExtractor(page_workers=0)
+    extractor._text_cache = None
+    expected = (extractor.extract_text(pdf_path), extractor.get_page_count(pdf_path), extractor.get_metadata(pdf_path))
+
+    opened = []
+    real_open = pdf_extractor.pdfplumber.open
+    monkeypatch.setattr(pdf_extractor.pdfplumber, "open", lambda path: opened.append(path) or real_open(path))
+    context = DocumentContext.from_pdf(pdf_path, extractor)
+
+    assert (context.full_text, context.page_count, context.metadata) == expected
+    assert len(opened) == 1
+
+
+def test_extract_all_does_not_cache_pdfs_without_text(tmp_path):
+    from model.extractor.pdf_extractor import PDFExtractor
+    from model.utils.cache import DiskCache
+
+    pdf_path = tmp_path / "blank.pdf"
+    _write_text_pdf(pdf_path, [""])
+    extractor = PDFExtractor()
+    extractor._text_cache = DiskCache(tmp_path / "cache")
+
+    assert extractor.extract_all(pdf_path)["text"] == ""
+    assert list((tmp_path / "cache").glob("*.json")) == []
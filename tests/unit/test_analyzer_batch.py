@@ -0,0 +1,293 @@
+"""
+Pytest tests for DocumentAnalyzer.analyze_batch (no network access).
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+import pytest
+
+from model.analyzer import DocumentAnalyzer
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """DocumentAnalyzer whose analyze is stubbed to track concurrency."""
+    analyzer = DocumentAnalyzer(model_name="gpt-4", api_key="test-key")
+    analyzer.num_workers = 3
+    state = {"in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def analyze(document_path):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.02)
+        with lock:
+            state["in_flight"] -= 1
+        if "broken" in document_path:
+            raise ValueError("cannot parse")
+        return {"filename": document_path}
+
+    monkeypatch.setattr(analyzer, "analyze", analyze)
+    analyzer.state = state
+    return analyzer
+
+
+def test_results_keep_input_order(analyzer):
+    paths = [f"doc_{i}.pdf" for i in range(6)]
+
+    results = analyzer.analyze_batch(paths)
+
+    assert [result["filename"] for result in results] == paths
+    assert 1 < analyzer.state["max_in_flight"] <= 3
+
+
+def test_failures_become_error_results(analyzer):
+    results = analyzer.analyze_batch(["ok.pdf", "broken.pdf"])
+
+    assert results[0] == {"filename": "ok.pdf"}
+    assert results[1]["filename"] == "broken.pdf"
+    assert results[1]["error"] == "cannot parse"
+    assert results[1]["classification"] is None
+
+
+def test_rate_limiter_is_consulted(analyzer):
+    acquired = []
+    analyzer.rate_limiter = type("Limiter", (), {"acquire": lambda self, tokens: acquired.append(tokens)})()
+
+    analyzer.analyze_batch(["a.pdf", "b.pdf"])
+
+    assert acquired == [2, 2]
+
+
+def test_empty_batch(analyzer):
+    assert analyzer.analyze_batch([]) == []
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_save_results(analyzer, tmp_path, suffix):
+    results = [
+        {"filename": "a.pdf", "analysis_timestamp": datetime(2024, 1, 1), "path": Path("a.pdf")},
+        {"filename": "b.pdf", "confidences": {1: 0.5}},
+    ]
+    output_path = tmp_path / "out" / f"results{suffix}"
+
+    analyzer.save_results(results, str(output_path))
+
+    if suffix == ".jsonl":
+        saved = [orjson.loads(line) for line in output_path.read_bytes().splitlines()]
+    else:
+        saved = orjson.loads(output_path.read_bytes())
+    assert saved == [
+        {"filename": "a.pdf", "analysis_timestamp": "2024-01-01T00:00:00", "path": "a.pdf"},
+        {"filename": "b.pdf", "confidences": {"1": 0.5}},
+    ]
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_missing_document_raises_file_not_found(tmp_path, use_cache):
+    from model.utils.cache import DiskCache
+
+    analyzer = DocumentAnalyzer(model_name="gpt-4", api_key="test-key")
+    analyzer.result_cache = DiskCache(tmp_path / "results") if use_cache else None
+    missing = tmp_path / "missing.pdf"
+
+    with pytest.raises(FileNotFoundError, match="Document not found"):
+        analyzer.analyze(str(missing))
+
+
+class TestResultCache:
+    """Test cases for the content-addressed analysis result cache."""
+
+    @pytest.fixture
+    def cached_analyzer(self, monkeypatch, tmp_path):
+        from model import analyzer as analyzer_module
+        from model.types import (
+            ClassificationResult, DocumentContext, DocumentType, ExtractedMetadata, ExtractionResult
+        )
+        from model.utils.cache import DiskCache
+
+        analyzer = DocumentAnalyzer(model_name="gpt-4", api_key="test-key")
+        analyzer.result_cache = DiskCache(tmp_path / "results")
+        calls = []
+
+        def classify(context):
+            calls.append(context.path)
+            return ClassificationResult(
+                document_type=DocumentType.INVOICE,
+                confidence_score={DocumentType.INVOICE.value: 0.9}
+            )
+
+        class FakeExtractor:
+            def extract(self, context):
+                metadata = ExtractedMetadata(
+                    document_type=DocumentType.INVOICE, confidence_score=0.9,
+                    extraction_date=None, total_amount=42.0
+                )
+                return ExtractionResult(metadata=metadata, extraction_method="fake", processing_time=0.1)
+
+        monkeypatch.setattr(
+            analyzer_module.DocumentContext, "from_pdf",
+            classmethod(lambda cls, path, extractor: DocumentContext(path=path, full_text="text"))
+        )
+        monkeypatch.setattr(analyzer, "_classify", classify)
+        monkeypatch.setattr(analyzer.extractor_factory, "create_extractor", lambda *args, **kwargs: FakeExtractor())
+        analyzer.calls = calls
+        return analyzer
+
+    def test_identical_content_is_analyzed_once(self, cached_analyzer, tmp_path):
+        first_path = tmp_path / "a.pdf"
+        second_path = tmp_path / "b.pdf"
+        first_path.write_bytes(b"%PDF same content")
+        second_path.write_bytes(b"%PDF same content")
+
+        first = cached_analyzer.analyze(str(first_path))
+        second = cached_analyzer.analyze(str(second_path))
+
+        assert len(cached_analyzer.calls) == 1
+        assert second["filename"] == "b.pdf"
+        assert second["document_id"] != first["document_id"]
+        assert second["metadata"] == first["metadata"] == {"total_amount": 42.0}
+
+    def test_changed_content_is_reanalyzed(self, cached_analyzer, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF version 1")
+        cached_analyzer.analyze(str(path))
+        path.write_bytes(b"%PDF version 2")
+        cached_analyzer.analyze(str(path))
+
+        assert len(cached_analyzer.calls) == 2
+
+    def test_aanalyze_builds_same_result(self, cached_analyzer, tmp_path, monkeypatch):
+        async def apredict(context, client=None):
+            return cached_analyzer._classify(context)
+
+        monkeypatch.setattr(cached_analyzer.classifier, "apredict", apredict)
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF async")
+
+        result = asyncio.run(cached_analyzer.aanalyze(str(path)))
+
+        assert result["classification"]["type"] == "invoice"
+        assert result["metadata"] == {"total_amount": 42.0}
+        assert cached_analyzer.analyze(str(path))["metadata"] == result["metadata"]
+        assert len(cached_analyzer.calls) == 1
+
+    def test_results_with_errors_are_not_cached(self, cached_analyzer, tmp_path, monkeypatch):
+        from model.extractor.entity_extractor import MALFORMED_LLM_RESPONSE_ERROR
+        from model.types import DocumentType
+
+        extractor = cached_analyzer._get_extractor(DocumentType.INVOICE)
+        extract = extractor.extract
+
+        def degraded_extract(context):
+            result = extract(context)
+            result.errors.append(MALFORMED_LLM_RESPONSE_ERROR)
+            return result
+
+        monkeypatch.setattr(extractor, "extract", degraded_extract)
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF degraded")
+
+        first = cached_analyzer.analyze(str(path))
+        cached_analyzer.analyze(str(path))
+
+        assert first["processing_info"]["errors"] == [MALFORMED_LLM_RESPONSE_ERROR]
+        assert len(cached_analyzer.calls) == 2
+
+    def test_retrained_fast_path_model_invalidates_results(self, cached_analyzer, tmp_path, monkeypatch):
+        import os
+
+        model_path = tmp_path / "fast.npz"
+        model_path.write_bytes(b"model v1")
+        monkeypatch.setattr(cached_analyzer, "fast_classifier", object())
+        monkeypatch.setattr(
+            cached_analyzer.settings, "_get_cache",
+            {**cached_analyzer.settings._get_cache, "classifier.fast_path.model_path": str(model_path)}
+        )
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF fast path")
+
+        cached_analyzer.analyze(str(path))
+        cached_analyzer.analyze(str(path))
+        model_path.write_bytes(b"model version 2")
+        os.utime(model_path, ns=(0, model_path.stat().st_mtime_ns + 1_000_000_000))
+        cached_analyzer.analyze(str(path))
+
+        assert len(cached_analyzer.calls) == 2
+
+    def test_result_affecting_settings_change_the_key(self, cached_analyzer, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF settings")
+        key = cached_analyzer._result_cache_key(path)
+
+        cached_analyzer.fast_path_threshold = 0.5
+        threshold_key = cached_analyzer._result_cache_key(path)
+        cached_analyzer.classifier.tail_tokens += 1
+
+        assert len({key, threshold_key, cached_analyzer._result_cache_key(path)}) == 3
+
+
+class TestAsyncAnalyzeBatch:
+    """Test cases for DocumentAnalyzer.aanalyze_batch."""
+
+    @pytest.fixture
+    def async_analyzer(self, monkeypatch):
+        from contextlib import asynccontextmanager
+
+        from model import analyzer as analyzer_module
+
+        analyzer = DocumentAnalyzer(model_name="gpt-4", api_key="test-key")
+        analyzer.num_workers = 2
+        state = {"in_flight": 0, "max_in_flight": 0, "clients": []}
+
+        async def aanalyze(document_path, client):
+            state["clients"].append(client)
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            if "broken" in document_path:
+                raise ValueError("cannot parse")
+            return {"filename": document_path}
+
+        @asynccontextmanager
+        async def fake_client(api_key, base_url=None):
+            yield object()
+
+        monkeypatch.setattr(analyzer, "aanalyze", aanalyze)
+        monkeypatch.setattr(analyzer_module, "create_async_openai_client", fake_client)
+        analyzer.state = state
+        return analyzer
+
+    def test_results_keep_input_order_and_share_client(self, async_analyzer):
+        paths = [f"doc_{i}.pdf" for i in range(5)] + ["broken.pdf"]
+
+        results = asyncio.run(async_analyzer.aanalyze_batch(paths))
+
+        assert [result["filename"] for result in results] == [path for path in paths]
+        assert results[-1]["error"] == "cannot parse"
+        assert async_analyzer.state["max_in_flight"] == 2
+        assert len(set(map(id, async_analyzer.state["clients"]))) == 1
+
+
+def test_extractors_are_reused_per_document_type(monkeypatch):
+    from model.types import DocumentType
+
+    analyzer = DocumentAnalyzer(model_name="gpt-4", api_key="test-key")
+    created = []
+    monkeypatch.setattr(
+        analyzer.extractor_factory, "create_extractor",
+        lambda document_type, **kwargs: created.append(document_type) or object()
+    )
+
+    invoice_extractor = analyzer._get_extractor(DocumentType.INVOICE)
+
+    assert analyzer._get_extractor(DocumentType.INVOICE) is invoice_extractor
+    assert analyzer._get_extractor(DocumentType.CONTRACT) is not invoice_extractor
+    assert created == [DocumentType.INVOICE, DocumentType.CONTRACT]
@@ -0,0 +1,49 @@
+"""
+Pytest tests for the FastAPI endpoints (no network access).
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+# src/api.py, loaded by path since the top-level api/ package shadows the module name
+API_PATH = Path(__file__).resolve().parents[2] / "src" / "api.py"
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    # The app creates its document store relative to the working directory on import
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path_factory.mktemp("api"))
+        spec = importlib.util.spec_from_file_location("document_api", API_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+
+
+@pytest.fixture
+def client(api):
+    return TestClient(api.app)
+
+
+def test_supported_types_are_served_with_etag(api, client):
+    response = client.get("/documents/supported-types")
+
+    assert response.status_code == 200
+    assert response.json()["supported_document_types"] == api.SUPPORTED_DOCUMENT_TYPES
+    assert response.headers["etag"] == api._SUPPORTED_TYPES_ETAG
+    assert response.headers["cache-control"] == f"private, max-age={api.SUPPORTED_TYPES_MAX_AGE}"
+
+
+def test_supported_types_revalidation_returns_304(client):
+    etag = client.get("/documents/supported-types").headers["etag"]
+
+    response = client.get("/documents/supported-types", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
@@ -0,0 +1,24 @@
+"""
+Pytest tests for the JSON disk cache.
+"""
+
+import os
+import time
+
+from model.utils.cache import DiskCache
+
+
+def test_make_key_separates_parts():
+    assert DiskCache.make_key("ab", "c") != DiskCache.make_key("a", "bc")
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = DiskCache(tmp_path, ttl=60)
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+
+    stale = time.time() - 120
+    os.utime(tmp_path / "key.json", (stale, stale))
+
+    assert cache.get("key", "missing") == "missing"
+    assert DiskCache(tmp_path).get("key") == {"value": 1}
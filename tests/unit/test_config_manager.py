@@ -0,0 +1,61 @@
+"""
+Pytest tests for the configuration manager.
+"""
+
+import pytest
+
+from model.config.config_manager import ConfigManager
+from model.config.default_config import DEFAULT_CONFIG
+
+
+@pytest.mark.parametrize("suffix", [".json", ".yaml"])
+def test_save_and_load_round_trip(tmp_path, suffix):
+    config_path = tmp_path / f"config{suffix}"
+    manager = ConfigManager()
+    manager.update_config({"classifier": {"confidence_threshold": 0.25}})
+    manager.save_config(config_path)
+
+    loaded = ConfigManager(config_path)
+
+    assert loaded.get_config() == manager.get_config()
+    assert loaded.get_config("classifier")["confidence_threshold"] == 0.25
+
+
+def test_update_config_merges_nested_sections_without_touching_defaults():
+    manager = ConfigManager()
+    manager.update_config({"classifier": {"confidence_threshold": 0.9}})
+
+    assert manager.get_config("classifier")["confidence_threshold"] == 0.9
+    assert "type" in manager.get_config("classifier")
+    assert ConfigManager().get_config("classifier") == DEFAULT_CONFIG["classifier"]
+    assert DEFAULT_CONFIG["classifier"].get("confidence_threshold") != 0.9
+
+
+def test_get_config_returns_live_read_only_view():
+    manager = ConfigManager()
+    config = manager.get_config()
+
+    with pytest.raises(TypeError):
+        config["classifier"] = {}
+    manager.update_config({"extractor": {"type": "rule"}})
+
+    assert config["extractor"]["type"] == "rule"
+    assert manager.get_config() is config
+
+    mutable = manager.get_mutable_copy()
+    mutable["extractor"]["type"] = "llm"
+    assert manager.get_config("extractor")["type"] == "rule"
+
+    manager.reset_to_defaults()
+    assert manager.get_config() == DEFAULT_CONFIG
+
+
+def test_update_config_does_not_alias_caller_dicts():
+    manager = ConfigManager()
+    update = {"custom": {"a": 1}}
+
+    manager.update_config(update)
+    manager.update_config({"custom": {"b": 2}})
+
+    assert update == {"custom": {"a": 1}}
+    assert manager.get_config()["custom"] == {"a": 1, "b": 2}
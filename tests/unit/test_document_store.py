@@ -0,0 +1,50 @@
+"""
+Pytest tests for the JSON document store.
+"""
+
+from model.utils.document_store import DocumentStore
+
+
+def test_get_analysis_is_served_from_cache(tmp_path):
+    store = DocumentStore(storage_dir=str(tmp_path))
+    document_id = store.store_analysis({"classification": {"type": "invoice"}})
+
+    first = store.get_analysis(document_id)
+
+    assert store.get_analysis(document_id) is first
+
+
+def test_cache_follows_changes_made_by_other_stores(tmp_path):
+    reader = DocumentStore(storage_dir=str(tmp_path))
+    writer = DocumentStore(storage_dir=str(tmp_path))
+    document_id = writer.store_analysis({"value": 1})
+    assert reader.get_analysis(document_id)["value"] == 1
+
+    writer.store_analysis({"value": 22}, document_id=document_id)
+    assert reader.get_analysis(document_id)["value"] == 22
+
+    assert writer.delete_analysis(document_id)
+    assert reader.get_analysis(document_id) is None
+    assert document_id not in reader._cache
+
+
+def test_store_and_delete_invalidate_cache(tmp_path):
+    store = DocumentStore(storage_dir=str(tmp_path))
+    document_id = store.store_analysis({"value": 1})
+    assert store.get_analysis(document_id)["value"] == 1
+
+    store.store_analysis({"value": 2}, document_id=document_id)
+    assert store.get_analysis(document_id)["value"] == 2
+
+    assert store.delete_analysis(document_id)
+    assert store.get_analysis(document_id) is None
+
+
+def test_cache_is_bounded(tmp_path):
+    store = DocumentStore(storage_dir=str(tmp_path), cache_size=2)
+    document_ids = [store.store_analysis({"value": i}) for i in range(3)]
+
+    for document_id in document_ids:
+        store.get_analysis(document_id)
+
+    assert list(store._cache) == document_ids[1:]
@@ -0,0 +1,55 @@
+"""
+Pytest tests for OpenAI Batch API job handling (no network access).
+"""
+
+import logging
+from types import SimpleNamespace
+
+import orjson
+
+from model.utils.openai_batch import run_batch_job
+
+
+class _FakeClient:
+    """Files and Batches API stub whose batch completes immediately."""
+
+    def __init__(self, files):
+        self._files = files
+        self.files = SimpleNamespace(
+            create=lambda file, purpose: SimpleNamespace(id="file-input"),
+            content=lambda file_id: SimpleNamespace(
+                text="\n".join(orjson.dumps(entry).decode() for entry in self._files[file_id])
+            )
+        )
+        self.batches = SimpleNamespace(create=lambda **kwargs: SimpleNamespace(
+            id="batch-1", status="completed",
+            output_file_id="file-output" if "file-output" in files else None,
+            error_file_id="file-error" if "file-error" in files else None
+        ))
+
+
+def test_failed_requests_are_read_from_the_error_file(caplog):
+    client = _FakeClient({
+        "file-output": [{"custom_id": "0", "response": {"status_code": 200, "body": {"ok": True}}}],
+        "file-error": [{
+            "custom_id": "1",
+            "response": {"status_code": 400, "body": {"error": {"message": "Unrecognized request argument"}}},
+            "error": None
+        }],
+    })
+
+    with caplog.at_level(logging.ERROR):
+        bodies = run_batch_job(client, {"0": {}, "1": {}}, "test")
+
+    assert bodies == {"0": {"ok": True}}
+    assert "Batch request 1 failed" in caplog.text
+    assert "Unrecognized request argument" in caplog.text
+
+
+def test_batch_without_output_file_still_logs_errors(caplog):
+    client = _FakeClient({"file-error": [{"custom_id": "0", "error": {"code": "invalid_request", "message": "bad"}}]})
+
+    with caplog.at_level(logging.ERROR):
+        assert run_batch_job(client, {"0": {}}, "test") == {}
+
+    assert "invalid_request" in caplog.text
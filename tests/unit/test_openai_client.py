@@ -0,0 +1,53 @@
+"""
+Pytest tests for the shared OpenAI client factory (no network access).
+"""
+
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import model
+from model.utils import openai_client
+
+
+def test_sync_client_is_shared_per_key():
+    openai_client.get_openai_client.cache_clear()
+
+    first = openai_client.get_openai_client("test-key")
+
+    assert openai_client.get_openai_client("test-key") is first
+    assert openai_client.get_openai_client("other-key") is not first
+    openai_client.get_openai_client.cache_clear()
+
+
+def test_http_client_uses_pooled_transport(monkeypatch):
+    fake_httpx = SimpleNamespace(
+        Limits=lambda **kwargs: kwargs,
+        HTTPTransport=lambda **kwargs: ("transport", kwargs),
+        Client=lambda transport: ("client", transport),
+    )
+    monkeypatch.setattr(openai_client, "httpx", fake_httpx)
+
+    kind, (_, options) = openai_client._create_http_client()
+
+    assert kind == "client"
+    assert options["limits"]["max_connections"] == options["limits"]["max_keepalive_connections"]
+    assert options["limits"]["keepalive_expiry"] == 60
+    assert options["retries"] == 2
+
+
+def test_http_client_falls_back_without_httpx(monkeypatch):
+    monkeypatch.setattr(openai_client, "httpx", None)
+
+    assert openai_client._create_http_client() is None
+    assert openai_client._create_async_http_client() is None
+
+
+def test_importing_the_package_does_not_import_openai():
+    src_dir = os.path.dirname(os.path.dirname(model.__file__))
+    code = "import sys, model; sys.exit('openai' in sys.modules)"
+
+    completed = subprocess.run([sys.executable, "-c", code], cwd=src_dir, capture_output=True)
+
+    assert completed.returncode == 0, completed.stderr.decode()
@@ -0,0 +1,50 @@
+"""
+Pytest tests for the token bucket rate limiter.
+"""
+
+import pytest
+
+from model.utils import rate_limiter
+from model.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock advanced by the limiter's sleeps."""
+    state = {"now": 0.0, "sleeps": []}
+
+    def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleep)
+    return state
+
+
+def test_burst_within_capacity_does_not_wait(clock):
+    limiter = RateLimiter(requests_per_minute=120)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert clock["sleeps"] == []
+
+
+def test_requests_beyond_capacity_are_spaced_out(clock):
+    limiter = RateLimiter(requests_per_minute=60)
+
+    waits = [limiter.acquire() for _ in range(3)]
+
+    assert waits == pytest.approx([0.0, 1.0, 1.0])
+
+
+def test_reservations_larger_than_capacity(clock):
+    limiter = RateLimiter(requests_per_minute=30)
+
+    limiter.acquire()
+    assert limiter.acquire(2) == pytest.approx(4.0)
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_minute=0)
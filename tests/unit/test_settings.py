@@ -0,0 +1,88 @@
+"""
+Pytest tests for YAML settings loading.
+"""
+
+import os
+
+import pytest
+
+from model.config.settings import Settings
+
+
+def test_parsed_config_is_reused_until_file_or_env_changes(tmp_path, monkeypatch):
+    from model.config import settings as settings_module
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("openai:\n  api_key: ${SETTINGS_TEST_KEY}\n")
+    monkeypatch.setenv("SETTINGS_TEST_KEY", "first")
+
+    first = Settings(config_path)
+    assert first.get("openai.api_key") == "first"
+    with monkeypatch.context() as patch:
+        patch.setattr(settings_module.yaml, "load", lambda *args, **kwargs: pytest.fail("config re-parsed"))
+        assert Settings(config_path).get("openai.api_key") == "first"
+
+    monkeypatch.setenv("SETTINGS_TEST_KEY", "second")
+    assert Settings(config_path).get("openai.api_key") == "second"
+
+    config_path.write_text("openai:\n  api_key: literal-key\n")
+    stat_result = config_path.stat()
+    os.utime(config_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+    assert Settings(config_path).get("openai.api_key") == "literal-key"
+
+
+def test_get_memoizes_lookups_and_keeps_defaults(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm:\n  timeout: 30\n  model_name: null\n")
+    settings = Settings(config_path)
+
+    assert settings.get("llm.timeout") == 30
+    assert settings.get("llm.missing", "fallback") == "fallback"
+    assert settings.get("llm.missing") is None
+    assert settings.get("llm.model_name", "default") is None
+    assert settings.get("llm.timeout.nested", 5) == 5
+    assert set(settings._get_cache) == {"llm.timeout", "llm.missing", "llm.model_name", "llm.timeout.nested"}
+
+
+def test_init_settings_replaces_global_instance(tmp_path, monkeypatch):
+    from model.config import settings as settings_module
+
+    monkeypatch.setattr(settings_module, "_settings", None)
+    settings_module.get_settings.cache_clear()
+    default = settings_module.get_settings()
+    assert settings_module.get_settings() is default
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm:\n  timeout: 5\n")
+    initialized = settings_module.init_settings(config_path)
+
+    assert settings_module.get_settings() is initialized
+    assert settings_module.get_settings().get("llm.timeout") == 5
+    monkeypatch.setattr(settings_module, "_settings", None)
+    settings_module.get_settings.cache_clear()
+
+
+def test_get_path_resolves_against_project_root(tmp_path, monkeypatch):
+    from model.config.settings import PROJECT_ROOT
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"cache:\n  dir: ./.cache\nprocessing:\n  temp_dir: {tmp_path}\n")
+    settings = Settings(config_path)
+    monkeypatch.chdir(tmp_path)
+
+    assert settings.get_path("cache.dir", ".cache") == PROJECT_ROOT / ".cache"
+    assert settings.get_path("processing.temp_dir", "temp") == tmp_path
+    assert settings.get_path("missing.dir", "fallback") == PROJECT_ROOT / "fallback"
+
+
+def test_instances_do_not_share_nested_sections(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm:\n  timeout: 30\n")
+    first = Settings(config_path)
+
+    first._config_data["llm"]["timeout"] = 1
+    first.to_dict()["llm"]["timeout"] = 2
+    second = Settings(config_path)
+
+    assert second.get("llm.timeout") == 30
+    assert first.to_dict()["llm"]["timeout"] == 1
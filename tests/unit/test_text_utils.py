@@ -0,0 +1,90 @@
+"""
+Pytest tests for text utility functions.
+"""
+
+import pytest
+
+from model.utils import text_utils
+
+
+@pytest.mark.parametrize("text1, text2, expected", [
+    ("invoice", "invoice", 1.0),
+    ("", "", 1.0),
+    ("abc", "", 0.0),
+    ("kitten", "sitting", 1 - 3 / 7),
+])
+def test_calculate_text_similarity(text1, text2, expected):
+    assert text_utils.calculate_text_similarity(text1, text2) == pytest.approx(expected)
+
+
+def test_python_fallback_matches_expected_distance(monkeypatch):
+    monkeypatch.setattr(text_utils, "_rf_levenshtein", None)
+    monkeypatch.setattr(text_utils, "editdistance", None)
+    monkeypatch.setattr(text_utils, "_levenshtein_kernel", None)
+
+    assert text_utils._levenshtein_distance("flaw", "lawn") == 2
+    assert text_utils.calculate_text_similarity("kitten", "sitting") == pytest.approx(1 - 3 / 7)
+
+
+@pytest.mark.parametrize("text1, text2, expected", [
+    ("kitten", "sitting", 3),
+    ("", "abc", 3),
+    ("naïve", "naive", 1),
+])
+def test_wagner_fischer_kernel(text1, text2, expected):
+    distance = text_utils._wagner_fischer(text_utils._code_points(text1), text_utils._code_points(text2))
+
+    assert distance == expected
+
+
+def test_calculate_similarity_matrix_shape():
+    matrix = text_utils.calculate_similarity_matrix(["abc", "abd"], ["abc", "xyz", "ab"])
+
+    assert len(matrix) == 2 and all(len(row) == 3 for row in matrix)
+    assert matrix[0][0] == pytest.approx(1.0)
+
+
+def test_preprocess_text_flags():
+    text = "Invoice #42:  Total DUE, $1,200!"
+
+    assert text_utils.preprocess_text(text) == "invoice #42: total due, $1,200!"
+    assert text_utils.preprocess_text(text, remove_numbers=True) == "invoice #: total due, $,!"
+    assert text_utils.preprocess_text(text, remove_punctuation=True) == "invoice 42 total due 1200"
+    assert text_utils.preprocess_text(text, remove_numbers=True, remove_punctuation=True) == "invoice total due"
+
+
+def test_sentence_and_paragraph_splitting():
+    text = "First sentence. Second one!  Third?\n\nNew paragraph here.\n   \nLast."
+
+    assert text_utils.extract_sentences("One. Two! Three?") == ["One.", "Two!", "Three?"]
+    assert text_utils.extract_paragraphs(text) == [
+        "First sentence. Second one!  Third?", "New paragraph here.", "Last."
+    ]
+
+
+def test_whitespace_and_special_characters():
+    assert text_utils.clean_whitespace("  a \t b\n\nc ") == "a b c"
+    assert text_utils.normalize_text("  Hello\tWORLD ") == "hello world"
+    assert text_utils.remove_special_characters("a-b c!") == "ab c"
+    assert text_utils.remove_special_characters("a-b c!", keep_spaces=False) == "abc"
+
+
+def test_extract_keywords_orders_by_frequency():
+    text = "Payment due. The payment terms: payment within 30 days; invoice due."
+
+    assert text_utils.extract_keywords(text, max_keywords=2) == ["payment", "due"]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", []),
+    ("No terminator", ["No terminator"]),
+    ("Pi is 3.14 today. Done.", ["Pi is 3.14 today.", "Done."]),
+    ("Wait...  What?!\nYes", ["Wait...", "What?!", "Yes"]),
+])
+def test_extract_sentences_edge_cases(text, expected):
+    assert text_utils.extract_sentences(text) == expected
+
+
+def test_extract_paragraphs_single_line():
+    assert text_utils.extract_paragraphs("  one line  ") == ["one line"]
+    assert text_utils.extract_paragraphs("   ") == []
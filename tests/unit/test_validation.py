@@ -0,0 +1,80 @@
+"""
+Pytest tests for validation utility functions.
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from model.types import DocumentType, ExtractedMetadata
+from model.utils import validation
+
+
+def _metadata(**kwargs):
+    return ExtractedMetadata(
+        document_type=DocumentType.INVOICE,
+        confidence_score=0.9,
+        extraction_date=datetime(2024, 1, 1),
+        **kwargs
+    )
+
+
+def test_validate_document_path_missing(tmp_path):
+    missing = tmp_path / "missing.pdf"
+
+    assert validation.validate_document_path(missing) == [f"File does not exist: {missing}"]
+
+
+def test_validate_document_path_checks(tmp_path):
+    empty_text = tmp_path / "notes.txt"
+    empty_text.write_bytes(b"")
+
+    errors = validation.validate_document_path(str(empty_text))
+
+    assert errors == [f"File is not a PDF: {empty_text}", f"File is empty: {empty_text}"]
+    assert validation.validate_document_path(tmp_path)[0] == f"Path is not a file: {tmp_path}"
+
+
+def test_validate_document_path_revalidates_modified_file(tmp_path):
+    document = tmp_path / "doc.PDF"
+    document.write_bytes(b"")
+    assert validation.validate_document_path(document) == [f"File is empty: {document}"]
+
+    document.write_bytes(b"%PDF-1.4")
+    stat_result = document.stat()
+    os.utime(document, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    assert validation.validate_document_path(document) == []
+
+
+@pytest.mark.parametrize("currency, valid", [("USD", True), ("JPY", True), ("usd", False), ("XYZ", False)])
+def test_validate_metadata_currency(currency, valid):
+    errors = validation.validate_metadata(_metadata(currency=currency))
+
+    assert errors == ([] if valid else [f"Invalid currency: {currency}"])
+
+
+def test_validate_extraction_result_missing_fields():
+    errors = validation.validate_extraction_result({"processing_time": 0.1})
+
+    assert errors == [
+        "Missing required field: metadata",
+        "Missing required field: extraction_method",
+    ]
+
+
+def test_validate_metadata_future_date_uses_reference_time():
+    metadata = _metadata(document_date=datetime(2024, 6, 1))
+
+    assert validation.validate_metadata(metadata, now=datetime(2024, 7, 1)) == []
+    assert validation.validate_metadata(metadata, now=datetime(2024, 5, 1)) == [
+        "Document date cannot be in the future"
+    ]
+
+
+def test_validate_classification_result_missing_fields():
+    assert validation.validate_classification_result({}) == [
+        "Missing required field: document_type",
+        "Missing required field: confidence_score",
+    ]